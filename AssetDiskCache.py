@@ -0,0 +1,224 @@
+# AssetDiskCache.py
+"""
+On-disk cache of decoded assets, so a boot with unchanged assets does no
+PNG decoding at all.
+
+Each entry is one raw RGBA buffer with a small header, stored per HMI
+version and variant -- a resolution profile, or "<profile>@<w>x<h>" for an
+image shown at a fixed (design) size such as an icon:
+
+    cache/assets/<hmi version>-f<format>/<variant>/<name>-<path hash>.rgba
+
+    header  magic "ALTI", format version, width (u32), height (u32),
+            source mtime_ns (u64), source size (u64), source sha1
+    body    width * height * 4 bytes RGBA
+
+load() memory-maps the file and wraps the mapping in a read-only PIL
+image without copying. An entry is valid while the source file keeps its
+mtime/size; if only the mtime changed (file copied back in place) the
+sha1 decides. Directories of other HMI versions are removed on start.
+
+Assets are designed at DESIGN_RES; variants for the other HMISizePos
+profiles are scaled once when built -- by the AssetPreloader at boot for
+the active profile, or ahead of time for all of them:
+
+    python AssetDiskCache.py [profile ...]      # default: all profiles
+"""
+import hashlib
+import mmap
+import os
+import shutil
+import struct
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from PIL import Image
+
+from FileStore import FileStore, atomic_write_bytes
+from SingletonBase import SingletonBase
+from hmi_consts import ASSET_CACHE_DIR, ASSETS_DIR, HMISizePos, __version__
+
+CACHE_FORMAT_VERSION = 1
+CACHE_MAGIC = b"ALTI"
+DESIGN_RES = "1280x800"
+
+_HEADER = struct.Struct("<4sB3xIIQQ20s")
+
+
+def _sha1_file(path: str) -> bytes:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def variant_name(profile: str, size=None) -> str:
+    """Cache directory for profile, or for a fixed design size at profile."""
+    if size is None:
+        return profile
+    return f"{profile}@{int(size[0])}x{int(size[1])}"
+
+
+def scaled_size(size, profile: str):
+    """Size of an asset designed at DESIGN_RES when shown at profile."""
+    design_w, design_h = HMISizePos.profile_size(DESIGN_RES)
+    w, h = HMISizePos.profile_size(profile)
+    return (
+        max(1, round(size[0] * w / design_w)),
+        max(1, round(size[1] * h / design_h)),
+    )
+
+
+def encode_entry(img: Image.Image, source: str, sha1: Optional[bytes] = None) -> bytes:
+    st = os.stat(source)
+    if sha1 is None:
+        sha1 = _sha1_file(source)
+    header = _HEADER.pack(
+        CACHE_MAGIC,
+        CACHE_FORMAT_VERSION,
+        img.width,
+        img.height,
+        st.st_mtime_ns,
+        st.st_size,
+        sha1,
+    )
+    return header + img.convert("RGBA").tobytes()
+
+
+class AssetDiskCache(SingletonBase):
+    def __init_once__(self, root=ASSET_CACHE_DIR):
+        self._root = str(root)
+        self._dir = os.path.join(
+            self._root, f"{__version__}-f{CACHE_FORMAT_VERSION}"
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._purge_other_versions()
+
+    # ---- public API ----
+    def entry_path(self, source: str, profile: str = DESIGN_RES, size=None) -> str:
+        source = os.path.abspath(source)
+        stem = os.path.splitext(os.path.basename(source))[0]
+        tag = hashlib.sha1(source.encode("utf-8")).hexdigest()[:8]
+        return os.path.join(
+            self._dir, variant_name(profile, size), f"{stem}-{tag}.rgba"
+        )
+
+    def load(
+        self, source: str, profile: str = DESIGN_RES, size=None
+    ) -> Optional[Image.Image]:
+        """Cached RGBA image for source at profile (and design size), or None
+        if missing/stale."""
+        path = self.entry_path(source, profile, size)
+        try:
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return None
+
+        img = self._image_from(mm, source)
+        if img is None:
+            mm.close()
+            self._count(hit=False)
+            return None
+        self._count(hit=True)
+        return img
+
+    def store(
+        self, source: str, img: Image.Image, profile: str = DESIGN_RES, size=None
+    ) -> None:
+        """Queue a write of img (already scaled) for source."""
+        try:
+            data = encode_entry(img, source)
+        except OSError as e:
+            print(f"[AssetDiskCache] {os.path.basename(source)}: {e}")
+            return
+        path = self.entry_path(source, profile, size)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        FileStore.Instance().write_bytes(path, data)
+        with self._lock:
+            self.writes += 1
+
+    def build(self, sources: Iterable[str], profiles: Iterable[str]) -> int:
+        """Decode each source once and write every profile variant now."""
+        profiles = list(profiles)
+        written = 0
+        for source in sources:
+            if all(self.load(source, p) is not None for p in profiles):
+                continue
+            sha1 = _sha1_file(source)
+            with Image.open(source) as f:
+                img = f.convert("RGBA")
+            for profile in profiles:
+                variant = img
+                size = scaled_size(img.size, profile)
+                if size != img.size:
+                    variant = img.resize(size, Image.LANCZOS)
+                path = self.entry_path(source, profile)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                atomic_write_bytes(path, encode_entry(variant, source, sha1))
+                written += 1
+        return written
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+    # ---- internals ----
+    def _image_from(self, mm: mmap.mmap, source: str) -> Optional[Image.Image]:
+        if len(mm) < _HEADER.size:
+            return None
+        magic, version, width, height, mtime_ns, size, sha1 = _HEADER.unpack_from(mm, 0)
+        if magic != CACHE_MAGIC or version != CACHE_FORMAT_VERSION:
+            return None
+        if len(mm) != _HEADER.size + width * height * 4:
+            return None
+
+        try:
+            st = os.stat(source)
+        except OSError:
+            return None
+        if (st.st_mtime_ns, st.st_size) != (mtime_ns, size):
+            if st.st_size != size or _sha1_file(source) != sha1:
+                return None
+
+        # Zero-copy: the image keeps the mapping alive and is read-only
+        return Image.frombuffer(
+            "RGBA", (width, height), memoryview(mm)[_HEADER.size:], "raw", "RGBA", 0, 1
+        )
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _purge_other_versions(self) -> None:
+        try:
+            names = os.listdir(self._root)
+        except OSError:
+            return
+        current = os.path.basename(self._dir)
+        for name in names:
+            if name != current:
+                shutil.rmtree(os.path.join(self._root, name), ignore_errors=True)
+
+
+def _asset_files() -> List[str]:
+    return sorted(
+        os.path.join(ASSETS_DIR, name)
+        for name in os.listdir(ASSETS_DIR)
+        if name.lower().endswith(".png")
+    )
+
+
+if __name__ == "__main__":
+    profiles = sys.argv[1:] or list(HMISizePos.profiles())
+    count = AssetDiskCache.Instance().build(_asset_files(), profiles)
+    print(f"[AssetDiskCache] {count} entries written for {', '.join(profiles)}")
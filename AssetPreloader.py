@@ -0,0 +1,147 @@
+# AssetPreloader.py
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from RenderCache import RenderCache
+from SingletonBase import SingletonBase
+from hmi_consts import ASSETS_DIR
+
+PRELOAD_WORKERS = 2
+
+# Fixed design sizes the UI shows these assets at; preloaded as such
+MEAL_PHOTO_SIZE = (270, 200)  # StartCookingConfirmation overlay
+BANNER_ICON_SIZE = (48, 48)  # door / communication banners
+ZONE_ICON_SIZE = (24, 24)
+
+# Decoded after the page images, in this order: meal photos, then icons.
+# A (name, size) entry is decoded at that design size.
+PRELOAD_ASSETS = [
+    ("Reheat.png", MEAL_PHOTO_SIZE),
+    ("food.png", MEAL_PHOTO_SIZE),
+    ("drawer.png", BANNER_ICON_SIZE),
+    ("lost_comm.png", BANNER_ICON_SIZE),
+    ("broken_lock.png", BANNER_ICON_SIZE),
+    *((f"Zone{i}.png", ZONE_ICON_SIZE) for i in range(1, 9)),
+    "pencil48.png",
+    "logo.png",
+    "over_temp.png",
+]
+
+# a path, or (path, design size)
+PreloadItem = Union[str, Tuple[str, Tuple[int, int]]]
+
+
+def asset_path(name: str) -> str:
+    return os.path.join(ASSETS_DIR, name)
+
+
+def preload_item(entry) -> PreloadItem:
+    """A PRELOAD_ASSETS entry with its name turned into an asset path."""
+    if isinstance(entry, tuple):
+        return asset_path(entry[0]), tuple(entry[1])
+    return asset_path(entry)
+
+
+class AssetPreloader(SingletonBase):
+    """
+    Decodes PNG assets into the RenderCache on worker threads at startup,
+    in the order given (home page first, then the pages a cook walks
+    through, then meal photos and icons), so the first visit to a page
+    costs the same as a later one. Each is loaded as the variant the UI
+    shows -- the active HMISizePos profile, at a fixed design size where
+    one is given -- which writes it to the AssetDiskCache if it wasn't
+    there, so later boots map it without decoding or scaling.
+
+    Pillow releases the GIL while decoding, so PRELOAD_WORKERS threads
+    decode in parallel with the UI thread. If the UI asks for an image a
+    worker is still decoding, RenderCache.base_image() waits for that
+    decode rather than starting a second one.
+    """
+
+    def __init_once__(self, workers: int = PRELOAD_WORKERS):
+        self._workers = max(1, int(workers))
+        self._lock = threading.Lock()
+        self._queue: deque = deque()
+        self._active = 0
+        self._done = threading.Event()
+        self._done.set()
+        self._started_at = 0.0
+        self.loaded = 0
+        self.failed = 0
+        self.elapsed_s = 0.0
+
+    # ---- public API ----
+    def start(self, items: Iterable[PreloadItem]) -> None:
+        """Queue paths / (path, size) items (highest priority first) and
+        start the workers."""
+        cache = RenderCache.Instance()
+        with self._lock:
+            queued = set(self._queue)
+            for item in items:
+                path, size = item if isinstance(item, tuple) else (item, None)
+                item = (str(path), None if size is None else tuple(size))
+                if item in queued or cache.has_base_image(item[0], size=item[1]):
+                    continue
+                self._queue.append(item)
+                queued.add(item)
+
+            if not self._queue or self._active:
+                return
+
+            self._done.clear()
+            self._started_at = time.monotonic()
+            self._active = self._workers
+            for i in range(self._workers):
+                threading.Thread(
+                    target=self._run, daemon=True, name=f"AssetPreload-{i}"
+                ).start()
+
+    def stop(self) -> None:
+        """Drop whatever is still queued; decodes in progress finish."""
+        with self._lock:
+            self._queue.clear()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "loaded": self.loaded,
+                "failed": self.failed,
+                "queued": len(self._queue),
+                "elapsed_ms": self.elapsed_s * 1000.0,
+            }
+
+    # ---- internals ----
+    def _run(self) -> None:
+        cache = RenderCache.Instance()
+        while True:
+            with self._lock:
+                if not self._queue:
+                    break
+                path, size = self._queue.popleft()
+            try:
+                cache.base_image(path, size=size)
+                ok = True
+            except Exception as e:
+                print(f"[AssetPreloader] {os.path.basename(path)}: {e}")
+                ok = False
+            with self._lock:
+                if ok:
+                    self.loaded += 1
+                else:
+                    self.failed += 1
+
+        with self._lock:
+            self._active -= 1
+            if not self._active:
+                self.elapsed_s = time.monotonic() - self._started_at
+                print(
+                    f"[AssetPreloader] {self.loaded} assets decoded in "
+                    f"{self.elapsed_s * 1000:.0f} ms ({self.failed} failed)"
+                )
+                self._done.set()
@@ -9,21 +9,18 @@ from PIL import Image
 
 from DoorSafety import DoorSafety
 from hmi_consts import ASSETS_DIR, HMIColors
-from hmi_consts import SETTINGS_DIR
-import os
-import json
 
 from CircularProgress_admin import CircularProgress_admin
 from SerialService import SerialService
 from MessageBoxPage import showerror
 from Settings import Settings
+from TemperatureControl import TELEMETRY_POLL_INTERVAL_S
 import oven_state
 import logging
 
 logger = logging.getLogger(__name__)
 
 PERIODIC_THERMISTOR = True
-PERIODIC_INTRERVAL_MS = 1000
 WDT_TIMEOUT_MS = 7000
 WDT_STARTUP_DELAY_MS = 10000
 
@@ -48,43 +45,11 @@ class CircularProgressPage_admin(ctk.CTkFrame):
         self._running = False
         self._on_stop = None
 
-        # Cached alarm level (loaded on_show)
-        self._alarm_level: int = 1500
-        self._alarm_hysteresis: int = 400
-        self._inAlarmState: bool | None = False
-        self._prevAlarmState: bool | None = None
-
         self._isManualCookMode: bool = False
         self._powerLevel: int | None = None
-        self._over_temp_power: float = 0.75
         self._enable_array_temp_control: bool = False
         self.enable_cook_algorithm: bool = False
 
-        # Cookpack temperature control state
-        self.tset: float = 0.0
-        self.thys: float = 0.0
-        self.top_zones_correction_factor: float = 100.0
-        self.bottom_zones_correction_factor: float = 100.0
-        self.tc: float = 0.0
-
-        self._ir_temps: dict[int, float] = {}
-        self._cookpack_control_active: bool = False
-        self._cookpack_started: bool = False
-        self._cookpack_tc_remaining: float = 0.0
-        self._cookpack_last_tick_time: float | None = None
-        self._cookpack_finished: bool = False
-
-        # Actual running percentages currently being commanded
-        self._cookpack_top_running_pct: float = 100.0
-        self._cookpack_bottom_running_pct: float = 100.0
-
-        # --- NEW: completely independent 1-second periodic timer ------------
-        self._periodic_callback = None
-        self._periodic_after_id = None
-        if PERIODIC_THERMISTOR:
-            self._start_periodic_timer()
-        self.bind("<Destroy>", lambda e: self._cancel_periodic_timer())
-
         # Layout for 800x480
         self.grid_rowconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=0)
@@ -283,7 +248,14 @@ class CircularProgressPage_admin(ctk.CTkFrame):
             self.oven_ctrl_serial.add_listener(self._on_serial_line)
             print("have oven_ctrl_serial")
 
-        self.set_periodic_callback(self.on_read_controller_thermistors)
+        # R / T1..T4 are polled by the controller's temperature control
+        # (TELEMETRY_POLL_INTERVAL_S); this page only shows the replies
+
+        # Over-temp / cookpack status published by the temperature control
+        try:
+            self.controller.temperature_control.add_listener(self._on_control_status)
+        except Exception as e:
+            print(f"[CircularProgressPage] control status listener failed: {e}")
 
         self._wdt_after_id = None
         self._wdt_timeout_ms = WDT_TIMEOUT_MS
@@ -302,35 +274,20 @@ class CircularProgressPage_admin(ctk.CTkFrame):
         self._time_power_page = time_power_page
         self._powerLevel = powerLevel
 
-        self._prevAlarmState = None
-        self._inAlarmState = None
-
-        self._alarm_level, self._alarm_hysteresis = (
-            self._load_alarm_levels_from_settings()
-        )
-        self._over_temp_power = self._load_over_temp_power_from_settings(default=0.75)
-        self._enable_array_temp_control = (
-            self._load_enable_array_temp_control_from_settings(default=False)
-        )
-
         s = Settings.Instance()
-        s.load()
-        self.tset = float(s.tset)
-        self.thys = float(s.thys)
-        self.top_zones_correction_factor = float(s.top_zones_correction_factor)
-        self.bottom_zones_correction_factor = float(s.bottom_zones_correction_factor)
-        self.tc = float(s.tc)
+        self._enable_array_temp_control = bool(s.enable_array_temp_control)
         self.enable_cook_algorithm = bool(s.enable_cook_algorithm)
 
-        self._cookpack_reset_state()
-
+        cookpack = "OFF"
+        if self.enable_cook_algorithm:
+            cookpack = f"ON ({s.cookpack_control_strategy})"
         self._algo_status_var.set(
             f"Array Temp Ctrl: {'ON' if self._enable_array_temp_control else 'OFF'}, "
-            f"Cookpack Temp Ctrl: {'ON' if self.enable_cook_algorithm else 'OFF'}"
+            f"Cookpack Temp Ctrl: {cookpack}"
         )
 
         self.set_overtemp_visible(False)
-        self._update_cookpack_display()
+        self._update_cookpack_display(None)
 
         if self._isManualCookMode:
             self.set_power_display(int(self._powerLevel) if self._powerLevel else None)
@@ -353,47 +310,6 @@ class CircularProgressPage_admin(ctk.CTkFrame):
                 "Power: N/A" if self._isManualCookMode else "Scale: N/A"
             )
 
-    # ---------------------- Helper: settings -------------------------------
-
-    def _load_alarm_levels_from_settings(
-        self, defaultAlarmLevel: int = 1500, defaultHysteresis: int = 400
-    ) -> tuple[int, int]:
-        path = os.path.join(SETTINGS_DIR, "settings.alt")
-        try:
-            if os.path.exists(path):
-                with open(path, "r") as f:
-                    data = json.load(f)
-                    return int(data.get("alarm_level", defaultAlarmLevel)), int(
-                        data.get("alarm_hysteresis", defaultHysteresis)
-                    )
-        except Exception:
-            pass
-        return defaultAlarmLevel, defaultHysteresis
-
-    def _load_over_temp_power_from_settings(self, default: float = 0.75) -> float:
-        path = os.path.join(SETTINGS_DIR, "settings.alt")
-        try:
-            if os.path.exists(path):
-                with open(path, "r") as f:
-                    data = json.load(f)
-                    return float(data.get("over_temp_power", default))
-        except Exception:
-            pass
-        return default
-
-    def _load_enable_array_temp_control_from_settings(
-        self, default: bool = False
-    ) -> bool:
-        path = os.path.join(SETTINGS_DIR, "settings.alt")
-        try:
-            if os.path.exists(path):
-                with open(path, "r") as f:
-                    data = json.load(f)
-                    return bool(data.get("enable_array_temp_control", default))
-        except Exception:
-            pass
-        return default
-
     # ---------------------- Helpers: UI / stop -----------------------------
 
     def set_overtemp_visible(self, show: bool):
@@ -403,16 +319,14 @@ class CircularProgressPage_admin(ctk.CTkFrame):
             else:
                 self._overtemp_lbl.place_forget()
 
-    def _update_cookpack_display(self) -> None:
-        if self.enable_cook_algorithm:
-            self._cookpack_tset_var.set(f"TSET: {self.tset:.1f}C")
-            self._cookpack_thys_var.set(f"THYS: {self.thys:.1f}C")
-            self._cookpack_tc_var.set(f"tC: {self._cookpack_tc_remaining:.1f}s")
-            self._cookpack_top_var.set(
-                f"Top Running: {self._cookpack_top_running_pct:.0f}%"
-            )
+    def _update_cookpack_display(self, cookpack: dict | None) -> None:
+        if self.enable_cook_algorithm and cookpack:
+            self._cookpack_tset_var.set(f"TSET: {cookpack['tset']:.1f}C")
+            self._cookpack_thys_var.set(f"THYS: {cookpack['thys']:.1f}C")
+            self._cookpack_tc_var.set(f"tC: {cookpack['tc_remaining']:.1f}s")
+            self._cookpack_top_var.set(f"Top Running: {cookpack['top_pct']:.0f}%")
             self._cookpack_bottom_var.set(
-                f"Bottom Running: {self._cookpack_bottom_running_pct:.0f}%"
+                f"Bottom Running: {cookpack['bottom_pct']:.0f}%"
             )
         else:
             self._cookpack_tset_var.set("")
@@ -421,6 +335,27 @@ class CircularProgressPage_admin(ctk.CTkFrame):
             self._cookpack_top_var.set("")
             self._cookpack_bottom_var.set("")
 
+    def _on_control_status(self, status: dict) -> None:
+        """TemperatureController status (UI thread)."""
+        try:
+            over_temp = status.get("array_over_temp")
+            if over_temp:
+                self.set_overtemp_visible(bool(over_temp["overtemp"]))
+                scale = float(over_temp["global_scale"])
+                if self._isManualCookMode:
+                    base = self._powerLevel if self._powerLevel is not None else 100
+                    self.set_power_display(int(scale * base))
+                else:
+                    self.set_power_display(int(scale * 100))
+
+            cookpack = None
+            for name in status.get("strategies", []):
+                if "tc_remaining" in status.get(name, {}):
+                    cookpack = status[name]
+            self._update_cookpack_display(cookpack)
+        except Exception as e:
+            print(f"[CircularProgressPage] control status update failed: {e}")
+
     def start(self, start_seconds: float, on_stop=None):
         self.total_time = max(0.0, float(start_seconds))
         self.remaining_time = self.total_time
@@ -455,6 +390,10 @@ class CircularProgressPage_admin(ctk.CTkFrame):
             print(f"[CircularProgressPage] Failed to navigate HomePage: {e}")
 
     def _stop_manager(self):
+        try:
+            self.controller.stop_temperature_control()
+        except Exception as e:
+            print(f"[CircularProgressPage] stop temperature control failed: {e}")
         try:
             mgr = (self.shared_data or {}).get("sequence_manager")
             if mgr:
@@ -462,6 +401,8 @@ class CircularProgressPage_admin(ctk.CTkFrame):
                     mgr.stop_all()
                 elif hasattr(mgr, "request_stop"):
                     mgr.request_stop()
+                if hasattr(self.controller, "release_sequence_manager"):
+                    self.controller.release_sequence_manager(mgr)
         except Exception as e:
             print(f"[CircularProgressPage] stop manager failed: {e}")
 
@@ -495,56 +436,10 @@ class CircularProgressPage_admin(ctk.CTkFrame):
             except Exception:
                 pass
 
-    # ===================== Periodic controller poll =========================
-
-    def set_periodic_callback(self, callback):
-        self._periodic_callback = callback
-
-    def _start_periodic_timer(self):
-        self._periodic_tick()
-
-    def _periodic_tick(self):
-        if self._periodic_callback is not None:
-            try:
-                self._periodic_callback()
-            except Exception as e:
-                print(f"[CircularProgressPage] periodic callback failed: {e}")
-        try:
-            self._periodic_after_id = self.after(
-                PERIODIC_INTRERVAL_MS, self._periodic_tick
-            )
-        except Exception:
-            self._periodic_after_id = None
-
-    def _cancel_periodic_timer(self):
-        if self._periodic_after_id is not None:
-            try:
-                self.after_cancel(self._periodic_after_id)
-            except Exception:
-                pass
-            self._periodic_after_id = None
-
     from StopWatch import Stopwatch
 
-    _sw = Stopwatch()
     _sw1 = Stopwatch()
 
-    def on_read_controller_thermistors(self):
-        try:
-            self._sw.stop()
-            if self._sw.elapsed_ms() > (PERIODIC_INTRERVAL_MS * 1.25):
-                s = f"[on_read_controller_thermistors] = {self._sw.elapsed_ms():.3f}"
-                logger.info(s)
-                print(s)
-            self._sw.reset()
-            self._sw.start()
-
-            self.controller.serial_get_thermistor()
-            for sendorId in range(1, 5):
-                self.controller.serial_get_IR_temp(sendorId)
-        except Exception:
-            pass
-
     # ===================== Watchdog Timer ===================================
 
     def _kick_watchdog(self):
@@ -569,140 +464,14 @@ class CircularProgressPage_admin(ctk.CTkFrame):
         except Exception as e:
             print(f"[CircularProgressPage] Failed to show error: {e}")
 
-    # ===================== Existing array-temp helpers =======================
-
-    def _set_power_if_running(self, pct: float) -> None:
-        with oven_state.lock:
-            if (
-                oven_state.is_running
-                and getattr(self, "_time_power_page", None) is not None
-            ):
-                self._time_power_page.set_power_to_percent_of_set_value(pct)
-
-    def _set_manual_top_bottom_power_if_running(
-        self, top_pct: float, bottom_pct: float
-    ) -> None:
-        with oven_state.lock:
-            if (
-                oven_state.is_running
-                and getattr(self, "_time_power_page", None) is not None
-            ):
-                self._time_power_page.set_top_bottom_power_to_percent_of_set_value(
-                    top_pct, bottom_pct
-                )
-
-    def _set_program_scale(self, scale: float) -> None:
-        try:
-            mgr = (self.shared_data or {}).get("sequence_manager")
-            if mgr and hasattr(mgr, "set_power_scale"):
-                mgr.set_power_scale(max(0.0, min(1.0, float(scale))))
-        except Exception as e:
-            print(f"[CircularProgressPage] set_program_scale failed: {e}")
-
-    def _set_program_scale_for_arrays(
-        self, scale: float, arrays: list[int] | tuple[int, ...]
-    ) -> None:
-        """
-        Program-run throttle for only selected arrays/zones.
-
-        scale:
-            0.0 .. 1.0
-
-        arrays:
-            iterable of zone numbers, e.g. [1,2,3,4] or [5,6,7,8]
-        """
-
-        try:
-            mgr = (self.shared_data or {}).get("sequence_manager")
-            if mgr is None:
-                return
-
-            scale = max(0.0, min(1.0, float(scale)))
-            arrays = [int(a) for a in arrays]
-
-            if hasattr(mgr, "set_zone_scale"):
-                for zone in arrays:
-                    mgr.set_zone_scale(zone, scale)
-                return
-
-            if hasattr(mgr, "set_array_scale"):
-                for zone in arrays:
-                    mgr.set_array_scale(zone, scale)
-                return
-
-            if hasattr(mgr, "set_selected_zone_scale"):
-                mgr.set_selected_zone_scale(arrays, scale)
-                return
-
-            if hasattr(mgr, "set_selected_array_scale"):
-                mgr.set_selected_array_scale(arrays, scale)
-                return
-
-            logger.info(
-                "[CircularProgressPage] set_program_scale_for_arrays failed: "
-                "no supported per-array scaling API found"
-            )
-
-        except Exception as e:
-            print(f"[CircularProgressPage] set_program_scale_for_arrays failed: {e}")
-
-    # ===================== Cookpack temp control helpers ====================
-
-    def _cookpack_reset_state(self) -> None:
-        self._ir_temps = {}
-        self._cookpack_control_active = False
-        self._cookpack_started = False
-        self._cookpack_tc_remaining = float(self.tc)
-        self._cookpack_last_tick_time = None
-        self._cookpack_finished = False
-        self._cookpack_top_running_pct = 100.0
-        self._cookpack_bottom_running_pct = 100.0
-        self._update_cookpack_display()
-
-    def _parse_temp_value(self, line: str) -> float | None:
-        """
-        Returns the first numeric value from strings like:
-        T1 = 54.3
-        T1=54.3
-        T1 54.3
-        50.0,0.0
-        T1=50.0,0.0
-        """
-        try:
-            s = line.strip()
-
-            if "=" in s:
-                s = s.split("=", 1)[1].strip()
-            elif s.startswith("T") and len(s) > 2 and s[1].isdigit():
-                s = s[2:].strip()
-
-            first_value = s.split(",", 1)[0].strip()
-            return float(first_value)
-
-        except Exception:
-            return None
-
-    def _get_t0(self) -> float | None:
-        t1 = self._ir_temps.get(1)
-        t2 = self._ir_temps.get(2)
-        if t1 is None or t2 is None:
-            return None
-        return (t1 + t2) / 2.0
-
-    def _finish_cookpack_cycle(self) -> None:
-        if self._cookpack_finished:
-            return
-        self._cookpack_finished = True
-        self._cookpack_tc_remaining = 0.0
-
-        # Restore display values to 100% before shutdown
-        self._cookpack_top_running_pct = 100.0
-        self._cookpack_bottom_running_pct = 100.0
-        self._update_cookpack_display()
+    # ===================== Cookpack end of cycle ============================
 
+    def finish_cook(self) -> None:
+        """Called by the controller when the cookpack tC countdown expires."""
         logger.info("[Cookpack] tC expired, ending cook cycle")
 
         self._running = False
+        self._on_stop = None
         self.progress.update_progress(0, self.total_time)
         self._stop_manager()
 
@@ -718,91 +487,6 @@ class CircularProgressPage_admin(ctk.CTkFrame):
         except Exception:
             pass
 
-    def _evaluate_cookpack_temp_control(self) -> None:
-
-        if not self.enable_cook_algorithm:
-            return
-        if not oven_state.get_running():
-            return
-        if self._cookpack_finished:
-            return
-
-        t0 = self._get_t0()
-        if t0 is None:
-            return
-
-        now = time.time()
-
-        # Latch started the first time T0 exceeds TSET.
-        # After this point, tC keeps counting down no matter what T0 does.
-        if (not self._cookpack_started) and (t0 > self.tset):
-            self._cookpack_started = True
-            self._cookpack_last_tick_time = now
-            logger.info(
-                f"[Cookpack] Started countdown, T0={t0:.2f} crossed TSET={self.tset:.2f}, "
-                f"tC={self._cookpack_tc_remaining:.1f}s"
-            )
-
-        # Once started, tC continues continuously.
-        if self._cookpack_started:
-            if self._cookpack_last_tick_time is None:
-                self._cookpack_last_tick_time = now
-            else:
-                dt = now - self._cookpack_last_tick_time
-                self._cookpack_last_tick_time = now
-                self._cookpack_tc_remaining = max(0.0, self._cookpack_tc_remaining - dt)
-
-        # Power-control behavior still depends on current temperature.
-        # Above TSET -> apply Cookpack correction factors.
-        if t0 > self.tset:
-            bottom_scale = self.bottom_zones_correction_factor / 100.0
-            top_scale = self.top_zones_correction_factor / 100.0
-
-            if self._isManualCookMode:
-                self._set_manual_top_bottom_power_if_running(top_scale, bottom_scale)
-            else:
-                self._set_program_scale_for_arrays(bottom_scale, [1, 2, 3, 4])
-                self._set_program_scale_for_arrays(top_scale, [5, 6, 7, 8])
-
-            self._cookpack_control_active = True
-            self._cookpack_top_running_pct = float(self.top_zones_correction_factor)
-            self._cookpack_bottom_running_pct = float(
-                self.bottom_zones_correction_factor
-            )
-
-        # Below lower hysteresis threshold -> restore full power,
-        # but do NOT stop the countdown once started.
-        elif t0 < (self.tset - self.thys):
-            if self._cookpack_control_active:
-                logger.info(
-                    f"[Cookpack] Left control band, T0={t0:.2f} < (TSET-THYS)={(self.tset - self.thys):.2f}"
-                )
-
-            self._cookpack_control_active = False
-
-            if self._isManualCookMode:
-                self._set_manual_top_bottom_power_if_running(1.0, 1.0)
-            else:
-                self._set_program_scale_for_arrays(1.0, [1, 2, 3, 4])
-                self._set_program_scale_for_arrays(1.0, [5, 6, 7, 8])
-
-            self._cookpack_top_running_pct = 100.0
-            self._cookpack_bottom_running_pct = 100.0
-
-        # Between (TSET-THYS) and TSET:
-        # leave current output state unchanged; countdown still continues if started.
-
-        self._update_cookpack_display()
-
-        if self._cookpack_started:
-            logger.info(
-                f"[Cookpack] T0={t0:.2f}, started={self._cookpack_started}, "
-                f"tC remaining={self._cookpack_tc_remaining:.1f}s"
-            )
-
-        if self._cookpack_started and self._cookpack_tc_remaining <= 0.0:
-            self._finish_cookpack_cycle()
-
     # ===================== Serial handling ==================================
 
     def _on_serial_line(self, line: str) -> None:
@@ -824,7 +508,7 @@ class CircularProgressPage_admin(ctk.CTkFrame):
                     self._kick_watchdog()
 
                 self._sw1.stop()
-                if self._sw1.elapsed_ms() > (PERIODIC_INTRERVAL_MS * 1.25):
+                if self._sw1.elapsed_ms() > (TELEMETRY_POLL_INTERVAL_S * 1250):
                     s = f"[_on_serial_line] = {self._sw1.elapsed_ms():.3f}"
                     logger.info(s)
                     print(s)
@@ -833,106 +517,17 @@ class CircularProgressPage_admin(ctk.CTkFrame):
 
                 self._last_line_var.set(line)
 
-                if not self.controller.is_admin:
-                    return
-
-                try:
-                    if oven_state.get_running():
-                        r1_str, r2_str = line[2:].split(",", 1)
-                        r1, r2 = int(r1_str), int(r2_str)
-
-                        if not self._enable_array_temp_control:
-                            if self._inAlarmState:
-                                self.set_overtemp_visible(False)
-
-                                if self._isManualCookMode:
-                                    self._set_power_if_running(1.0)
-                                    if self._powerLevel is not None:
-                                        self.set_power_display(int(self._powerLevel))
-                                    else:
-                                        self.set_power_display(100)
-                                else:
-                                    self._set_program_scale(1.0)
-                                    self.set_power_display(100)
-
-                            self._inAlarmState = False
-                            return
-
-                        L = self._alarm_level
-                        H = self._alarm_hysteresis
-
-                        if self._inAlarmState is None:
-                            if self._isManualCookMode:
-                                self.set_power_display(
-                                    int(self._powerLevel) if self._powerLevel else None
-                                )
-                            else:
-                                self.set_power_display(100)
-
-                        prev = bool(self._inAlarmState)
-
-                        if prev:
-                            in_alarm = not (r1 > L + H and r2 > L + H)
-                        else:
-                            in_alarm = (r1 < L) or (r2 < L)
-
-                        if in_alarm != prev:
-                            self.set_overtemp_visible(in_alarm)
-
-                            if in_alarm:
-                                throttle: float = self._over_temp_power
-                                if self._isManualCookMode:
-                                    self._set_power_if_running(throttle)
-                                    if self._powerLevel is not None:
-                                        self.set_power_display(
-                                            int(throttle * self._powerLevel)
-                                        )
-                                    else:
-                                        self.set_power_display(int(throttle * 100))
-                                else:
-                                    self._set_program_scale(throttle)
-                                    self.set_power_display(int(throttle * 100))
-                            else:
-                                if self._isManualCookMode:
-                                    self._set_power_if_running(1.0)
-                                    if self._powerLevel is not None:
-                                        self.set_power_display(int(self._powerLevel))
-                                    else:
-                                        self.set_power_display(100)
-                                else:
-                                    self._set_program_scale(1.0)
-                                    self.set_power_display(100)
-
-                        self._inAlarmState = in_alarm
-
-                except ValueError:
-                    pass
-
             if line.startswith("T1"):
                 self._t1_var.set(line)
-                temp = self._parse_temp_value(line)
-                if temp is not None:
-                    self._ir_temps[1] = temp
-                    self._evaluate_cookpack_temp_control()
 
             if line.startswith("T2"):
                 self._t2_var.set(line)
-                temp = self._parse_temp_value(line)
-                if temp is not None:
-                    self._ir_temps[2] = temp
-                    self._evaluate_cookpack_temp_control()
 
             if line.startswith("T3"):
                 self._t3_var.set(line)
-                temp = self._parse_temp_value(line)
-                if temp is not None:
-                    self._ir_temps[3] = temp
 
             if line.startswith("T4"):
                 self._t4_var.set(line)
-                temp = self._parse_temp_value(line)
-                if temp is not None:
-                    self._ir_temps[4] = temp
 
             if oven_state.get_running() and line.startswith(("T1", "T2", "T3", "T4")):
                 logger.info(line)
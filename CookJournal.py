@@ -0,0 +1,138 @@
+# CookJournal.py
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from SingletonBase import SingletonBase
+from hmi_consts import COOK_JOURNAL_FILE
+
+
+class CookJournal(SingletonBase):
+    """
+    Append-only journal of the active cook, used to detect a cook that was
+    interrupted by an HMI crash or power loss.
+
+    Every record is one JSON line holding a full snapshot of the cook state
+    (kind, meal_index, program, total, elapsed, scales, cookpack, ...), so the
+    last readable line is all that is needed to resume. A cook starts a fresh
+    file; a cook that ends normally is closed with an "end" record.
+
+    Records are handed to a background writer thread (write + fsync), so
+    callers on the scheduler threads never block on storage.
+    """
+
+    def __init_once__(self, path: Path = COOK_JOURNAL_FILE):
+        self._path = Path(path)
+        self._state: Dict[str, Any] = {}
+        self._state_lock = threading.Lock()
+
+        self._queue: "queue.Queue[tuple[str, str]]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._run_writer, daemon=True, name="CookJournal"
+        )
+        self._writer.start()
+
+    # ---- public API ----
+    def begin(self, **fields):
+        """Start a new journal for a new cook."""
+        with self._state_lock:
+            self._state = dict(fields)
+            line = self._snapshot_line("start")
+        self._queue.put(("reset", line))
+
+    def update(self, **fields):
+        """Merge state into the next record without writing anything now."""
+        with self._state_lock:
+            if self._state:
+                self._state.update(fields)
+
+    def record(self, event: str, **fields):
+        """Merge state and append a snapshot record (step, pause, resume...)."""
+        with self._state_lock:
+            if not self._state:
+                return
+            self._state.update(fields)
+            line = self._snapshot_line(event)
+        self._queue.put(("append", line))
+
+    def end(self, reason: str = "complete"):
+        with self._state_lock:
+            if not self._state:
+                return
+            self._state["reason"] = reason
+            line = self._snapshot_line("end")
+            self._state = {}
+        self._queue.put(("append", line))
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until queued records reach storage. Returns False on timeout."""
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def find_interrupted_cook(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the last snapshot of a cook that never reached its "end"
+        record, or None. Only the journal of the latest cook is on disk, so
+        this is a single small read.
+        """
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[CookJournal] read failed: {e}")
+            return None
+
+        # Walk back past a torn final line, if any
+        for line in reversed(lines):
+            try:
+                snapshot = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(snapshot, dict):
+                continue
+            if snapshot.get("event") == "end":
+                return None
+            return snapshot
+
+        return None
+
+    # ---- internals ----
+    def _snapshot_line(self, event: str) -> str:
+        snapshot = dict(self._state)
+        snapshot["event"] = event
+        snapshot["t"] = time.time()
+        return json.dumps(snapshot, separators=(",", ":"))
+
+    def _run_writer(self):
+        f = None
+        while True:
+            op, payload = self._queue.get()
+            try:
+                if op == "flush":
+                    payload.set()
+                    continue
+
+                if op == "reset" or f is None:
+                    if f is not None:
+                        f.close()
+                    self._path.parent.mkdir(parents=True, exist_ok=True)
+                    f = open(self._path, "w" if op == "reset" else "a", encoding="utf-8")
+
+                f.write(payload + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            except Exception as e:
+                print(f"[CookJournal] write failed: {e}")
+                try:
+                    if f is not None:
+                        f.close()
+                except Exception:
+                    pass
+                f = None
@@ -1,11 +1,24 @@
 import threading
 import time
 
+# Fixed scheduler tick: scale polling and ramp/slew setpoint updates
+TICK_S = 0.1
+
 
 class CookingSequenceRunner(threading.Thread):
-    def __init__(self, sequence, zone_callback, name="ZONE", done_callback=None):
+    def __init__(
+        self,
+        sequence,
+        zone_callback,
+        name="ZONE",
+        done_callback=None,
+        max_slew: float | None = None,
+    ):
         super().__init__(daemon=True, name=name)
-        self.sequence = sequence  # [(duration_sec, power_percent), ...]
+        # [(duration_sec, power_percent), ...] or
+        # [(duration_sec, power_percent, ramp), ...] where ramp=True
+        # interpolates linearly from the previous power across the step
+        self.sequence = sequence
         self.callback = zone_callback  # (zone_name, value_percent, duration)
         self.done_callback = done_callback
         self._stop_event = threading.Event()
@@ -14,7 +27,18 @@ class CookingSequenceRunner(threading.Thread):
         # --- scaling support ---
         self._scale_supplier = lambda: 1.0  # returns float 0..1
         self._last_sent_scaled = None  # last scaled int(percent)
-        self._current_target = 0  # current step's unscaled int(percent)
+        self._current_target = 0  # current unscaled int(percent)
+        # held while an output is computed and sent; the manager shares
+        # its own lock so ticks never interleave with a set_scales() batch
+        self._output_lock = threading.Lock()
+
+        # --- step boundary hook + resume offset ---
+        self.step_callback = None  # (zone_name, step_index)
+        self.skip_seconds = 0.0  # sequence time already cooked before a resume
+
+        # --- ramp / slew support ---
+        self.max_slew = float(max_slew) if max_slew else None  # %/s, None = off
+        self._setpoint = 0.0  # unscaled float(percent) the output is moving on
 
         # --- pause/resume support ---
         self._pause_event = threading.Event()  # set() => paused, clear() => running
@@ -27,20 +51,45 @@ class CookingSequenceRunner(threading.Thread):
     def set_scale_supplier(self, fn):
         self._scale_supplier = fn or (lambda: 1.0)
 
+    def set_output_lock(self, lock):
+        self._output_lock = lock or threading.Lock()
+
     # --- recompute scaled output and (if changed) resend immediately ---
     def apply_scale(self, scale: float | None = None):
         if not self.running:
             return
 
+        with self._output_lock:
+            s = self._safe_scale(scale)
+            scaled = int(round(self._current_target * s))
+            if scaled != self._last_sent_scaled:
+                try:
+                    print(f"[{self.name}] RESCALE CALLBACK -> value={scaled}, duration=0")
+                    self.callback(self.name, scaled, 0)
+                except Exception as e:
+                    print(f"[{self.name}] rescale callback error: {e}")
+                self._last_sent_scaled = scaled
+
+    def take_scaled_output(self, scale: float) -> int | None:
+        """
+        Batch-path counterpart of apply_scale(): compute the scaled output for
+        `scale` and, if it differs from what was last sent, record it as sent
+        and return it so the caller can emit it. Returns None when there is
+        nothing to send (not running, cut while paused, or unchanged).
+        The caller holds the output lock until the value is sent.
+        """
+        if not self.running:
+            return None
+        if self._pause_event.is_set() and self._paused_output_cut:
+            # resume() re-sends with the latest scale
+            return None
+
         s = self._safe_scale(scale)
         scaled = int(round(self._current_target * s))
-        if scaled != self._last_sent_scaled:
-            try:
-                print(f"[{self.name}] RESCALE CALLBACK -> value={scaled}, duration=0")
-                self.callback(self.name, scaled, 0)
-            except Exception as e:
-                print(f"[{self.name}] rescale callback error: {e}")
-            self._last_sent_scaled = scaled
+        if scaled == self._last_sent_scaled:
+            return None
+        self._last_sent_scaled = scaled
+        return scaled
 
     def _safe_scale(self, scale):
         if scale is None:
@@ -61,43 +110,80 @@ class CookingSequenceRunner(threading.Thread):
         self._pause_event.clear()
         # Force an immediate send on resume (covers any edge cases)
         if self.running:
-            s = self._safe_scale(None)
-            scaled = int(round(self._current_target * s))
-            try:
-                self.callback(self.name, scaled, 0)
-            except Exception as e:
-                print(f"[{self.name}] resume callback error: {e}")
-            self._last_sent_scaled = scaled
+            with self._output_lock:
+                s = self._safe_scale(None)
+                scaled = int(round(self._current_target * s))
+                try:
+                    self.callback(self.name, scaled, 0)
+                except Exception as e:
+                    print(f"[{self.name}] resume callback error: {e}")
+                self._last_sent_scaled = scaled
         # Clear paused flag used by run-loop
         self._paused_output_cut = False
 
     def is_paused(self) -> bool:
         return self._pause_event.is_set()
 
+    def _step_setpoint(self, start_power, power, ramp, frac, dt) -> float:
+        """Unscaled setpoint for this tick: ramp interpolation, then slew limit."""
+        desired = start_power + (power - start_power) * frac if ramp else power
+        if self.max_slew is None:
+            return float(desired)
+
+        max_delta = self.max_slew * dt
+        delta = max(-max_delta, min(max_delta, desired - self._setpoint))
+        return self._setpoint + delta
+
     def run(self):
         self.running = True
         try:
-            for duration, power in self.sequence:
+            skip = max(0.0, float(self.skip_seconds))
+            for step_index, step in enumerate(self.sequence):
                 if self._stop_event.is_set():
                     break
 
-                # power is % (0..100) from recipe
-                self._current_target = int(power)
-                s = self._safe_scale(None)
-                scaled = int(round(self._current_target * s))
-                self._last_sent_scaled = scaled
-
-                print(
-                    f"[{self.name}] Output: {scaled}% (target {self._current_target}%, scale {s:.2f}) for {duration} s"
-                )
-                try:
-                    # Initial send for this step with full remaining duration
-                    self.callback(self.name, scaled, duration)
-                except Exception as e:
-                    print(f"[{self.name}] step callback error: {e}")
+                duration, power = step[0], float(step[1])
+                ramp = len(step) > 2 and bool(step[2])
+                shaped = ramp or self.max_slew is not None
+
+                # Resuming: fast-forward through steps that already ran
+                if skip >= duration:
+                    skip -= duration
+                    self._setpoint = power
+                    continue
+                remaining, skip = duration - skip, 0.0
+
+                start_power = self._setpoint
+
+                if self.step_callback:
+                    try:
+                        self.step_callback(self.name, step_index)
+                    except Exception as e:
+                        print(f"[{self.name}] step_callback error: {e}")
+
+                # power is % (0..100) from recipe; ramped/slewed steps start
+                # from wherever the previous step left the output
+                if not shaped:
+                    self._setpoint = power
+                with self._output_lock:
+                    self._current_target = int(round(self._setpoint))
+                    s = self._safe_scale(None)
+                    scaled = int(round(self._current_target * s))
+                    self._last_sent_scaled = scaled
+
+                    print(
+                        f"[{self.name}] Output: {scaled}% (target {int(power)}%, scale {s:.2f}"
+                        f"{', ramp' if ramp else ''}) for {remaining} s"
+                    )
+                    try:
+                        # Initial send for this step with full remaining duration
+                        self.callback(self.name, scaled, remaining)
+                    except Exception as e:
+                        print(f"[{self.name}] step callback error: {e}")
 
                 # Use an absolute end time so we can slide it forward during pauses
-                end_time = time.time() + duration
+                end_time = time.time() + remaining
+                last_tick = time.time()
 
                 # While in this step, watch for stop, pause, and scale changes
                 while True:
@@ -113,14 +199,15 @@ class CookingSequenceRunner(threading.Thread):
 
                         # Cut output once (if configured)
                         if self._cut_on_pause and not self._paused_output_cut:
-                            try:
-                                self.callback(self.name, 0, 0)
-                            except Exception as e:
-                                print(f"[{self.name}] pause callback error: {e}")
-                            self._paused_output_cut = True
-                            self._last_sent_scaled = (
-                                0  # critical: ensure resume triggers a re-send
-                            )
+                            with self._output_lock:
+                                try:
+                                    self.callback(self.name, 0, 0)
+                                except Exception as e:
+                                    print(f"[{self.name}] pause callback error: {e}")
+                                self._paused_output_cut = True
+                                self._last_sent_scaled = (
+                                    0  # critical: ensure resume triggers a re-send
+                                )
 
                         # Wait here until resumed or stopped
                         while (
@@ -131,6 +218,7 @@ class CookingSequenceRunner(threading.Thread):
                         # Adjust end time to account for paused duration
                         paused_for = time.time() - pause_started
                         end_time += paused_for
+                        last_tick = time.time()
 
                         # Restore output if we cut it on pause
                         if self._cut_on_pause and not self._stop_event.is_set():
@@ -138,22 +226,36 @@ class CookingSequenceRunner(threading.Thread):
                             self.apply_scale()
                         continue
 
+                    if shaped:
+                        frac = 1.0 - (end_time - now) / duration if duration > 0 else 1.0
+                        self._setpoint = self._step_setpoint(
+                            start_power, power, ramp, frac, now - last_tick
+                        )
+                        # apply_scale() below only sends integer-percent changes
+                        self._current_target = int(round(self._setpoint))
+                    last_tick = now
+
                     # poll scale ~10Hz; if changed, resend immediately
                     self.apply_scale()
-                    time.sleep(0.1)
+                    time.sleep(TICK_S)
 
                 if self._stop_event.is_set():
                     break
 
+                # A plain ramp always lands exactly on the step's power
+                if ramp and self.max_slew is None:
+                    self._setpoint = power
+
         finally:
-            # Ensure output is reset for this zone
-            try:
-                self.callback(self.name, 0, 0)
-            except Exception as e:
-                print(f"[{self.name}] reset callback error: {e}")
+            # Ensure output is reset for this zone; no batch may follow it
+            with self._output_lock:
+                try:
+                    self.callback(self.name, 0, 0)
+                except Exception as e:
+                    print(f"[{self.name}] reset callback error: {e}")
+                self.running = False
 
             print(f"[{self.name}] Sequence complete.")
-            self.running = False
 
             if self.done_callback:
                 try:
@@ -166,7 +268,24 @@ class CookingSequenceRunner(threading.Thread):
         self._stop_event.set()
 
 
+def _clamp_scale(scale) -> float:
+    return max(0.0, min(1.0, float(scale)))
+
+
 class CookingSequenceManager:
+    # Prefixes accepted for numeric zone identifiers ("ZONE1", "dac1", ...)
+    _ZONE_ALIAS_PREFIXES = (
+        "ZONE",
+        "Zone",
+        "zone",
+        "DAC",
+        "Dac",
+        "dac",
+        "ARRAY",
+        "Array",
+        "array",
+    )
+
     def __init__(self):
         self.runners = {}
         self._lock = threading.Lock()
@@ -180,9 +299,29 @@ class CookingSequenceManager:
         # per-zone scale, keyed by runner name
         self._zone_scales = {}
 
+        # zone identifier -> runner name, filled in by add_dac()
+        self._runner_aliases = {}
+
+        # optional fn({runner_name: value_percent}) used to emit a whole
+        # batch of rescaled outputs at once; falls back to per-runner callbacks
+        self._batch_callback = None
+
+        # optional fn(runner_name, step_index), called at each step boundary
+        self._on_step = None
+
     def set_on_all_complete(self, fn):
         self._on_all_complete = fn
 
+    def set_batch_callback(self, fn):
+        self._batch_callback = fn
+
+    def set_on_step(self, fn):
+        self._on_step = fn
+
+    def _runner_step(self, name, step_index):
+        if self._on_step:
+            self._on_step(name, step_index)
+
     def _runner_finished(self, name):
         with self._lock:
             if self._pending > 0:
@@ -198,6 +337,24 @@ class CookingSequenceManager:
         zone_scale = float(self._zone_scales.get(runner_name, 1.0))
         return max(0.0, min(1.0, global_scale * zone_scale))
 
+    def _register_runner_aliases(self, runner_name: str):
+        """
+        Precompute every identifier that should resolve to `runner_name`:
+            "Zone1", 1, "1", "ZONE1", "DAC1", "array1", ...
+        """
+        aliases = self._runner_aliases
+        aliases[runner_name] = runner_name
+
+        digits = runner_name[len(runner_name.rstrip("0123456789")):]
+        if not digits:
+            return
+
+        z = int(digits)
+        for alias in (z, str(z)):
+            aliases.setdefault(alias, runner_name)
+        for prefix in self._ZONE_ALIAS_PREFIXES:
+            aliases.setdefault(f"{prefix}{z}", runner_name)
+
     def _resolve_runner_name(self, zone) -> str | None:
         """
         Resolve an incoming zone identifier like:
@@ -207,57 +364,47 @@ class CookingSequenceManager:
             "DAC1"
         to the actual key used in self.runners.
         """
-        candidates = []
-
-        # direct match first
-        candidates.append(zone)
-        candidates.append(str(zone))
+        try:
+            name = self._runner_aliases.get(zone)
+        except TypeError:
+            return None
+        if name is not None:
+            return name
 
+        # Unusual spellings such as "01" or 1.0
         try:
-            z = int(zone)
-            candidates.extend(
-                [
-                    f"ZONE{z}",
-                    f"Zone{z}",
-                    f"zone{z}",
-                    f"DAC{z}",
-                    f"Dac{z}",
-                    f"dac{z}",
-                    f"ARRAY{z}",
-                    f"Array{z}",
-                    f"array{z}",
-                ]
-            )
+            return self._runner_aliases.get(int(zone))
         except Exception:
-            pass
+            return None
 
-        for name in candidates:
-            if name in self.runners:
-                return name
-
-        return None
-
-    def add_dac(self, dac_name, sequence, set_voltage_callback):
+    def add_dac(self, dac_name, sequence, set_voltage_callback, max_slew=None):
         runner = CookingSequenceRunner(
             sequence,
             set_voltage_callback,
             name=dac_name,
             done_callback=self._runner_finished,
+            max_slew=max_slew,
         )
+        runner.step_callback = self._runner_step
 
         # supply live scale to runner: global * per-zone
         runner.set_scale_supplier(
             lambda name=dac_name: self._get_combined_scale_for_runner(name)
         )
+        # runner ticks and set_scales() batches send under the same lock
+        runner.set_output_lock(self._lock)
 
         self.runners[dac_name] = runner
         self._zone_scales.setdefault(dac_name, 1.0)
+        self._register_runner_aliases(dac_name)
 
-    def start_all(self):
+    def start_all(self, offset_s: float = 0.0):
+        """Start every runner; offset_s > 0 resumes that far into the program."""
         with self._lock:
             self._pending = len(self.runners)
             self._completed_once = False
         for runner in self.runners.values():
+            runner.skip_seconds = offset_s
             runner.start()
 
     def stop_all(self):
@@ -282,50 +429,74 @@ class CookingSequenceManager:
     def get_status(self):
         return {name: runner.running for name, runner in self.runners.items()}
 
-    # set & broadcast global power scale (0..1)
-    def set_power_scale(self, scale: float):
-        s = max(0.0, min(1.0, float(scale)))
+    def get_scales(self) -> dict:
         with self._lock:
-            self._power_scale = s
-            # Ask active runners to re-apply the scale right now
-            for r in self.runners.values():
-                r.apply_scale()
+            return {"global": self._power_scale, "zones": dict(self._zone_scales)}
 
-    def set_zone_scale(self, zone, scale: float):
-        """
-        Set scale for one selected zone/array and immediately update
-        that runner's live output.
+    # --- batched scaling ---
+    def set_scales(self, global_scale: float | None = None, zone_scales=None):
         """
+        Atomically update the global scale and/or any number of per-zone
+        scales, then emit every changed output as one batch.
 
-        s = max(0.0, min(1.0, float(scale)))
-
+        zone_scales maps zone identifiers (1, "1", "Zone1", "DAC1", ...) to
+        a 0..1 scale. Unknown zones are reported and skipped.
+        """
         with self._lock:
-            runner_name = self._resolve_runner_name(zone)
+            if global_scale is not None:
+                self._power_scale = _clamp_scale(global_scale)
+
+            for zone, scale in (zone_scales or {}).items():
+                runner_name = self._resolve_runner_name(zone)
+                if runner_name is None:
+                    print(f"[CookingSequenceManager] set_scales: zone not found: {zone}")
+                    continue
+                self._zone_scales[runner_name] = _clamp_scale(scale)
+
+            outputs = {}
+            for name, r in self.runners.items():
+                value = r.take_scaled_output(self._get_combined_scale_for_runner(name))
+                if value is not None:
+                    outputs[name] = value
+
+            self._emit_outputs(outputs)
+
+    def _emit_outputs(self, outputs: dict):
+        if not outputs:
+            return
 
-            if runner_name is None:
-                print(
-                    f"[CookingSequenceManager] set_zone_scale: zone not found: {zone}"
-                )
-                return
+        if self._batch_callback:
+            try:
+                print(f"[CookingSequenceManager] RESCALE BATCH -> {outputs}")
+                self._batch_callback(dict(outputs))
+            except Exception as e:
+                print(f"[CookingSequenceManager] batch callback error: {e}")
+            return
 
-            self._zone_scales[runner_name] = s
+        for name, value in outputs.items():
+            r = self.runners[name]
+            try:
+                print(f"[{name}] RESCALE CALLBACK -> value={value}, duration=0")
+                r.callback(name, value, 0)
+            except Exception as e:
+                print(f"[{name}] rescale callback error: {e}")
 
-            r = self.runners.get(runner_name)
+    # set & broadcast global power scale (0..1)
+    def set_power_scale(self, scale: float):
+        self.set_scales(global_scale=scale)
 
-            if r:
-                r.apply_scale()
+    def set_zone_scale(self, zone, scale: float):
+        """
+        Set scale for one selected zone/array and immediately update
+        that runner's live output.
+        """
+        self.set_scales(zone_scales={zone: scale})
 
     def set_selected_zone_scale(self, zones, scale: float):
-        for zone in zones:
-            self.set_zone_scale(zone, scale)
+        self.set_scales(zone_scales={zone: scale for zone in zones})
 
     def set_all_zone_scales(self, scale: float):
-        s = max(0.0, min(1.0, float(scale)))
-        with self._lock:
-            for name in self.runners.keys():
-                self._zone_scales[name] = s
-            for r in self.runners.values():
-                r.apply_scale()
+        self.set_scales(zone_scales={name: scale for name in self.runners})
 
     def reset_zone_scales(self):
         self.set_all_zone_scales(1.0)
@@ -1,19 +1,17 @@
 import time
 import customtkinter as ctk
 from typing import TYPE_CHECKING, Dict, Any, Optional
-import json
-import os
 
 # Same imports TimePowerPage uses for palette & sizing
 from MessageBoxPage import showerror, showinfo
 from SerialService import SerialService
-from hmi_consts import HMIColors, HMISizePos, __version__, SETTINGS_DIR
+from Settings import Settings
+from hmi_consts import HMIColors, HMISizePos, __version__
 from ui_bits import COLOR_FG, COLOR_BLUE, COLOR_NUMBERS
 from LabeledIntInput import LabeledIntInput  # Alarm Level & Hysteresis (ints)
 from LabeledFloatInput import LabeledFloatInput
 from utilities import save_log_file  # Over Temp Power (float)
 import logging
-from utilities import load_use_sound_from_settings
 
 if TYPE_CHECKING:
     from MultiPageController import MultiPageController
@@ -663,84 +661,25 @@ class DiagnosticsPage(ctk.CTkFrame):
         )
         refresh_btn.pack(side="right", padx=10, pady=6)
 
-    # --- settings helpers ---
-    def _load_settings_dict(self) -> dict:
-        """Load settings/settings.alt as JSON; always return a dict."""
-        path = os.path.join(SETTINGS_DIR, "settings.alt")
-        try:
-            if os.path.exists(path):
-                with open(path, "r") as f:
-                    data = json.load(f)
-                    return data if isinstance(data, dict) else {}
-        except Exception:
-            pass
-        return {}
-
-    def _load_alarm_level_from_settings(self, default: int = 1500) -> int:
-        """Return alarm_level from settings; coerce to int; fall back safely."""
-        data = self._load_settings_dict()
-        try:
-            return int(data.get("alarm_level", default))
-        except Exception:
-            return default
-
-    def _load_alarm_hysteresis_from_settings(self, default: int = 200) -> int:
-        """Return alarm_hysteresis from settings; coerce to int; fall back safely."""
-        data = self._load_settings_dict()
-        try:
-            return int(data.get("alarm_hysteresis", default))
-        except Exception:
-            return default
-
-    def _load_over_temp_power_from_settings(self, default: float = 0.75) -> float:
-        """Return over_temp_power from settings; coerce to float; fall back safely."""
-        data = self._load_settings_dict()
-        try:
-            return float(data.get("over_temp_power", default))
-        except Exception:
-            return default
-
-    def _load_enable_array_temp_control_from_settings(
-        self, default: bool = False
-    ) -> bool:
-        """Return enable_array_temp_control from settings; coerce to bool; fall back safely."""
-        data = self._load_settings_dict()
-        try:
-            return bool(data.get("enable_array_temp_control", default))
-        except Exception:
-            return default
-
-    def _load_oven_testing_power_settings(self, default: int = 80) -> int:
-        """Return oven_testing_power from settings; coerce to int; fall back safely."""
-        data = self._load_settings_dict()
-        try:
-            return int(data.get("oven_testing_power", default))
-        except Exception:
-            return default
-
     def save_settings(self):
         """Merge-save diagnostics settings so page-to-page navigation preserves values."""
         try:
-            os.makedirs(SETTINGS_DIR, exist_ok=True)
-            path = os.path.join(SETTINGS_DIR, "settings.alt")
-
-            data = self._load_settings_dict()
-            data["alarm_level"] = int(self.alarm_threshold_input.get())
-            data["alarm_hysteresis"] = int(self.alarm_hysteresis_input.get())
-            data["over_temp_power"] = float(self.over_temp_power_input.get())
-            data["enable_array_temp_control"] = self.enable_array_temp_control_var.get()
-            data["use_sound"] = self.selected_use_sound_option.get() == "Yes"
-            data["oven_testing_power"] = int(self.psu_test_input.get())
-
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
+            s = Settings.Instance()
+            s.update(
+                alarm_level=int(self.alarm_threshold_input.get()),
+                alarm_hysteresis=int(self.alarm_hysteresis_input.get()),
+                over_temp_power=float(self.over_temp_power_input.get()),
+                enable_array_temp_control=self.enable_array_temp_control_var.get(),
+                use_sound=self.selected_use_sound_option.get() == "Yes",
+                oven_testing_power=int(self.psu_test_input.get()),
+            )
 
             print(
-                f"[DiagnosticsPage] Saved Alarm Level={data['alarm_level']}, "
-                f"Alarm Hysteresis={data['alarm_hysteresis']}, "
-                f"Over Temp Power={data['over_temp_power']}, "
-                f"Enable Array Temp Control={data['enable_array_temp_control']}, "
-                f"Use Sound={data['use_sound']} to {path}"
+                f"[DiagnosticsPage] Saved Alarm Level={s.alarm_level}, "
+                f"Alarm Hysteresis={s.alarm_hysteresis}, "
+                f"Over Temp Power={s.over_temp_power}, "
+                f"Enable Array Temp Control={s.enable_array_temp_control}, "
+                f"Use Sound={s.use_sound}"
             )
         except Exception as e:
             print(f"[DiagnosticsPage] Failed to save settings: {e}")
@@ -821,24 +760,17 @@ class DiagnosticsPage(ctk.CTkFrame):
     def on_show(self):
         # Restore values from settings
         try:
-            saved_alarm = self._load_alarm_level_from_settings(default=1500)
-            self.alarm_threshold_input.set(saved_alarm)
+            s = Settings.Instance()
+            self.alarm_threshold_input.set(s.alarm_level)
+            self.alarm_hysteresis_input.set(s.alarm_hysteresis)
+            self.over_temp_power_input.set(s.over_temp_power)
 
-            saved_hyst = self._load_alarm_hysteresis_from_settings(default=200)
-            self.alarm_hysteresis_input.set(saved_hyst)
-
-            saved_power = self._load_over_temp_power_from_settings(default=0.75)
-            self.over_temp_power_input.set(saved_power)
-
-            saved_enable_array_temp_control = (
-                self._load_enable_array_temp_control_from_settings(default=False)
-            )
+            saved_enable_array_temp_control = s.enable_array_temp_control
             self.enable_array_temp_control_var.set(saved_enable_array_temp_control)
 
-            oven_testing_power = self._load_oven_testing_power_settings(default=80)
-            self.psu_test_input.set(oven_testing_power)
+            self.psu_test_input.set(s.oven_testing_power)
 
-            use_sound = load_use_sound_from_settings(default=True)
+            use_sound = s.use_sound
             self.selected_use_sound_option.set("Yes" if use_sound else "No")
             # Publish for global use (e.g., click wrappers)
             self.shared_data["use_sound"] = use_sound
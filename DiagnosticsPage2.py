@@ -78,7 +78,7 @@ class DiagnosticsPage2(ctk.CTkFrame):
         # Keep these rows compact. Do not give them vertical weight,
         # otherwise Tk spreads the controls over the full body height.
         left_frame.grid_columnconfigure(0, weight=0)
-        for row_index in range(6):
+        for row_index in range(8):
             left_frame.grid_rowconfigure(row_index, weight=0)
 
         # Right side log area expands. Only the textbox row gets vertical weight,
@@ -201,6 +201,34 @@ class DiagnosticsPage2(ctk.CTkFrame):
             row=5, column=0, sticky="w", padx=10, pady=left_row_pady
         )
 
+        self.use_pid_control_checkbox = ctk.CTkCheckBox(
+            left_frame,
+            text="Use PID Cookpack Control",
+            font=lbl_font,
+            text_color=COLOR_BLUE,
+            fg_color=COLOR_BLUE,
+            hover_color=HMIColors.color_numbers,
+            border_color=COLOR_BLUE,
+            checkmark_color=COLOR_FG,
+        )
+        self.use_pid_control_checkbox.grid(
+            row=6, column=0, sticky="w", padx=10, pady=left_row_pady
+        )
+
+        self.show_hotspots_checkbox = ctk.CTkCheckBox(
+            left_frame,
+            text="Show Hotspot Outlines",
+            font=lbl_font,
+            text_color=COLOR_BLUE,
+            fg_color=COLOR_BLUE,
+            hover_color=HMIColors.color_numbers,
+            border_color=COLOR_BLUE,
+            checkmark_color=COLOR_FG,
+        )
+        self.show_hotspots_checkbox.grid(
+            row=7, column=0, sticky="w", padx=10, pady=left_row_pady
+        )
+
         # ----- Right side RFID controls -----
         self.use_rfid_checkbox = ctk.CTkCheckBox(
             right_frame,
@@ -341,7 +369,11 @@ class DiagnosticsPage2(ctk.CTkFrame):
             )
             s.tc = self._clamp(int(self.tc_input.get()), 10, 8835)
             s.enable_cook_algorithm = bool(self.enable_cook_algorithm_checkbox.get())
+            s.cookpack_control_strategy = (
+                "pid" if self.use_pid_control_checkbox.get() else "hysteresis"
+            )
             s.use_rfid = bool(self.use_rfid_checkbox.get())
+            s.show_hotspots = bool(self.show_hotspots_checkbox.get())
 
             s.save()
 
@@ -365,7 +397,6 @@ class DiagnosticsPage2(ctk.CTkFrame):
 
         try:
             s = Settings.Instance()
-            s.load()
 
             self.tset_input.set(int(s.tset))
             self.thys_input.set(int(s.thys))
@@ -382,11 +413,21 @@ class DiagnosticsPage2(ctk.CTkFrame):
             else:
                 self.enable_cook_algorithm_checkbox.deselect()
 
+            if s.cookpack_control_strategy == "pid":
+                self.use_pid_control_checkbox.select()
+            else:
+                self.use_pid_control_checkbox.deselect()
+
             if s.use_rfid:
                 self.use_rfid_checkbox.select()
             else:
                 self.use_rfid_checkbox.deselect()
 
+            if s.show_hotspots:
+                self.show_hotspots_checkbox.select()
+            else:
+                self.show_hotspots_checkbox.deselect()
+
             self.shared_data["tset"] = s.tset
             self.shared_data["thys"] = s.thys
             self.shared_data["top_zones_correction_factor"] = (
@@ -0,0 +1,294 @@
+# FileStore.py
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from SingletonBase import SingletonBase
+
+# Saves arriving within this window of each other are merged into one write
+COALESCE_DELAY_S = 0.25
+
+CHECKSUM_KEY = "_checksum"
+
+
+def _checksum(data: Dict[str, Any]) -> str:
+    body = {k: v for k, v in data.items() if k != CHECKSUM_KEY}
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def dumps_json(data: Any, indent: Optional[int] = 2, checksum: bool = False) -> str:
+    """Serialize data; with checksum=True a dict gets a "_checksum" key."""
+    if checksum and isinstance(data, dict):
+        data = dict(data)
+        data[CHECKSUM_KEY] = _checksum(data)
+    return json.dumps(data, indent=indent)
+
+
+def loads_json(text: str, source: str = "") -> Any:
+    """
+    Parse text written by dumps_json. A "_checksum" key, if present, is
+    checked and removed. A file that parses but fails the check was most
+    likely edited outside the HMI (USB copy, service tool), so it is used
+    as is with a warning; the next save stamps it again.
+    """
+    data = json.loads(text)
+    if isinstance(data, dict) and CHECKSUM_KEY in data:
+        expected = data.pop(CHECKSUM_KEY)
+        if _checksum(data) != expected:
+            print(
+                f"[FileStore] {source or 'data'}: checksum mismatch "
+                "(edited outside the HMI?); using it as is"
+            )
+    return data
+
+
+def _fsync_dir(dirname: str) -> None:
+    try:
+        fd = os.open(dirname or ".", os.O_RDONLY)
+    except OSError:
+        return  # not supported on this platform (e.g. Windows)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """
+    Write data to path so that, after a power loss, path holds either the
+    old or the new content in full: write a temp file in the same directory,
+    fsync it, rename it over path, then fsync the directory.
+    """
+    path = str(path)
+    dirname = os.path.dirname(path)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(dirname)
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def atomic_write_json(
+    path: str, data: Any, indent: Optional[int] = 2, checksum: bool = False
+) -> None:
+    """
+    Synchronous atomic JSON write. With checksum=True the same content is
+    also kept in "<path>.bak", which read_json() falls back to when the
+    main file can't be read or parsed.
+    """
+    text = dumps_json(data, indent=indent, checksum=checksum)
+    if checksum:
+        atomic_write_text(str(path) + ".bak", text)
+    atomic_write_text(path, text)
+
+
+def read_json(path: str, default: Any = None) -> Any:
+    """
+    Read a JSON file; if it is unreadable or doesn't parse (e.g. torn by a
+    power loss), its "<path>.bak" copy. default if neither can be used.
+    """
+    path = str(path)
+    for candidate in (path, path + ".bak"):
+        try:
+            with open(candidate, "r", encoding="utf-8") as f:
+                return loads_json(f.read(), candidate)
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            print(f"[FileStore] read {candidate} failed: {e}")
+    return default
+
+
+class _PendingWrite:
+    __slots__ = ("data", "backup", "callbacks")
+
+    def __init__(self, data: bytes, backup: bool):
+        self.data = data
+        self.backup = backup
+        self.callbacks: List[Callable[[], None]] = []
+
+
+class FileStore(SingletonBase):
+    """
+    Write-behind persistence for programs and settings.
+
+    write_json() serializes the data immediately (so later changes by the
+    caller are not picked up) and hands it to a background writer thread,
+    which performs the atomic write + fsync. Several saves of the same file
+    in quick succession are coalesced: only the latest content is written.
+    UI handlers therefore never wait for the SD card.
+
+    Reads through read_json() see content that is still queued, so
+    read-modify-write callers (update_json) never lose each other's keys.
+    Call flush() before shutdown.
+    """
+
+    def __init_once__(self, coalesce_delay_s: float = COALESCE_DELAY_S):
+        self._coalesce_delay_s = float(coalesce_delay_s)
+        self._cond = threading.Condition()
+        self._pending: Dict[str, _PendingWrite] = {}
+        self._inflight: Dict[str, _PendingWrite] = {}
+        self._flush_requested = False
+        self.writes = 0
+        self.coalesced = 0
+
+        self._writer = threading.Thread(
+            target=self._run_writer, daemon=True, name="FileStore"
+        )
+        self._writer.start()
+
+    # ---- public API ----
+    def write_json(
+        self,
+        path,
+        data: Any,
+        indent: Optional[int] = 2,
+        checksum: bool = False,
+        on_written: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Queue data for an atomic write to path. on_written, if given, is
+        called on the writer thread once the file is on storage.
+        """
+        text = dumps_json(data, indent=indent, checksum=checksum)
+        with self._cond:
+            self._enqueue_locked(str(path), text.encode("utf-8"), checksum, on_written)
+
+    def write_bytes(
+        self,
+        path,
+        data: bytes,
+        on_written: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Queue raw bytes (e.g. a binary program record) for an atomic write."""
+        with self._cond:
+            self._enqueue_locked(str(path), bytes(data), False, on_written)
+
+    def update_json(
+        self,
+        path,
+        mutate: Callable[[Dict[str, Any]], None],
+        indent: Optional[int] = 2,
+        checksum: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Merge-write: mutate(data) is applied to the current content of path
+        (including queued content) and the result is queued. Returns the
+        new content.
+        """
+        path = str(path)
+        with self._cond:
+            data = self._read_locked(path)
+            if not isinstance(data, dict):
+                data = {}
+            mutate(data)
+            text = dumps_json(data, indent=indent, checksum=checksum)
+            self._enqueue_locked(path, text.encode("utf-8"), checksum, None)
+        return data
+
+    def read_json(self, path, default: Any = None) -> Any:
+        """Latest content of path: queued content if any, else the file."""
+        with self._cond:
+            data = self._read_locked(str(path))
+        return default if data is None else data
+
+    def read_bytes(self, path) -> Optional[bytes]:
+        """Latest raw content of path (queued or on storage), None if missing."""
+        path = str(path)
+        with self._cond:
+            pending = self._pending.get(path) or self._inflight.get(path)
+            if pending is not None:
+                return pending.data
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def has_pending(self, path) -> bool:
+        with self._cond:
+            return str(path) in self._pending or str(path) in self._inflight
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Write everything queued now. Returns False on timeout."""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            ok = self._cond.wait_for(
+                lambda: not self._pending and not self._inflight, timeout
+            )
+            self._flush_requested = False
+            return ok
+
+    # ---- internals ----
+    def _read_locked(self, path: str) -> Any:
+        pending = self._pending.get(path) or self._inflight.get(path)
+        if pending is not None:
+            return loads_json(pending.data.decode("utf-8"))
+        return read_json(path)
+
+    def _enqueue_locked(
+        self,
+        path: str,
+        data: bytes,
+        backup: bool,
+        on_written: Optional[Callable[[], None]],
+    ) -> None:
+        previous = self._pending.get(path)
+        entry = _PendingWrite(data, backup)
+        if previous is not None:
+            entry.callbacks = previous.callbacks
+            self.coalesced += 1
+        if on_written is not None:
+            entry.callbacks.append(on_written)
+        self._pending[path] = entry
+        self._cond.notify_all()
+
+    def _run_writer(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+                # give rapid successive saves a moment to coalesce
+                deadline = time.monotonic() + self._coalesce_delay_s
+                while not self._flush_requested:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._pending
+                self._pending = {}
+                # still visible to readers until it is on storage
+                self._inflight = batch
+
+            for path, entry in batch.items():
+                try:
+                    if entry.backup:
+                        atomic_write_bytes(path + ".bak", entry.data)
+                    atomic_write_bytes(path, entry.data)
+                    self.writes += 1
+                except Exception as e:
+                    print(f"[FileStore] write {path} failed: {e}")
+                    continue
+                for callback in entry.callbacks:
+                    try:
+                        callback()
+                    except Exception as e:
+                        print(f"[FileStore] on_written for {path} failed: {e}")
+
+            with self._cond:
+                self._inflight = {}
+                self._cond.notify_all()
@@ -0,0 +1,229 @@
+# FileWatcher.py
+import ctypes
+import ctypes.util
+import os
+import re
+import select
+import struct
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from ProgramCatalog import ProgramCatalog
+from ProgramRepository import ProgramRepository
+from Settings import Settings
+from SingletonBase import SingletonBase
+from hmi_consts import PROGRAMS_DIR, SETTINGS_DIR, SETTINGS_FILE
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE
+REMOVED_MASK = IN_MOVED_FROM | IN_DELETE
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_PROGRAM_NAME = re.compile(r"^program(\d+)\.alt$")
+_SETTINGS_NAME = os.path.basename(str(SETTINGS_FILE))
+
+
+@dataclass(frozen=True)
+class FileChange:
+    kind: str  # "program" | "settings"
+    path: str
+    number: Optional[int] = None  # program number for kind == "program"
+    removed: bool = False
+
+
+class _Inotify:
+    """Minimal ctypes binding to the Linux inotify API."""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def add_watch(self, path: str, mask: int) -> int:
+        wd = self._add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        return wd
+
+    def read_events(self):
+        """Yield (wd, mask, name) for the events currently queued."""
+        buf = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            name = buf[offset : offset + length].rstrip(b"\0").decode("utf-8", "replace")
+            offset += length
+            yield wd, mask, name
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FileWatcher(SingletonBase):
+    """
+    Watches PROGRAMS_DIR and SETTINGS_DIR with inotify and applies changes
+    made outside the HMI (USB import, update install, manual copy) as they
+    happen:
+
+        programN.alt   -> ProgramRepository.invalidate(N), catalog row N refreshed
+        settings.alt   -> Settings.load(), which notifies its own listeners
+
+    Only the file named in the event is touched; nothing is polled or
+    rescanned. Temp/backup files of the atomic writer and catalog.json are
+    ignored; the final rename of an atomic write shows up as IN_MOVED_TO.
+
+    Listeners get a FileChange after the caches were updated; with tk_root
+    set they, and the settings reload (whose listeners touch Tk widgets),
+    run on the UI thread. Not available off Linux, where start() logs and
+    returns False.
+    """
+
+    def __init_once__(self):
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[FileChange], None]] = []
+        self._inotify: Optional[_Inotify] = None
+        self._dirs: Dict[int, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_r: Optional[int] = None
+        self._stop_w: Optional[int] = None
+        self.tk_root = None
+
+    # ---- public API ----
+    def start(self, tk_root=None) -> bool:
+        with self._lock:
+            if self._thread is not None:
+                return True
+            if not sys.platform.startswith("linux"):
+                print(f"[FileWatcher] inotify not available on {sys.platform}")
+                return False
+
+            self.tk_root = tk_root
+            try:
+                self._inotify = _Inotify()
+                for d in (PROGRAMS_DIR, SETTINGS_DIR):
+                    os.makedirs(d, exist_ok=True)
+                    self._dirs[self._inotify.add_watch(str(d), WATCH_MASK)] = str(d)
+            except (OSError, AttributeError) as e:
+                print(f"[FileWatcher] start failed: {e}")
+                if self._inotify is not None:
+                    self._inotify.close()
+                self._inotify = None
+                self._dirs = {}
+                return False
+
+            self._stop_r, self._stop_w = os.pipe()
+            self._thread = threading.Thread(
+                target=self._run, daemon=True, name="FileWatcher"
+            )
+            self._thread.start()
+            return True
+
+    def stop(self) -> None:
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            os.write(self._stop_w, b"x")
+        thread.join(timeout=1.0)
+
+    def add_listener(self, fn: Callable[[FileChange], None]) -> None:
+        with self._lock:
+            if fn not in self._listeners:
+                self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[FileChange], None]) -> None:
+        with self._lock:
+            if fn in self._listeners:
+                self._listeners.remove(fn)
+
+    # ---- internals ----
+    def _run(self):
+        fd = self._inotify.fd
+        try:
+            while True:
+                readable, _, _ = select.select([fd, self._stop_r], [], [])
+                if self._stop_r in readable:
+                    break
+                for wd, mask, name in self._inotify.read_events():
+                    if mask & IN_Q_OVERFLOW:
+                        print("[FileWatcher] event queue overflow")
+                        continue
+                    if mask & IN_IGNORED or not name:
+                        continue
+                    change = self._classify(self._dirs.get(wd), name, mask)
+                    if change is not None:
+                        self._apply(change)
+        except Exception as e:
+            print(f"[FileWatcher] stopped: {e}")
+        finally:
+            with self._lock:
+                self._inotify.close()
+                self._inotify = None
+                self._dirs = {}
+                for fd_ in (self._stop_r, self._stop_w):
+                    os.close(fd_)
+                self._stop_r = self._stop_w = None
+                self._thread = None
+
+    @staticmethod
+    def _classify(directory: Optional[str], name: str, mask: int) -> Optional[FileChange]:
+        if directory is None:
+            return None
+        path = os.path.join(directory, name)
+        removed = bool(mask & REMOVED_MASK)
+
+        if directory == str(PROGRAMS_DIR):
+            m = _PROGRAM_NAME.match(name)
+            if m:
+                return FileChange("program", path, int(m.group(1)), removed)
+        elif directory == str(SETTINGS_DIR) and name == _SETTINGS_NAME:
+            return FileChange("settings", path, None, removed)
+        return None
+
+    def _apply(self, change: FileChange) -> None:
+        try:
+            if change.kind == "program":
+                ProgramRepository.Instance().invalidate(change.number)
+                ProgramCatalog.Instance().update(change.number)
+            elif change.kind == "settings" and not change.removed:
+                # queued ahead of the listeners below, so they see the result
+                self._on_ui_thread(self._load_settings)
+        except Exception as e:
+            print(f"[FileWatcher] applying {change} failed: {e}")
+
+        with self._lock:
+            listeners = list(self._listeners)
+        for fn in listeners:
+            try:
+                self._on_ui_thread(fn, change)
+            except Exception as e:
+                print(f"[FileWatcher] listener failed: {e}")
+
+    def _on_ui_thread(self, fn, *args) -> None:
+        if self.tk_root is not None and hasattr(self.tk_root, "after"):
+            self.tk_root.after(0, fn, *args)
+        else:
+            fn(*args)
+
+    @staticmethod
+    def _load_settings() -> None:
+        try:
+            Settings.Instance().load()
+        except Exception as e:
+            print(f"[FileWatcher] settings reload failed: {e}")
@@ -0,0 +1,269 @@
+# OverlayRenderer.py
+"""
+PIL drawing of page overlays (overlay_shapes / overlay_text), used by
+ImageHotspotView, plus the dirty-region support for incremental updates.
+
+Overlay items are retained layers: an item may carry an "id" that stays
+the same while the page changes (e.g. "meal3.label", "scroll.thumb").
+overlay_items() gives every item a key (its id, or its position when it
+has none), dirty_rects() diffs two item sets into the screen areas that
+changed, and render_patches() draws just those areas:
+
+    old = overlay_items(previous_page)
+    new = overlay_items(page)
+    for rect, patch in render_patches(base, new, dirty_rects(old, new, base.size)):
+        paste patch at rect[:2]
+
+Shapes are drawn before text, each group in list order, exactly as a
+full compose() would, so a patch is pixel-identical to the same area of
+the fully composed frame.
+"""
+import functools
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from RenderCache import RenderCache
+
+Rect = Tuple[int, int, int, int]  # x1, y1, x2, y2 (x2/y2 exclusive)
+OverlayItem = Tuple[str, Dict[str, Any]]  # ("shape" | "text", item dict)
+
+# Extra pixels around an item's geometry for outlines and anti-aliasing
+EXTENT_MARGIN = 3
+
+_FONT_CANDIDATES = {
+    "bold": ["arialbd.ttf", "Arial Bold.ttf", "DejaVuSans-Bold.ttf"],
+    "normal": ["arial.ttf", "Arial.ttf", "DejaVuSans.ttf"],
+}
+
+# font_weight -> first font file that loaded (None: PIL default font)
+_resolved_font_paths: Dict[str, Optional[str]] = {}
+
+_measure = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+
+
+@functools.lru_cache(maxsize=64)
+def get_font(font_size: int, font_weight: str = "normal"):
+    if font_weight not in _resolved_font_paths:
+        candidates = list(_FONT_CANDIDATES["normal"])
+        if font_weight == "bold":
+            candidates = _FONT_CANDIDATES["bold"] + candidates
+        _resolved_font_paths[font_weight] = None
+        for name in candidates:
+            try:
+                font = ImageFont.truetype(name, font_size)
+            except Exception:
+                continue
+            _resolved_font_paths[font_weight] = name
+            return font
+
+    path = _resolved_font_paths[font_weight]
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, font_size)
+
+
+def _triangle_points(bbox, size, up: bool):
+    x1, y1, x2, y2 = bbox
+    cx = (x1 + x2) // 2
+    cy = (y1 + y2) // 2
+    s = size
+    if up:
+        return [(cx, cy - s), (cx - s, cy + s), (cx + s, cy + s)]
+    return [(cx - s, cy - s), (cx + s, cy - s), (cx, cy + s)]
+
+
+def _text_args(item: Dict[str, Any]):
+    font = get_font(int(item.get("font_size", 24)), item.get("font_weight", "normal"))
+    return item.get("text", ""), font, item.get("anchor", "la")
+
+
+# ---- items ----
+def overlay_items(page_obj) -> Dict[str, OverlayItem]:
+    """
+    Ordered {key: (group, item)} of everything page_obj draws. Items are
+    copied, so a page updating its dicts in place still shows up as a change.
+    """
+    items: Dict[str, OverlayItem] = {}
+    for group, attr in (("shape", "overlay_shapes"), ("text", "overlay_text")):
+        for i, item in enumerate(getattr(page_obj, attr, None) or []):
+            key = f"{group}:{item.get('id', f'#{i}')}"
+            items[key] = (group, dict(item))
+    return items
+
+
+def item_extent(group: str, item: Dict[str, Any]) -> Optional[Rect]:
+    """Screen area an item can touch, or None if it draws nothing."""
+    if group == "text":
+        xy = item.get("xy")
+        if not xy:
+            return None
+        text, font, anchor = _text_args(item)
+        x1, y1, x2, y2 = _measure.textbbox(xy, text, font=font, anchor=anchor)
+    else:
+        bbox = item.get("bbox")
+        if not bbox:
+            return None
+        kind = item.get("kind")
+        if kind in ("triangle_up", "triangle_down"):
+            pts = _triangle_points(bbox, item.get("size", 16), kind == "triangle_up")
+            xs, ys = [p[0] for p in pts], [p[1] for p in pts]
+            x1, y1, x2, y2 = min(xs), min(ys), max(xs), max(ys)
+        else:
+            x1, y1, x2, y2 = bbox
+        x2 += item.get("width", 1)
+        y2 += item.get("width", 1)
+
+    m = EXTENT_MARGIN
+    return int(x1) - m, int(y1) - m, int(x2) + m + 1, int(y2) + m + 1
+
+
+# ---- drawing ----
+def draw_items(img: Image.Image, items: Iterable[OverlayItem], origin=(0, 0)) -> None:
+    """Draw items onto img, whose top-left corner is at origin on screen."""
+    ox, oy = origin
+    draw = ImageDraw.Draw(img)
+
+    def shift(bbox):
+        x1, y1, x2, y2 = bbox
+        return (x1 - ox, y1 - oy, x2 - ox, y2 - oy)
+
+    for group, item in items:
+        if group == "text":
+            xy = item.get("xy")
+            if not xy:
+                continue
+            text, font, anchor = _text_args(item)
+            draw.text(
+                (xy[0] - ox, xy[1] - oy),
+                text,
+                fill=item.get("fill", "white"),
+                font=font,
+                anchor=anchor,
+            )
+            continue
+
+        kind = item.get("kind")
+        bbox = item.get("bbox")
+        outline = item.get("outline", "white")
+        fill = item.get("fill", None)
+        width = item.get("width", 1)
+
+        if not bbox:
+            continue
+
+        if kind == "rounded_rect":
+            draw.rounded_rectangle(
+                shift(bbox),
+                radius=item.get("radius", 0),
+                outline=outline,
+                fill=fill,
+                width=width,
+            )
+        elif kind == "rect":
+            draw.rectangle(shift(bbox), outline=outline, fill=fill, width=width)
+        elif kind == "ellipse":
+            draw.ellipse(shift(bbox), outline=outline, fill=fill, width=width)
+        elif kind in ("triangle_up", "triangle_down"):
+            pts = _triangle_points(
+                shift(bbox), item.get("size", 16), kind == "triangle_up"
+            )
+            draw.polygon(pts, outline=outline, fill=fill)
+        elif kind == "image":
+            image_path = item.get("image_path")
+            if image_path and os.path.exists(image_path):
+                try:
+                    x1, y1, x2, y2 = shift(bbox)
+
+                    target_w = x2 - x1
+                    target_h = y2 - y1
+
+                    overlay = RenderCache.Instance().overlay_image(
+                        image_path, target_w, target_h
+                    )
+
+                    px = x1 + (target_w - overlay.width) // 2
+                    py = y1 + (target_h - overlay.height) // 2
+
+                    img.paste(overlay, (px, py), overlay)
+                except Exception as e:
+                    print(f"Failed to draw overlay image: {e}")
+
+
+def compose(base: Image.Image, items: Dict[str, OverlayItem]) -> Image.Image:
+    """Full frame: a copy of base with every item drawn."""
+    img = base.copy()
+    draw_items(img, items.values())
+    return img
+
+
+# ---- dirty regions ----
+def _intersects(a: Rect, b: Rect) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _union(a: Rect, b: Rect) -> Rect:
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+def rect_area(rects: Iterable[Rect]) -> int:
+    return sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in rects)
+
+
+def dirty_rects(
+    old: Dict[str, OverlayItem], new: Dict[str, OverlayItem], size: Tuple[int, int]
+) -> List[Rect]:
+    """Merged, frame-clipped areas whose items were added, removed or changed."""
+    rects: List[Rect] = []
+    for key in old.keys() | new.keys():
+        before, after = old.get(key), new.get(key)
+        if before == after:
+            continue
+        for entry in (before, after):
+            if entry is not None:
+                extent = item_extent(*entry)
+                if extent is not None:
+                    rects.append(extent)
+
+    # merge overlapping areas until none overlap
+    merged: List[Rect] = []
+    for rect in rects:
+        while True:
+            for i, other in enumerate(merged):
+                if _intersects(rect, other):
+                    rect = _union(rect, merged.pop(i))
+                    break
+            else:
+                break
+        merged.append(rect)
+
+    w, h = size
+    clipped = []
+    for x1, y1, x2, y2 in merged:
+        x1, y1, x2, y2 = max(0, x1), max(0, y1), min(w, x2), min(h, y2)
+        if x1 < x2 and y1 < y2:
+            clipped.append((x1, y1, x2, y2))
+    return clipped
+
+
+def render_patches(
+    base: Image.Image, items: Dict[str, OverlayItem], rects: Iterable[Rect]
+) -> List[Tuple[Rect, Image.Image]]:
+    """For each rect: base pixels with every item touching it redrawn."""
+    rects = list(rects)
+    if not rects:
+        return []
+    extents = [(entry, item_extent(*entry)) for entry in items.values()]
+
+    patches = []
+    for rect in rects:
+        patch = base.crop(rect)
+        touching = [
+            entry
+            for entry, extent in extents
+            if extent is not None and _intersects(extent, rect)
+        ]
+        draw_items(patch, touching, origin=rect[:2])
+        patches.append((rect, patch))
+    return patches
@@ -0,0 +1,166 @@
+# PowerBudgetScheduler.py
+import threading
+import time
+from typing import Callable, Dict
+
+NUM_OF_ZONES = 8
+
+# send_fn({zone: power_percent}) performs the actual serial write
+ZoneOutputSender = Callable[[Dict[int, int]], None]
+
+
+class PowerBudgetScheduler:
+    """
+    Central gate for every zone power command (program, manual, reheat).
+
+    Two limits are enforced, both in "percent units" summed over all zones
+    (8 zones at 100% = 800):
+
+      - max_total_power:  the sum of all commanded outputs never exceeds this.
+                          Rises that do not fit are queued and granted as
+                          other zones drop.
+      - max_rise:         inrush budget; the total increase granted within one
+                          stagger window. Simultaneous rises are spread over
+                          successive windows of stagger_ms.
+
+    Decreases are always sent immediately. Grants are FIFO and may be
+    partial, so a queued zone steps up in chunks until it reaches its target.
+    """
+
+    def __init__(
+        self,
+        send_fn: ZoneOutputSender,
+        max_total_power: int = 800,
+        max_rise: int = 200,
+        stagger_ms: int = 100,
+    ):
+        self._send_fn = send_fn
+        self._lock = threading.RLock()
+
+        self._current: Dict[int, int] = {z: 0 for z in range(1, NUM_OF_ZONES + 1)}
+        self._target: Dict[int, int] = dict(self._current)
+        self._pending: list[int] = []  # zones waiting for a rise, FIFO
+
+        self._window_start = 0.0
+        self._rise_allowance = 0
+
+        self.configure(max_total_power, max_rise, stagger_ms)
+
+        self._wake = threading.Event()
+        self._worker = threading.Thread(
+            target=self._run, daemon=True, name="PowerBudget"
+        )
+        self._worker.start()
+
+    # ---- public API ----
+    def configure(self, max_total_power: int, max_rise: int, stagger_ms: int):
+        with self._lock:
+            self.max_total_power = max(0, int(max_total_power))
+            self.max_rise = max(1, int(max_rise))
+            self.stagger_s = max(0.01, float(stagger_ms) / 1000.0)
+            self._rise_allowance = min(self._rise_allowance, self.max_rise)
+
+    def request(self, outputs: Dict[int, int]):
+        """Request new zone outputs {zone: power_percent}."""
+        with self._lock:
+            drops: Dict[int, int] = {}
+
+            for zone, power in outputs.items():
+                power = max(0, min(100, int(power)))
+                self._target[zone] = power
+
+                if power <= self._current.get(zone, 0):
+                    # drops (and repeats) go straight out and cancel any queued rise
+                    if zone in self._pending:
+                        self._pending.remove(zone)
+                    drops[zone] = power
+                elif zone not in self._pending:
+                    self._pending.append(zone)
+
+            levels = dict(self._current)
+            levels.update(drops)
+            self._send({**drops, **self._grant_pending(levels)})
+
+            if self._pending:
+                self._wake.set()
+
+    def all_off(self):
+        """Forget all targets and queued rises; caller sends the all-off command."""
+        with self._lock:
+            self._pending.clear()
+            for zone in self._current:
+                self._current[zone] = 0
+                self._target[zone] = 0
+
+    def total_power(self) -> int:
+        with self._lock:
+            return sum(self._current.values())
+
+    def pending_zones(self) -> list[int]:
+        with self._lock:
+            return list(self._pending)
+
+    # ---- internals ----
+    def _refresh_window(self):
+        now = time.monotonic()
+        if now - self._window_start >= self.stagger_s:
+            self._window_start = now
+            self._rise_allowance = self.max_rise
+
+    def _grant_pending(self, levels: Dict[int, int]) -> Dict[int, int]:
+        """
+        New levels for the queued rises that fit both budgets on top of
+        levels. Nothing is committed; _send() does that once written.
+        """
+        self._refresh_window()
+
+        granted: Dict[int, int] = {}
+        allowance = self._rise_allowance
+        headroom = self.max_total_power - sum(levels.values())
+
+        for zone in list(self._pending):
+            budget = min(allowance, headroom)
+            if budget <= 0:
+                break
+
+            current = levels.get(zone, 0)
+            step = min(self._target[zone] - current, budget)
+            if step <= 0:
+                self._pending.remove(zone)
+                continue
+
+            granted[zone] = current + step
+            allowance -= step
+            headroom -= step
+
+        return granted
+
+    def _send(self, outputs: Dict[int, int]) -> bool:
+        """
+        Write outputs, then commit them. A failed write changes nothing:
+        dropped zones still count at their old power (the next request
+        resends them) and granted rises stay queued for the worker.
+        """
+        if not outputs:
+            return True
+        try:
+            self._send_fn(outputs)
+        except Exception as e:
+            print(f"[PowerBudgetScheduler] send failed: {e}")
+            return False
+
+        for zone, power in outputs.items():
+            self._rise_allowance -= max(0, power - self._current.get(zone, 0))
+            self._current[zone] = power
+            if zone in self._pending and power >= self._target[zone]:
+                self._pending.remove(zone)
+        return True
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            time.sleep(self.stagger_s)
+            with self._lock:
+                self._send(self._grant_pending(self._current))
+                if not self._pending:
+                    self._wake.clear()
@@ -0,0 +1,170 @@
+# ProgramAnalyzer.py
+import functools
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from SequenceStructure import NUM_OF_ZONES, Program
+
+# (t_start, t_end, power_start, power_end), power in percent, linear in between
+Segment = Tuple[float, float, float, float]
+
+ANALYSIS_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ProgramAnalysis:
+    """
+    Content-derived figures for one program. Energy is in percent-seconds
+    (one zone at 100% for one second = 100), so it does not depend on the
+    heater wattage; energy_wh() converts with a rated zone wattage.
+
+        zone_energy       per zone, percent-seconds
+        peak_power        highest sum of all zone outputs (percent units,
+                          8 zones at 100% = 800), the PSU load peak
+        max_step_rise     largest simultaneous jump up (inrush)
+        transitions       number of commanded power changes, all zones,
+                          including the initial switch-on and final switch-off
+        profile           total output vs time: [(t, percent)], linear
+                          between points; a jump has two points at the same t
+    """
+
+    total_seconds: float
+    zone_energy: Tuple[float, ...]
+    peak_power: float
+    max_step_rise: float
+    transitions: int
+    profile: Tuple[Tuple[float, float], ...]
+
+    @property
+    def total_energy(self) -> float:
+        return sum(self.zone_energy)
+
+    def energy_wh(self, zone_rated_watts: float) -> float:
+        return self.total_energy / 100.0 * float(zone_rated_watts) / 3600.0
+
+    def zone_energy_wh(self, zone_rated_watts: float) -> Tuple[float, ...]:
+        return tuple(e / 100.0 * float(zone_rated_watts) / 3600.0 for e in self.zone_energy)
+
+    def exceeds(self, max_total_power: float, max_rise: float) -> bool:
+        """True if the power budget will have to hold this program back."""
+        return self.peak_power > max_total_power or self.max_step_rise > max_rise
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": ANALYSIS_VERSION,
+            "total_seconds": self.total_seconds,
+            "zone_energy": [round(e, 3) for e in self.zone_energy],
+            "peak_power": round(self.peak_power, 3),
+            "max_step_rise": round(self.max_step_rise, 3),
+            "transitions": self.transitions,
+            "profile": [[round(t, 3), round(p, 3)] for t, p in self.profile],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["ProgramAnalysis"]:
+        """None for a missing or outdated catalog entry."""
+        if not isinstance(data, dict) or data.get("version") != ANALYSIS_VERSION:
+            return None
+        try:
+            return cls(
+                total_seconds=float(data["total_seconds"]),
+                zone_energy=tuple(float(e) for e in data["zone_energy"]),
+                peak_power=float(data["peak_power"]),
+                max_step_rise=float(data["max_step_rise"]),
+                transitions=int(data["transitions"]),
+                profile=tuple((float(t), float(p)) for t, p in data["profile"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+def zone_segments(program: Program, zone: int) -> List[Segment]:
+    """
+    Output of one zone over time, as CookingSequenceRunner drives it: a
+    ramp step moves linearly from the previous level to its power, and a
+    zone max_slew (%/s) limits how fast the output may move.
+    """
+    slew = program.max_slew(zone)
+    segments: List[Segment] = []
+    t = 0.0
+    level = 0.0
+    for power, duration, ramp in program.zone_steps_at(zone):
+        if duration <= 0:
+            continue
+        target = float(power)
+        if ramp:
+            slope = (target - level) / duration
+            if slew:
+                slope = max(-slew, min(slew, slope))
+            end = level + slope * duration
+            segments.append((t, t + duration, level, end))
+        elif slew and target != level:
+            move = min(duration, abs(target - level) / slew)
+            end = level + math.copysign(slew * move, target - level)
+            segments.append((t, t + move, level, end))
+            if move < duration:
+                segments.append((t + move, t + duration, end, end))
+        else:
+            end = target
+            segments.append((t, t + duration, end, end))
+        level = end
+        t += duration
+    return segments
+
+
+def _value_at(segments: List[Segment], t: float, from_left: bool) -> float:
+    for t0, t1, p0, p1 in segments:
+        inside = t0 < t <= t1 if from_left else t0 <= t < t1
+        if inside:
+            if t1 == t0:
+                return p1
+            return p0 + (p1 - p0) * (t - t0) / (t1 - t0)
+    return 0.0
+
+
+def _transitions(program: Program, zone: int) -> int:
+    count = 0
+    level = 0
+    for power, duration, _ramp in program.zone_steps_at(zone):
+        if duration <= 0:
+            continue
+        if power != level:
+            count += 1
+            level = power
+    return count + (1 if level else 0)
+
+
+@functools.lru_cache(maxsize=128)
+def analyze_program(program: Program) -> ProgramAnalysis:
+    """Analysis of program; cached per (immutable, hashable) Program."""
+    zones = [zone_segments(program, zone) for zone in range(NUM_OF_ZONES)]
+
+    zone_energy = tuple(
+        sum(((t1 - t0) * (p0 + p1) / 2.0 for t0, t1, p0, p1 in segments), 0.0)
+        for segments in zones
+    )
+
+    # Total output is piecewise linear, so its extremes are at breakpoints
+    times = sorted({t for segments in zones for seg in segments for t in seg[:2]})
+    profile: List[Tuple[float, float]] = []
+    peak = 0.0
+    max_rise = 0.0
+    for t in times:
+        left = [_value_at(segments, t, True) for segments in zones]
+        right = [_value_at(segments, t, False) for segments in zones]
+        total_left, total_right = sum(left), sum(right)
+        if total_left != total_right:
+            profile.append((t, total_left))
+        profile.append((t, total_right))
+        peak = max(peak, total_left, total_right)
+        max_rise = max(max_rise, sum(max(0.0, r - l) for l, r in zip(left, right)))
+
+    return ProgramAnalysis(
+        total_seconds=program.total_seconds,
+        zone_energy=zone_energy,
+        peak_power=peak,
+        max_step_rise=max_rise,
+        transitions=sum(_transitions(program, zone) for zone in range(NUM_OF_ZONES)),
+        profile=tuple(profile),
+    )
@@ -0,0 +1,188 @@
+# ProgramBatchDecoder.py
+"""
+Batch decoding of u94-encoded RFID programs with NumPy.
+
+decode_program_to_dict() handles one tag read at a time, character by
+character. For provisioning (validating a tag archive or a server feed of
+thousands of payloads) decode_programs_batch() decodes every payload in a
+single pass over one uint8 array:
+
+    result = decode_programs_batch(payloads)
+    result.valid            # bool mask, one entry per payload
+    result.errors           # {payload index: message}
+    result.power            # (n, 32) uint8, row-major zone * 4 + step
+    result.duration         # (n, 32) float64 seconds
+    result.programs()       # {payload index: Program} for the valid ones
+
+Validation matches the single-payload decoder: description present, data
+exactly ENCODED_PROGRAM_DATA_LENGTH characters from "!" to "~", power
+within 0-100. Variable-length v2 payloads are decoded one by one with
+decode_program_to_dict() and merged into the same arrays.
+
+Run bench_u94_decode.py to compare against the per-payload path.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from SequenceStructure import (
+    ENCODED_DURATION_WIDTH,
+    ENCODED_POWER_WIDTH,
+    ENCODED_PROGRAM_DATA_LENGTH,
+    ENCODED_STEP_WIDTH,
+    ENCODED_V2_MARKER,
+    NUM_OF_STEPS,
+    NUM_OF_ZONES,
+    U94_BASE,
+    U94_FIRST_ASCII,
+    Program,
+    decode_program_to_dict,
+)
+
+_STEP_COUNT = NUM_OF_ZONES * NUM_OF_STEPS
+
+
+@dataclass
+class BatchDecodeResult:
+    descriptions: List[str]
+    power: np.ndarray
+    duration: np.ndarray
+    valid: np.ndarray
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.descriptions)
+
+    @property
+    def valid_count(self) -> int:
+        return int(self.valid.sum())
+
+    def program(self, index: int) -> Program:
+        if not self.valid[index]:
+            raise ValueError(self.errors.get(index, "Invalid payload"))
+        return Program(
+            self.descriptions[index],
+            tuple(self.power[index].tolist()),
+            tuple(self.duration[index].tolist()),
+            (False,) * _STEP_COUNT,
+            (None,) * NUM_OF_ZONES,
+        )
+
+    def programs(self) -> Dict[int, Program]:
+        return {int(i): self.program(int(i)) for i in np.flatnonzero(self.valid)}
+
+
+def _u94_values(digits: np.ndarray, width: int) -> np.ndarray:
+    """Combine the last axis of width u94 digits into one value."""
+    value = np.zeros(digits.shape[:-1], dtype=np.int32)
+    for k in range(width):
+        value = value * U94_BASE + digits[..., k]
+    return value
+
+
+def _bad_character_message(character: str) -> str:
+    # same wording as decode_u94()
+    return (
+        f"Invalid u94 character {character!r}. "
+        'Valid characters are "!" through "~".'
+    )
+
+
+def decode_programs_batch(encoded_programs: Sequence[str]) -> BatchDecodeResult:
+    n = len(encoded_programs)
+    descriptions = [""] * n
+    errors: Dict[int, str] = {}
+
+    # Split "description,data" per payload (plain string ops); everything
+    # after this is array arithmetic over all payloads at once.
+    rows: List[int] = []
+    data_parts: List[str] = []
+    v2_rows: List[int] = []
+    for i, encoded in enumerate(encoded_programs):
+        if encoded is None:
+            errors[i] = "Encoded program cannot be None"
+            continue
+        encoded = encoded.strip("\r\n\x00")
+        comma_index = encoded.find(",")
+        if comma_index < 0:
+            errors[i] = (
+                "Encoded program must contain a comma between the "
+                "description and encoded program data"
+            )
+            continue
+        description = encoded[:comma_index].strip()
+        data = encoded[comma_index + 1:]
+        if not description:
+            errors[i] = "Program description cannot be empty"
+            continue
+        if len(data) != ENCODED_PROGRAM_DATA_LENGTH and data.startswith(
+            ENCODED_V2_MARKER
+        ):
+            v2_rows.append(i)
+            continue
+        if len(data) != ENCODED_PROGRAM_DATA_LENGTH:
+            errors[i] = (
+                "Encoded program data has the wrong length. "
+                f"Expected {ENCODED_PROGRAM_DATA_LENGTH} characters, "
+                f"received {len(data)}."
+            )
+            continue
+        if not data.isascii():
+            errors[i] = _bad_character_message(
+                next(c for c in data if not c.isascii())
+            )
+            continue
+        descriptions[i] = description
+        rows.append(i)
+        data_parts.append(data)
+
+    power = np.zeros((n, _STEP_COUNT), dtype=np.uint8)
+    duration = np.zeros((n, _STEP_COUNT), dtype=np.float64)
+    valid = np.zeros(n, dtype=bool)
+
+    if rows:
+        raw = np.frombuffer("".join(data_parts).encode("ascii"), dtype=np.uint8)
+        digits = raw.reshape(len(rows), _STEP_COUNT, ENCODED_STEP_WIDTH).astype(
+            np.int32
+        ) - U94_FIRST_ASCII
+
+        bad_digit = (digits < 0) | (digits >= U94_BASE)
+        bad_char = bad_digit.any(axis=(1, 2))
+        step_power = _u94_values(digits[..., :ENCODED_POWER_WIDTH], ENCODED_POWER_WIDTH)
+        step_duration = _u94_values(
+            digits[..., ENCODED_POWER_WIDTH:], ENCODED_DURATION_WIDTH
+        )
+        bad_power = (step_power > 100) & ~bad_char[:, None]
+
+        ok = ~(bad_char | bad_power.any(axis=1))
+        rows_arr = np.asarray(rows)
+        power[rows_arr[ok]] = step_power[ok]
+        duration[rows_arr[ok]] = step_duration[ok]
+        valid[rows_arr[ok]] = True
+
+        for r in np.flatnonzero(bad_char):
+            pos = int(np.argmax(bad_digit[r].ravel()))  # first bad character
+            errors[rows[r]] = _bad_character_message(data_parts[r][pos])
+        for r, pos in zip(*np.nonzero(bad_power)):
+            if rows[r] in errors:
+                continue  # report the first bad step only
+            zone, step = divmod(int(pos), NUM_OF_STEPS)
+            errors[rows[r]] = (
+                f"Zone {zone + 1}, step {step + 1}: decoded power "
+                f"{int(step_power[r, pos])} is outside the valid range 0-100"
+            )
+
+    for i in v2_rows:
+        try:
+            decoded = decode_program_to_dict(encoded_programs[i])
+        except ValueError as e:
+            errors[i] = str(e)
+            continue
+        steps = [step for zone in decoded["zone_sequences"] for step in zone["steps"]]
+        descriptions[i] = decoded["description"]
+        power[i] = [step["power"] for step in steps]
+        duration[i] = [step["duration"] for step in steps]
+        valid[i] = True
+
+    return BatchDecodeResult(descriptions, power, duration, valid, errors)
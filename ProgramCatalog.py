@@ -0,0 +1,228 @@
+# ProgramCatalog.py
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from FileStore import FileStore
+from ProgramAnalyzer import ANALYSIS_VERSION, ProgramAnalysis, analyze_program
+from ProgramFormat import decode_program_file
+from SequenceStructure import Program
+from SingletonBase import SingletonBase
+from hmi_consts import PROGRAMS_DIR, PROGRAM_CATALOG_FILE
+
+PROGRAM_COUNT = 36
+CATALOG_VERSION = 2
+
+
+def program_path(idx: int) -> str:
+    return os.path.join(PROGRAMS_DIR, f"program{idx}.alt")
+
+
+def format_total_time(seconds_total: float) -> str:
+    total = max(0, int(round(seconds_total)))
+    if total >= 3600:
+        h = total // 3600
+        m = (total % 3600) // 60
+        return f"{h}:{m:02d}"
+    else:
+        m = total // 60
+        s = total % 60
+        return f"{m:02d}:{s:02d}"
+
+
+def total_seconds_from_zone_sequences(zone_sequences: List[Dict[str, Any]]) -> float:
+    zone_totals = []
+    for z in zone_sequences or []:
+        steps = z.get("steps", [])
+        z_total = 0.0
+        for st in steps:
+            try:
+                z_total += float(st.get("duration", 0.0))
+            except Exception:
+                pass
+        zone_totals.append(z_total)
+    return max(zone_totals) if zone_totals else 0.0
+
+
+def compute_total_time_from_zone_sequences(
+    zone_sequences: List[Dict[str, Any]],
+) -> str:
+    return format_total_time(total_seconds_from_zone_sequences(zone_sequences))
+
+
+def _analysis_current(entry: Dict[str, Any]) -> bool:
+    analysis = entry.get("analysis")
+    return analysis is None or analysis.get("version") == ANALYSIS_VERSION
+
+
+class ProgramCatalog(SingletonBase):
+    """
+    Persistent index of the program files (programs/catalog.json).
+
+    One entry per program number:
+
+        {
+            "description": "Program 1",
+            "total_time": "03:05",
+            "total_seconds": 185.0,
+            "mtime_ns": ..., "size": ...,
+            "hash": "<sha1 of the file bytes>",
+            "analysis": {...}   # ProgramAnalysis.to_dict(), None if unreadable
+        }
+
+    entries() only stats the program files; a file is read again only when
+    its mtime/size changed, and parsed only when its hash changed. Saves
+    call update() so the index never has to rescan after an edit. The
+    analysis (energy, peak power, profile) is therefore computed once per
+    file content. Nothing here touches the SequenceCollection singleton.
+    """
+
+    def __init_once__(self, path=PROGRAM_CATALOG_FILE):
+        self._path = str(path)
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    # ---- public API ----
+    def entries(self, indices: Iterable[int]) -> List[Dict[str, Any]]:
+        """Catalog entries (with "index") for indices, refreshing stale ones."""
+        with self._lock:
+            result = []
+            for idx in indices:
+                entry = self._refresh(idx)
+                result.append(dict(entry, index=idx))
+            self._save_if_dirty()
+            return result
+
+    def get(self, idx: int) -> Dict[str, Any]:
+        return self.entries([idx])[0]
+
+    def analysis(self, idx: int) -> Optional[ProgramAnalysis]:
+        return ProgramAnalysis.from_dict(self.get(idx).get("analysis"))
+
+    def update(self, idx: int, program: Optional[Program] = None) -> None:
+        """
+        Record a program file that was just written. When the Program that
+        was written is passed in, the file is hashed but not decoded again.
+        """
+        with self._lock:
+            self._refresh(idx, program=program, force=True)
+            self._save_if_dirty()
+
+    def invalidate(self, idx: int) -> None:
+        with self._lock:
+            if self._entries.pop(str(idx), None) is not None:
+                self._dirty = True
+                self._save_if_dirty()
+
+    # ---- internals ----
+    def _load(self):
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CATALOG_VERSION and isinstance(
+                data.get("programs"), dict
+            ):
+                self._entries = data["programs"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[ProgramCatalog] load failed, rebuilding: {e}")
+            self._entries = {}
+
+    def _save_if_dirty(self):
+        if not self._dirty:
+            return
+        try:
+            FileStore.Instance().write_json(
+                self._path,
+                {"version": CATALOG_VERSION, "programs": self._entries},
+                indent=1,
+            )
+            self._dirty = False
+        except Exception as e:
+            print(f"[ProgramCatalog] save failed: {e}")
+
+    def _refresh(
+        self,
+        idx: int,
+        program: Optional[Program] = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        key = str(idx)
+        entry = self._entries.get(key)
+        path = program_path(idx)
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            missing = {
+                "description": f"Program {idx}",
+                "total_time": format_total_time(0),
+                "total_seconds": 0.0,
+                "mtime_ns": None,
+                "size": None,
+                "hash": None,
+                "analysis": None,
+            }
+            if entry != missing:
+                self._entries[key] = missing
+                self._dirty = True
+            return missing
+
+        if (
+            not force
+            and entry is not None
+            and entry.get("mtime_ns") == st.st_mtime_ns
+            and entry.get("size") == st.st_size
+            and _analysis_current(entry)
+        ):
+            return entry
+
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            print(f"[ProgramCatalog] read {path} failed: {e}")
+            return entry or {}
+
+        digest = hashlib.sha1(raw).hexdigest()
+
+        if (
+            entry is not None
+            and entry.get("hash") == digest
+            and program is None
+            and _analysis_current(entry)
+        ):
+            # touched but unchanged
+            entry = dict(entry, mtime_ns=st.st_mtime_ns, size=st.st_size)
+        else:
+            if program is None:
+                try:
+                    program = decode_program_file(raw, idx)
+                except Exception:
+                    program = None
+            if program is not None:
+                description = program.description or f"Program {idx}"
+                total_seconds = program.total_seconds
+                analysis = analyze_program(program).to_dict()
+            else:
+                description = f"Program {idx}"
+                total_seconds = 0.0
+                analysis = None
+            entry = {
+                "description": description,
+                "total_time": format_total_time(total_seconds),
+                "total_seconds": total_seconds,
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "hash": digest,
+                "analysis": analysis,
+            }
+
+        self._entries[key] = entry
+        self._dirty = True
+        return entry
@@ -0,0 +1,219 @@
+# ProgramFormat.py
+import json
+import math
+import mmap
+import struct
+import zlib
+from typing import Any, Dict, Iterable, Tuple
+
+from FileStore import loads_json
+from SequenceStructure import NUM_OF_STEPS, NUM_OF_ZONES, Program
+
+# ----------------------------------------------------------------------
+# Binary program record (little-endian)
+#
+#   header  magic "ALTP", version, zones, steps, flags,
+#           description length (u16), crc32 of everything after the header
+#   body    description (utf-8)
+#           power     zones*steps x u8
+#           duration  zones*steps x f64 (seconds)
+#           ramp      u32 bit mask, bit i = step i (row-major)
+#           max_slew  zones x f64, NaN = no limit
+#
+# A full 8x4 record with a short description is ~370 bytes and decodes
+# with two struct.unpack_from calls, straight into a Program.
+# ----------------------------------------------------------------------
+PROGRAM_MAGIC = b"ALTP"
+PROGRAM_FORMAT_VERSION = 1
+
+_STEP_COUNT = NUM_OF_ZONES * NUM_OF_STEPS
+_HEADER = struct.Struct("<4sBBBBHI")
+_BODY = struct.Struct(f"<{_STEP_COUNT}B{_STEP_COUNT}dI{NUM_OF_ZONES}d")
+
+# Library bundle: magic "ALTB", version, program count, then per program
+# its number (u32) followed by one program record.
+BUNDLE_MAGIC = b"ALTB"
+BUNDLE_FORMAT_VERSION = 1
+_BUNDLE_HEADER = struct.Struct("<4sBxH")
+_BUNDLE_ENTRY = struct.Struct("<I")
+
+JSON_LIBRARY_VERSION = 1
+
+
+def is_binary_program(raw) -> bool:
+    return bytes(raw[:4]) == PROGRAM_MAGIC
+
+
+def encode_program(program: Program) -> bytes:
+    description = program.description.encode("utf-8")
+    if len(description) > 0xFFFF:
+        raise ValueError("Program description is too long")
+
+    ramp_mask = 0
+    for i, ramp in enumerate(program._ramp):
+        if ramp:
+            ramp_mask |= 1 << i
+
+    body = description + _BODY.pack(
+        *program._power,
+        *program._duration,
+        ramp_mask,
+        *(math.nan if slew is None else float(slew) for slew in program._max_slew),
+    )
+    header = _HEADER.pack(
+        PROGRAM_MAGIC,
+        PROGRAM_FORMAT_VERSION,
+        NUM_OF_ZONES,
+        NUM_OF_STEPS,
+        0,
+        len(description),
+        zlib.crc32(body),
+    )
+    return header + body
+
+
+def decode_program(buf, offset: int = 0) -> Tuple[Program, int]:
+    """
+    Decode one record from buf (bytes, memoryview or mmap) at offset.
+    Returns (program, offset after the record). Raises ValueError.
+    """
+    # released on return so an mmap passed in can be closed
+    with memoryview(buf) as view:
+        if len(view) - offset < _HEADER.size:
+            raise ValueError("Truncated program record")
+
+        magic, version, zones, steps, _flags, desc_len, crc = _HEADER.unpack_from(
+            view, offset
+        )
+        if magic != PROGRAM_MAGIC:
+            raise ValueError("Not a binary program record")
+        if version != PROGRAM_FORMAT_VERSION:
+            raise ValueError(f"Unsupported program format version {version}")
+        if (zones, steps) != (NUM_OF_ZONES, NUM_OF_STEPS):
+            raise ValueError(f"Program has {zones}x{steps} steps, expected "
+                             f"{NUM_OF_ZONES}x{NUM_OF_STEPS}")
+
+        start = offset + _HEADER.size
+        end = start + desc_len + _BODY.size
+        if end > len(view):
+            raise ValueError("Truncated program record")
+        if zlib.crc32(view[start:end]) != crc:
+            raise ValueError("Program record checksum mismatch")
+
+        description = bytes(view[start:start + desc_len]).decode("utf-8")
+        values = _BODY.unpack_from(view, start + desc_len)
+
+        power = values[:_STEP_COUNT]
+        duration = values[_STEP_COUNT:2 * _STEP_COUNT]
+        ramp_mask = values[2 * _STEP_COUNT]
+        slews = values[2 * _STEP_COUNT + 1:]
+
+        if max(power) > 100:
+            raise ValueError(f"Step power {max(power)} is outside the valid range 0-100")
+        if not all(d >= 0 and math.isfinite(d) for d in duration):
+            raise ValueError("Step duration must be a finite, non-negative number")
+
+        program = Program(
+            description,
+            power,
+            duration,
+            tuple(bool(ramp_mask >> i & 1) for i in range(_STEP_COUNT)),
+            tuple(None if math.isnan(slew) else slew for slew in slews),
+        )
+    return program, end
+
+
+def decode_program_file(raw: bytes, number: int) -> Program:
+    """
+    Program from the content of a program<N>.alt file, binary or JSON
+    (files copied in by older tools). Raises ValueError.
+    """
+    if is_binary_program(raw):
+        return decode_program(raw)[0]
+
+    payload = loads_json(raw.decode("utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid payload")
+    return Program.from_dict(
+        payload, description=str(payload.get("description", f"Program {number}"))
+    )
+
+
+# ---- library bundles ----
+def encode_bundle(programs: Dict[int, Program]) -> bytes:
+    if len(programs) > 0xFFFF:
+        raise ValueError("Too many programs for one bundle")
+    parts = [_BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, len(programs))]
+    for number in sorted(programs):
+        parts.append(_BUNDLE_ENTRY.pack(int(number)))
+        parts.append(encode_program(programs[number]))
+    return b"".join(parts)
+
+
+def decode_bundle(buf) -> Dict[int, Program]:
+    with memoryview(buf) as view:
+        if len(view) < _BUNDLE_HEADER.size:
+            raise ValueError("Truncated program bundle")
+        magic, version, count = _BUNDLE_HEADER.unpack_from(view, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError("Not a program bundle")
+        if version != BUNDLE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported bundle format version {version}")
+
+        programs: Dict[int, Program] = {}
+        offset = _BUNDLE_HEADER.size
+        for _ in range(count):
+            if offset + _BUNDLE_ENTRY.size > len(view):
+                raise ValueError("Truncated program bundle")
+            (number,) = _BUNDLE_ENTRY.unpack_from(view, offset)
+            programs[number], offset = decode_program(view, offset + _BUNDLE_ENTRY.size)
+    return programs
+
+
+def programs_to_json(programs: Dict[int, Program]) -> Dict[str, Any]:
+    """JSON library document: {"version": 1, "programs": {"<n>": {...}}}."""
+    return {
+        "version": JSON_LIBRARY_VERSION,
+        "programs": {
+            str(number): {
+                "description": program.description,
+                "zone_sequences": program.to_dict()["zone_sequences"],
+            }
+            for number, program in sorted(programs.items())
+        },
+    }
+
+
+def programs_from_json(data: Dict[str, Any]) -> Dict[int, Program]:
+    if not isinstance(data, dict) or not isinstance(data.get("programs"), dict):
+        raise ValueError("Not a program library document")
+    if data.get("version") != JSON_LIBRARY_VERSION:
+        raise ValueError(f"Unsupported library version {data.get('version')}")
+    return {
+        int(number): Program.from_dict(payload)
+        for number, payload in data["programs"].items()
+    }
+
+
+def read_library(path: str) -> Dict[int, Program]:
+    """Programs from a bundle (.altb, mmap'ed) or a JSON library (.json)."""
+    with open(path, "rb") as f:
+        if str(path).lower().endswith(".json"):
+            return programs_from_json(loads_json(f.read().decode("utf-8")))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return decode_bundle(mm)
+
+
+def library_bytes(path: str, programs: Dict[int, Program]) -> bytes:
+    """Content to write for path: JSON for .json, otherwise a binary bundle."""
+    if str(path).lower().endswith(".json"):
+        return json.dumps(programs_to_json(programs), indent=2).encode("utf-8")
+    return encode_bundle(programs)
+
+
+def iter_program_numbers(names: Iterable[str]) -> Iterable[int]:
+    for name in names:
+        if name.startswith("program") and name.endswith(".alt"):
+            digits = name[len("program"):-len(".alt")]
+            if digits.isdigit():
+                yield int(digits)
@@ -0,0 +1,133 @@
+# ProgramRepository.py
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from FileStore import FileStore
+from ProgramFormat import decode_program_file
+from SingletonBase import SingletonBase
+from SequenceStructure import Program
+from ProgramCatalog import program_path
+
+PROGRAM_CACHE_SIZE = 16
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    program: Program
+    mtime_ns: int
+    size: int
+    hash: str
+
+
+class ProgramRepository(SingletonBase):
+    """
+    Shared read path for program files, used by every cook path.
+
+    get(number) returns an immutable Program from an LRU cache. A cached
+    entry is reused while the file's mtime/size are unchanged; if they
+    changed, the file is read and hashed, and only re-parsed and
+    re-validated when the content hash differs. A binary record whose CRC
+    does not match is treated as invalid; a JSON file (older tools) with a
+    stale "_checksum" was edited outside the HMI and is used with a
+    warning, as FileStore.loads_json() does. Writers call invalidate()
+    after saving.
+    """
+
+    def __init_once__(self, capacity: int = PROGRAM_CACHE_SIZE):
+        self._capacity = max(1, int(capacity))
+        self._lock = threading.RLock()
+        self._cache: "OrderedDict[int, _CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # ---- public API ----
+    def get(self, number: int) -> Optional[Program]:
+        """The program, or None if the file is missing or invalid."""
+        number = int(number)
+        path = program_path(number)
+
+        store = FileStore.Instance()
+        if store.has_pending(path):
+            # saved moments ago and not on storage yet: use the queued content
+            return self._decode(number, store.read_bytes(path))
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.invalidate(number)
+            return None
+
+        with self._lock:
+            cached = self._cache.get(number)
+            if (
+                cached is not None
+                and cached.mtime_ns == st.st_mtime_ns
+                and cached.size == st.st_size
+            ):
+                self._cache.move_to_end(number)
+                self.hits += 1
+                return cached.program
+
+        entry = self._load(number, path, st, cached)
+
+        with self._lock:
+            if entry is None:
+                self._cache.pop(number, None)
+                return None
+            self._cache[number] = entry
+            self._cache.move_to_end(number)
+            while len(self._cache) > self._capacity:
+                self._cache.popitem(last=False)
+            return entry.program
+
+    def preload(self, numbers: Iterable[int]) -> None:
+        for number in numbers:
+            self.get(number)
+
+    def invalidate(self, number: int) -> None:
+        with self._lock:
+            self._cache.pop(int(number), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    # ---- internals ----
+    def _load(
+        self, number: int, path: str, st: os.stat_result, cached: Optional[_CacheEntry]
+    ) -> Optional[_CacheEntry]:
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            print(f"[ProgramRepository] read {path} failed: {e}")
+            return None
+
+        digest = hashlib.sha1(raw).hexdigest()
+
+        if cached is not None and cached.hash == digest:
+            with self._lock:
+                self.hits += 1
+            return _CacheEntry(cached.program, st.st_mtime_ns, st.st_size, digest)
+
+        with self._lock:
+            self.misses += 1
+
+        program = self._decode(number, raw)
+        if program is None:
+            return None
+        return _CacheEntry(program, st.st_mtime_ns, st.st_size, digest)
+
+    @staticmethod
+    def _decode(number: int, raw: Optional[bytes]) -> Optional[Program]:
+        if raw is None:
+            return None
+        try:
+            return decode_program_file(raw, number)
+        except Exception as e:
+            print(f"[ProgramRepository] program{number} invalid: {e}")
+            return None
@@ -0,0 +1,277 @@
+# RenderCache.py
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from PIL import Image
+
+from AssetDiskCache import AssetDiskCache, scaled_size
+from SingletonBase import SingletonBase
+from hmi_consts import HMISizePos
+
+# Memory budgets; a 1280x800 RGBA frame is 4 MB.
+BASE_CACHE_BYTES = 64 * 1024 * 1024
+FRAME_CACHE_BYTES = 48 * 1024 * 1024
+OVERLAY_CACHE_BYTES = 16 * 1024 * 1024
+
+
+def image_bytes(width: int, height: int) -> int:
+    return int(width) * int(height) * 4
+
+
+class BudgetLru:
+    """Thread-safe LRU bounded by the summed cost (bytes) of its values."""
+
+    def __init__(self, name: str, budget_bytes: int):
+        self.name = name
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Like get(), but not counted and without touching the LRU order."""
+        with self._lock:
+            item = self._items.get(key)
+            return None if item is None else item[0]
+
+    def put(self, key: Hashable, value: Any, cost: int) -> None:
+        cost = max(0, int(cost))
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if cost > self.budget_bytes:
+                return
+            self._items[key] = (value, cost)
+            self._bytes += cost
+            while self._bytes > self.budget_bytes:
+                _, (_, evicted_cost) = self._items.popitem(last=False)
+                self._bytes -= evicted_cost
+                self.evictions += 1
+
+    def discard_if(self, predicate: Callable[[Hashable], bool]) -> int:
+        with self._lock:
+            keys = [key for key in self._items if predicate(key)]
+            for key in keys:
+                self._bytes -= self._items.pop(key)[1]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._items),
+                "bytes": self._bytes,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def _file_version(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def overlay_state_hash(page_obj) -> str:
+    """
+    Hash of everything OverlayRenderer draws for page_obj: overlay_shapes,
+    overlay_text, and the version of every overlay image file.
+    """
+    h = hashlib.sha1()
+    for attr in ("overlay_shapes", "overlay_text"):
+        h.update(attr.encode())
+        for item in getattr(page_obj, attr, None) or []:
+            h.update(repr(sorted(item.items(), key=lambda kv: kv[0])).encode())
+            image_path = item.get("image_path")
+            if image_path:
+                try:
+                    h.update(repr(_file_version(image_path)).encode())
+                except OSError:
+                    h.update(b"missing")
+    return h.hexdigest()
+
+
+class RenderCache(SingletonBase):
+    """
+    Decoded page images and fully composed page frames for ImageHotspotView.
+
+        base_image(path, size=None)
+                             RGBA PIL image of an asset at the active
+                             HMISizePos profile (size: a fixed design size,
+                             e.g. an icon), decoded once per file version
+                             (mtime/size) -- or mapped, already scaled, from
+                             the AssetDiskCache without decoding. Shared
+                             and possibly read-only: copy() it before
+                             drawing on it.
+        frame_key(page_obj)  page class + image + overlay-state hash
+        overlay_image(path, w, h)
+                             an overlay image scaled to fit w x h, per
+                             file version and target size
+        get_frame / put_frame
+                             composed frames (the view stores its
+                             PhotoImage), so returning to a page that looks
+                             the same, or scrolling back, does no decode,
+                             drawing or conversion.
+
+    Both caches are LRU within a byte budget. stats() reports hit rates.
+    """
+
+    def __init_once__(
+        self,
+        base_budget: int = BASE_CACHE_BYTES,
+        frame_budget: int = FRAME_CACHE_BYTES,
+        overlay_budget: int = OVERLAY_CACHE_BYTES,
+    ):
+        self.bases = BudgetLru("base", base_budget)
+        self.frames = BudgetLru("frame", frame_budget)
+        self.overlays = BudgetLru("overlay", overlay_budget)
+        self._decode_lock = threading.Lock()
+        self._decoding: Dict[Tuple, threading.Event] = {}
+
+    # ---- decoded assets ----
+    def base_image(
+        self, path: str, profile: Optional[str] = None, size=None
+    ) -> Image.Image:
+        """
+        Decoded RGBA image for path at resolution profile (default: the
+        active one), or at design size scaled for it. Raises OSError if it
+        can't be read. If another thread (the preloader) is decoding the
+        same variant, waits for its result instead of decoding it twice.
+        """
+        profile = profile or HMISizePos.SCREEN_RES
+        size = None if size is None else (int(size[0]), int(size[1]))
+        key = (os.path.abspath(path), *_file_version(path), profile, size)
+        img = self.bases.get(key)
+        if img is not None:
+            return img
+
+        with self._decode_lock:
+            img = self.bases.peek(key)
+            if img is not None:
+                return img
+            pending = self._decoding.get(key)
+            if pending is None:
+                self._decoding[key] = threading.Event()
+
+        if pending is not None:
+            pending.wait()
+            img = self.bases.peek(key)
+            if img is not None:
+                return img
+            # the other decode failed (or the budget refused it)
+            return self.decode(path, profile, size)
+
+        try:
+            img = self.decode(path, profile, size)
+            self.bases.put(key, img, image_bytes(*img.size))
+            return img
+        finally:
+            with self._decode_lock:
+                self._decoding.pop(key).set()
+
+    def has_base_image(
+        self, path: str, profile: Optional[str] = None, size=None
+    ) -> bool:
+        profile = profile or HMISizePos.SCREEN_RES
+        size = None if size is None else (int(size[0]), int(size[1]))
+        try:
+            key = (os.path.abspath(path), *_file_version(path), profile, size)
+        except OSError:
+            return False
+        return self.bases.peek(key) is not None
+
+    @staticmethod
+    def decode(path: str, profile: Optional[str] = None, size=None) -> Image.Image:
+        """
+        The pre-scaled variant from the disk cache if it is current. On a
+        miss: decode, scale (logged -- the preloader or AssetDiskCache.py
+        should have built it) and store it, so it happens once per asset.
+        """
+        profile = profile or HMISizePos.SCREEN_RES
+        disk = AssetDiskCache.Instance()
+        img = disk.load(path, profile, size)
+        if img is not None:
+            return img
+
+        with Image.open(path) as f:
+            img = f.convert("RGBA")
+        target = scaled_size(size or img.size, profile)
+        if target != img.size:
+            print(
+                f"[RenderCache] {os.path.basename(path)}: no cached "
+                f"{target[0]}x{target[1]} variant, resizing"
+            )
+            img = img.resize(target, Image.LANCZOS)
+        disk.store(path, img, profile, size)
+        return img
+
+    def overlay_image(self, path: str, width: int, height: int) -> Image.Image:
+        """path scaled down (aspect kept, LANCZOS) to fit width x height."""
+        key = (os.path.abspath(path), *_file_version(path), int(width), int(height))
+        img = self.overlays.get(key)
+        if img is None:
+            img = self.base_image(path).copy()
+            img.thumbnail((width, height), Image.LANCZOS)
+            self.overlays.put(key, img, image_bytes(*img.size))
+        return img
+
+    # ---- composed frames ----
+    def frame_key(self, page_obj) -> Tuple:
+        path = page_obj.image_path
+        return (
+            type(page_obj).__name__,
+            os.path.abspath(path),
+            *_file_version(path),
+            overlay_state_hash(page_obj),
+        )
+
+    def get_frame(self, key: Tuple) -> Optional[Any]:
+        return self.frames.get(key)
+
+    def put_frame(self, key: Tuple, frame: Any, width: int, height: int) -> None:
+        self.frames.put(key, frame, image_bytes(width, height))
+
+    # ---- housekeeping ----
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop everything cached for path (or everything)."""
+        if path is None:
+            self.bases.clear()
+            self.frames.clear()
+            self.overlays.clear()
+            return
+        path = os.path.abspath(path)
+        self.bases.discard_if(lambda key: key[0] == path)
+        self.frames.discard_if(lambda key: key[1] == path)
+        self.overlays.discard_if(lambda key: key[0] == path)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "base": self.bases.stats(),
+            "frame": self.frames.stats(),
+            "overlay": self.overlays.stats(),
+            "disk": AssetDiskCache.Instance().stats(),
+        }
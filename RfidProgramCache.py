@@ -0,0 +1,68 @@
+# RfidProgramCache.py
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+
+from SingletonBase import SingletonBase
+from SequenceStructure import Program, decode_program_to_dict
+
+RFID_CACHE_SIZE = 64
+
+
+def payload_key(encoded_program: str) -> str:
+    """Content hash of an RFID payload, after the serial framing is removed."""
+    normalized = encoded_program.strip("\r\n\x00")
+    return hashlib.sha1(normalized.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class RfidProgramCache(SingletonBase):
+    """
+    Content-addressed cache of decoded RFID programs: payload hash ->
+    validated, immutable Program (LRU, RFID_CACHE_SIZE entries).
+
+    The same few meal tags are scanned over and over, so a repeated read
+    skips decoding and validation. Invalid payloads are not cached; get()
+    raises ValueError for them every time.
+    """
+
+    def __init_once__(self, capacity: int = RFID_CACHE_SIZE):
+        self._capacity = max(1, int(capacity))
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, Program]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, encoded_program: str) -> Program:
+        if not isinstance(encoded_program, str):
+            raise ValueError("Encoded program must be a string")
+
+        key = payload_key(encoded_program)
+        with self._lock:
+            program = self._cache.get(key)
+            if program is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return program
+            self.misses += 1
+
+        program = Program.from_dict(decode_program_to_dict(encoded_program))
+
+        with self._lock:
+            self._cache[key] = program
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._capacity:
+                self._cache.popitem(last=False)
+        return program
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._cache),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
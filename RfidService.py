@@ -0,0 +1,251 @@
+# RfidService.py
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from RfidProgramCache import RfidProgramCache
+from SequenceStructure import Program
+
+READ_COMMAND = "D\r"
+READ_DELAY_MS = 20  # reader settle time between "tag present" and "D"
+READ_TIMEOUT_MS = 500
+READ_RETRIES = 2
+DEBOUNCE_MS = 1500  # repeated "N=1" for the same tag within this are ignored
+REPLY_WINDOW_MS = 2000  # a "D" unanswered for this long gets no reply
+
+
+@dataclass(frozen=True)
+class RfidRead:
+    """One decoded tag. Timestamps are time.monotonic() seconds."""
+
+    payload: str
+    program: Program
+    read_id: int
+    attempts: int
+    tag_seen_at: float
+    decoded_at: float
+
+    @property
+    def read_ms(self) -> float:
+        return (self.decoded_at - self.tag_seen_at) * 1000.0
+
+
+class RfidService:
+    """
+    Owns the RFID reader protocol, whatever page is shown:
+
+        "N=1"  tag present  -> (after READ_DELAY_MS) send "D"
+        "N=0"  tag removed  -> in-flight read cancelled
+        "D=.." tag data     -> decoded via RfidProgramCache, RfidRead published
+
+    Only one read is in flight at a time. "N=1" while a read is in flight,
+    or within DEBOUNCE_MS of the last published read without the tag being
+    removed in between, is ignored. A read that gets no valid "D=" within
+    READ_TIMEOUT_MS is re-sent up to READ_RETRIES times.
+
+    "D=" carries no tag id, but the reader answers commands in order, so
+    every "D" sent is queued with the id of the read it belongs to and each
+    "D=" is matched to the oldest one. A reply to an earlier read (late
+    answer after "N=0", a cancel or a give-up) is rejected as stale even
+    when a new read is already in flight, as is a "D=" with no "D"
+    outstanding. Commands unanswered for REPLY_WINDOW_MS are forgotten.
+
+    Listeners get an RfidRead on the UI thread (SerialService dispatches
+    lines through tk_root.after). Whoever acts on it calls
+    record_navigation(read) once the next page is up; latency() reports
+    tag-to-decode and tag-to-page times.
+    """
+
+    def __init__(
+        self,
+        serial,
+        tk_root,
+        read_delay_ms: int = READ_DELAY_MS,
+        timeout_ms: int = READ_TIMEOUT_MS,
+        retries: int = READ_RETRIES,
+        debounce_ms: int = DEBOUNCE_MS,
+        reply_window_ms: int = REPLY_WINDOW_MS,
+    ):
+        self.serial = serial
+        self.tk_root = tk_root
+        self.read_delay_ms = max(0, int(read_delay_ms))
+        self.timeout_ms = max(1, int(timeout_ms))
+        self.retries = max(0, int(retries))
+        self.debounce_s = max(0, int(debounce_ms)) / 1000.0
+        self.reply_window_s = max(self.timeout_ms, int(reply_window_ms)) / 1000.0
+
+        self._listeners: List[Callable[[RfidRead], None]] = []
+        self._suspended = False
+
+        self._read_id = 0
+        self._in_flight = False
+        self._attempts = 0
+        self._tag_seen_at = 0.0
+        self._timer = None
+        self._last_read_at: Optional[float] = None
+        self._sent = deque()  # (read_id, sent_at) per "D" awaiting its "D="
+
+        self.stale_rejected = 0
+        self.timeouts = 0
+        self.failed = 0
+        self._latency: Dict[str, List[float]] = {"read_ms": [], "page_ms": []}
+
+        self.serial.add_listener(self._on_line)
+
+    # ---- public API ----
+    def add_listener(self, fn: Callable[[RfidRead], None]) -> None:
+        if fn not in self._listeners:
+            self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[RfidRead], None]) -> None:
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    def suspend(self) -> None:
+        """Ignore tags (admin mode); an in-flight read is dropped."""
+        self._suspended = True
+        self._cancel_read()
+
+    def resume(self) -> None:
+        self._suspended = False
+        self._last_read_at = None
+
+    def record_navigation(self, read: RfidRead) -> None:
+        page_ms = (time.monotonic() - read.tag_seen_at) * 1000.0
+        self._record("page_ms", page_ms)
+        print(
+            f"[RfidService] read #{read.read_id}: decoded in {read.read_ms:.0f} ms, "
+            f"page shown after {page_ms:.0f} ms ({read.attempts} attempt(s))"
+        )
+
+    def latency(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {
+                "count": len(samples),
+                "last": samples[-1] if samples else 0.0,
+                "avg": sum(samples) / len(samples) if samples else 0.0,
+                "max": max(samples) if samples else 0.0,
+            }
+            for name, samples in self._latency.items()
+        }
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "reads": self._read_id,
+            "timeouts": self.timeouts,
+            "failed": self.failed,
+            "stale_rejected": self.stale_rejected,
+            "latency": self.latency(),
+        }
+
+    # ---- serial protocol ----
+    def _on_line(self, line: str) -> None:
+        if line.startswith("D="):
+            self._on_data(line[2:])
+        elif "N=1" in line:
+            self._on_tag_present()
+        elif "N=0" in line:
+            self._on_tag_removed()
+
+    def _on_tag_present(self) -> None:
+        if self._suspended or self._in_flight:
+            return
+        now = time.monotonic()
+        if self._last_read_at is not None and now - self._last_read_at < self.debounce_s:
+            return
+
+        self._read_id += 1
+        self._in_flight = True
+        self._attempts = 0
+        self._tag_seen_at = now
+        self._schedule(self.read_delay_ms, self._send_read, self._read_id)
+
+    def _on_tag_removed(self) -> None:
+        self._last_read_at = None
+        self._cancel_read()
+
+    def _send_read(self, read_id: int) -> None:
+        if not self._in_flight or read_id != self._read_id:
+            return
+        self._attempts += 1
+        now = time.monotonic()
+        while self._sent and now - self._sent[0][1] > self.reply_window_s:
+            self._sent.popleft()
+        try:
+            self.serial.send(READ_COMMAND)
+            self._sent.append((read_id, now))
+        except Exception as e:
+            print(f"[RfidService] read #{read_id} send failed: {e}")
+        self._schedule(self.timeout_ms, self._on_timeout, read_id)
+
+    def _on_timeout(self, read_id: int) -> None:
+        if not self._in_flight or read_id != self._read_id:
+            return
+        self.timeouts += 1
+        self._retry_or_fail(read_id, "timed out")
+
+    def _retry_or_fail(self, read_id: int, reason: str) -> None:
+        if self._attempts <= self.retries:
+            print(f"[RfidService] read #{read_id} {reason}, retrying")
+            self._send_read(read_id)
+            return
+        print(f"[RfidService] read #{read_id} {reason} after {self._attempts} attempt(s)")
+        self.failed += 1
+        self._cancel_read()
+
+    def _on_data(self, payload: str) -> None:
+        reply_to = self._sent.popleft()[0] if self._sent else None
+        if not self._in_flight or self._suspended or reply_to != self._read_id:
+            self.stale_rejected += 1
+            print(f"[RfidService] stale tag data rejected (reply to read #{reply_to})")
+            return
+
+        read_id = self._read_id
+        self._cancel_timer()
+        try:
+            program = RfidProgramCache.Instance().get(payload)
+        except ValueError as e:
+            self._retry_or_fail(read_id, f"invalid data ({e})")
+            return
+
+        now = time.monotonic()
+        read = RfidRead(
+            payload=payload,
+            program=program,
+            read_id=read_id,
+            attempts=self._attempts,
+            tag_seen_at=self._tag_seen_at,
+            decoded_at=now,
+        )
+        self._in_flight = False
+        self._last_read_at = now
+        self._record("read_ms", read.read_ms)
+
+        for fn in list(self._listeners):
+            try:
+                fn(read)
+            except Exception as e:
+                print(f"[RfidService] listener failed: {e}")
+
+    # ---- internals ----
+    def _schedule(self, delay_ms: int, fn, *args) -> None:
+        self._cancel_timer()
+        self._timer = self.tk_root.after(delay_ms, fn, *args)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            try:
+                self.tk_root.after_cancel(self._timer)
+            except Exception:
+                pass
+            self._timer = None
+
+    def _cancel_read(self) -> None:
+        self._cancel_timer()
+        self._in_flight = False
+
+    def _record(self, name: str, value: float, keep: int = 100) -> None:
+        samples = self._latency[name]
+        samples.append(value)
+        del samples[:-keep]
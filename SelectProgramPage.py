@@ -5,72 +5,65 @@ from typing import Any, Dict, List
 from hmi_consts import HMISizePos, ASSETS_DIR, PROGRAMS_DIR, LightOnly
 from PIL import Image
 import os
-import json
+from FileStore import FileStore, atomic_write_bytes
+from ProgramFormat import encode_program, iter_program_numbers, library_bytes, read_library
 from SequenceStructure import SequenceCollection  # uses to_dict/from_dict/load/save
+from SequenceStructure import Program as SequenceProgram
+from ProgramRepository import ProgramRepository
+from RfidProgramCache import RfidProgramCache
+from ProgramAnalyzer import ProgramAnalysis
+from Settings import Settings
+from MessageBoxPage import askyesno, showerror, showinfo
+from utilities import list_usb_drives
+from ProgramCatalog import (
+    PROGRAM_COUNT,
+    ProgramCatalog,
+    format_total_time,
+    program_path as _program_path,
+)
 
 
 ########## Helper functions, not part of any class ##########
-PROGRAM_COUNT = 36
 os.makedirs(PROGRAMS_DIR, exist_ok=True)
 
 
-def _program_path(idx: int) -> str:
-    return os.path.join(PROGRAMS_DIR, f"program{idx}.alt")
-
-
-def _format_total_time(seconds_total: float) -> str:
-    total = max(0, int(round(seconds_total)))
-    if total >= 3600:
-        h = total // 3600
-        m = (total % 3600) // 60
-        return f"{h}:{m:02d}"
-    else:
-        m = total // 60
-        s = total % 60
-        return f"{m:02d}:{s:02d}"
-
-
-def _compute_total_time_from_zone_sequences(
-    zone_sequences: List[Dict[str, Any]],
-) -> str:
-    zone_totals = []
-    for z in zone_sequences or []:
-        steps = z.get("steps", [])
-        z_total = 0.0
-        for st in steps:
-            try:
-                z_total += float(st.get("duration", 0.0))
-            except Exception:
-                pass
-        zone_totals.append(z_total)
-    overall = max(zone_totals) if zone_totals else 0.0
-    return _format_total_time(overall)
-
-
-def _new_default_program_dict(idx: int) -> Dict[str, Any]:
-    sc = SequenceCollection.Instance()
-    d = sc.to_dict()
-    zone_sequences = d.get("zone_sequences", [])
-    total_time = _compute_total_time_from_zone_sequences(zone_sequences)
-    return {
-        "description": f"Program {idx}",
-        "zone_sequences": zone_sequences,
-        "total_time": total_time,
-    }
+def _record_program_saved(idx: int, program: SequenceProgram) -> None:
+    ProgramCatalog.Instance().update(idx, program)
+    ProgramRepository.Instance().invalidate(idx)
+
+
+def _write_program(idx: int, program: SequenceProgram) -> None:
+    """Queue an atomic write; the catalog/cache are updated once it lands."""
+    FileStore.Instance().write_bytes(
+        _program_path(idx),
+        encode_program(program),
+        on_written=lambda: _record_program_saved(idx, program),
+    )
+
+
+def load_program(idx: int) -> SequenceProgram:
+    """Immutable program idx (cached), or an empty program if missing/invalid."""
+    program = ProgramRepository.Instance().get(idx)
+    if program is None:
+        program = SequenceProgram.empty(f"Program {idx}")
+    return program
+
+
+def save_program(
+    idx: int, program: SequenceProgram, description: str = None
+) -> None:
+    if description is None:
+        description = program.description or f"Program {idx}"
+    _write_program(idx, program.with_description(description))
 
 
 def save_program_from_sequence_collection(idx: int, description: str = None) -> None:
-    path = _program_path(idx)
-    sc = SequenceCollection.Instance()
-    data = sc.to_dict()
-    zone_sequences = data.get("zone_sequences", [])
-    payload = {
-        "description": description if description is not None else f"Program {idx}",
-        "zone_sequences": zone_sequences,
-        "total_time": _compute_total_time_from_zone_sequences(zone_sequences),
-    }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    program = SequenceProgram.from_dict(SequenceCollection.Instance().to_dict())
+    save_program(
+        idx,
+        program,
+        description=description if description is not None else f"Program {idx}",
+    )
 
 
 def save_encoded_program(
@@ -78,12 +71,16 @@ def save_encoded_program(
     program_number: int = 9999,
 ) -> Dict[str, Any]:
     """
-    Decode an encoded RFID program, populate SequenceCollection, and save it
-    as program<program_number>.alt.
+    Decode an encoded RFID program and save it as program<program_number>.alt.
+    The active SequenceCollection is not touched.
 
     The encoded program is expected to include its description before the
     encoded zone/step data.
 
+    Decoding goes through the RFID payload cache, and the file is only
+    written when it does not already hold this program, so re-scanning
+    the same tag costs neither a decode nor an SD-card write.
+
     Returns the decoded program dictionary.
     """
 
@@ -95,54 +92,68 @@ def save_encoded_program(
     if not encoded_program:
         raise ValueError("Encoded program is empty")
 
-    decoded_program = SequenceCollection.from_encoded_program(
-        encoded_program
-    )
-
-    description = decoded_program.get(
-        "description",
-        f"Program {program_number}",
-    )
+    program = RfidProgramCache.Instance().get(encoded_program)
 
-    save_program_from_sequence_collection(
-        program_number,
-        description=description,
-    )
+    if ProgramRepository.Instance().get(program_number) != program:
+        save_program(program_number, program)
 
+    decoded_program = {"description": program.description}
+    decoded_program.update(program.to_dict())
     return decoded_program
 
 
 def load_program_into_sequence_collection(idx: int) -> Dict[str, Any]:
-    path = _program_path(idx)
-    payload = None
-    if os.path.exists(path):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
-            if not isinstance(payload, dict) or "zone_sequences" not in payload:
-                raise ValueError("Invalid payload")
-        except Exception:
-            payload = None
-
-    if payload is None:
-        payload = _new_default_program_dict(idx)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
-
-    SequenceCollection.from_dict({"zone_sequences": payload.get("zone_sequences", [])})
-
-    recomputed = _compute_total_time_from_zone_sequences(
-        payload.get("zone_sequences", [])
-    )
-    if recomputed != payload.get("total_time"):
-        payload["total_time"] = recomputed
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2)
-        except Exception:
-            pass
+    program = ProgramRepository.Instance().get(idx)
+    if program is None:
+        program = SequenceProgram.empty(f"Program {idx}")
+        _write_program(idx, program)
 
-    return payload
+    zone_sequences = program.to_dict()["zone_sequences"]
+    SequenceCollection.from_dict({"zone_sequences": zone_sequences})
+
+    return {
+        "description": program.description,
+        "zone_sequences": zone_sequences,
+        "total_time": format_total_time(program.total_seconds),
+    }
+
+
+def export_program_library(path: str) -> int:
+    """
+    Write every program in PROGRAMS_DIR to one file for USB transfer: a
+    binary bundle, or a JSON library when path ends in ".json".
+    Returns the number of programs exported.
+    """
+    programs = {}
+    for number in sorted(iter_program_numbers(os.listdir(PROGRAMS_DIR))):
+        program = ProgramRepository.Instance().get(number)
+        if program is not None:
+            programs[number] = program
+    atomic_write_bytes(path, library_bytes(path, programs))
+    return len(programs)
+
+
+def import_program_library(path: str) -> int:
+    """Save every program of a bundle/JSON library. Returns the count."""
+    programs = read_library(path)
+    for number, program in programs.items():
+        _write_program(number, program)
+    return len(programs)
+
+
+# library file at the root of the thumb drive; a .json one is read too
+USB_LIBRARY_NAMES = ("programs.altb", "programs.json")
+
+
+def _usb_library_path(existing: bool) -> str | None:
+    """Library path on the first USB drive (the first one holding a library
+    when existing=True). None if no drive / no library is found."""
+    for mountpoint in list_usb_drives():
+        for name in USB_LIBRARY_NAMES:
+            path = os.path.join(mountpoint, name)
+            if not existing or os.path.isfile(path):
+                return path
+    return None
 
 
 # ---------- Data model ----------
@@ -151,6 +162,15 @@ class Program:
     index: int
     description: str
     total_time: str  # "MM:SS" or "H:MM"
+    energy_wh: float = 0.0  # estimated, at Settings.zone_rated_watts
+    psu_stress: bool = False  # the power budget will throttle it
+
+    @property
+    def label(self) -> str:
+        if not self.energy_wh:
+            return self.description
+        flag = "  ⚠" if self.psu_stress else ""
+        return f"{self.description}  (~{self.energy_wh:.0f} Wh){flag}"
 
 
 # ---------- Row widget ----------
@@ -182,7 +202,7 @@ class ProgramRow(ctk.CTkFrame):
 
         desc_lbl = ctk.CTkLabel(
             self,
-            text=program.description,
+            text=program.label,
             anchor="w",
             font=ctk.CTkFont(size=HMISizePos.s(16)),
             text_color=LightOnly.ROW_TEXT,
@@ -424,21 +444,87 @@ class SelectProgramPage(ctk.CTkFrame):
         )
         back_btn.grid(row=0, column=0, sticky="w", padx=HMISizePos.sx(10))
 
+        import_btn = ctk.CTkButton(
+            footer,
+            text="Import USB",
+            width=HMISizePos.sx(120),
+            height=HMISizePos.sy(50),
+            fg_color=LightOnly.ACCENT,
+            hover_color=LightOnly.ACCENT,
+            command=self.on_import_usb,
+        )
+        import_btn.grid(row=0, column=1, sticky="e", padx=HMISizePos.sx(10))
+
+        export_btn = ctk.CTkButton(
+            footer,
+            text="Export USB",
+            width=HMISizePos.sx(120),
+            height=HMISizePos.sy(50),
+            fg_color=LightOnly.ACCENT,
+            hover_color=LightOnly.ACCENT,
+            command=self.on_export_usb,
+        )
+        export_btn.grid(row=0, column=2, sticky="e", padx=HMISizePos.sx(10))
+
         self._render_page()
 
     @classmethod
     def loadPrograms(cls) -> List[Program]:
-        programs: List[Program] = []
-        for idx in range(1, PROGRAM_COUNT + 1):
-            payload = load_program_into_sequence_collection(idx)
-            desc = payload.get("description", f"Program {idx}")
-            total_time = payload.get("total_time", "00:00")
-            programs.append(Program(index=idx, description=desc, total_time=total_time))
+        # Rendered from the catalog index; program files are only re-read
+        # when they changed, and the active SequenceCollection is untouched.
+        entries = ProgramCatalog.Instance().entries(range(1, PROGRAM_COUNT + 1))
+        s = Settings.Instance()
+        programs = []
+        for e in entries:
+            analysis = ProgramAnalysis.from_dict(e.get("analysis"))
+            programs.append(
+                Program(
+                    index=e["index"],
+                    description=e["description"],
+                    total_time=e["total_time"],
+                    energy_wh=analysis.energy_wh(s.zone_rated_watts) if analysis else 0.0,
+                    psu_stress=bool(
+                        analysis and analysis.exceeds(s.max_total_power, s.max_power_rise)
+                    ),
+                )
+            )
         return programs
 
     def on_back(self):
         self.controller.show_HomePage()
 
+    def on_export_usb(self):
+        path = _usb_library_path(existing=False)
+        if path is None:
+            showerror(self, "Error", "No thumb drive found!")
+            return
+        try:
+            count = export_program_library(path)
+        except Exception as e:
+            print(f"[SelectProgramPage] export to {path} failed: {e}")
+            showerror(self, "Error", f"Export failed: {e}")
+            return
+        showinfo(self, "Information", f"{count} program(s) exported to {path}")
+
+    def on_import_usb(self):
+        if not list_usb_drives():
+            showerror(self, "Error", "No thumb drive found!")
+            return
+        path = _usb_library_path(existing=True)
+        if path is None:
+            showerror(self, "Error", f"No {USB_LIBRARY_NAMES[0]} on the thumb drive")
+            return
+        if not askyesno(self, "Import", f"Replace programs with those in {path}?"):
+            return
+        try:
+            count = import_program_library(path)
+        except Exception as e:
+            print(f"[SelectProgramPage] import from {path} failed: {e}")
+            showerror(self, "Error", f"Import failed: {e}")
+            return
+        self.on_show()
+        showinfo(self, "Information", f"{count} program(s) imported from {path}")
+
     def on_edit_program(self, program: Program):
         print(f"Edit pressed: {program.index} - {program.description}")
         self.controller.show_SequenceProgramPage(program.index)
@@ -506,6 +592,10 @@ class SelectProgramPage(ctk.CTkFrame):
             state="normal" if self.page_index < self.total_pages - 1 else "disabled"
         )
 
+    def on_programs_changed(self):
+        """A program file changed on disk while this page is showing."""
+        self.on_show()
+
     def on_show(self):
         self.programs = SelectProgramPage.loadPrograms()
         self.total_pages = max(
@@ -4,12 +4,9 @@ import customtkinter as ctk
 from functools import partial
 from DoorSafety import DoorSafety
 from hmi_consts import HMIColors, HMISizePos, LightOnly
-from SequenceStructure import SequenceCollection
+from SequenceStructure import NUM_OF_ZONES, Program, ProgramDraft
 from CookingSequenceRunner import CookingSequenceManager
-from SelectProgramPage import (
-    load_program_into_sequence_collection,
-    save_program_from_sequence_collection,
-)
+from SelectProgramPage import load_program, save_program
 import logging
 
 logger = logging.getLogger(__name__)
@@ -218,6 +215,9 @@ class SequenceProgramPage(ctk.CTkFrame):
         self.step_widgets, self.selected_row, self.programNumber = [], None, 0
         self.duplicate_btn = None
 
+        # Copy-on-write working copy; the cached/running Program is never edited
+        self.draft = ProgramDraft(Program.empty())
+
         self._header = None
         self._table = None
         self._footer = None
@@ -493,22 +493,18 @@ class SequenceProgramPage(ctk.CTkFrame):
         try:
             self.sync_to_model()
 
-            sc = SequenceCollection.Instance()
+            program = self.draft.program()
             zone_sequences = []
-            for zone_idx in range(8):
-                zone = sc.get_zone_sequence_by_index(zone_idx)
-                if not zone:
-                    continue
-                steps = []
-                for step in zone.steps:
-                    duration = float(step.duration or 0)
-                    power = int(step.power or 0)
-                    if duration <= 0 or power <= 0:
-                        continue
-                    steps.append((duration, power))
-                zone_name = zone.name or f"Zone{zone_idx+1}"
+            for zone_idx in range(NUM_OF_ZONES):
+                steps = [
+                    (duration, power, ramp)
+                    for power, duration, ramp in program.zone_steps_at(zone_idx)
+                    if duration > 0 and power > 0
+                ]
                 if steps:
-                    zone_sequences.append((zone_name, steps))
+                    zone_sequences.append(
+                        (f"Zone{zone_idx+1}", steps, program.max_slew(zone_idx))
+                    )
 
             if not zone_sequences:
                 print("[Run] No non-empty steps found; nothing to run.")
@@ -525,21 +521,33 @@ class SequenceProgramPage(ctk.CTkFrame):
                 self.controller.serial_zone(zone_id, int(value))
 
             zone8_flag = False
-            for zone_name, steps in zone_sequences:
-                mgr.add_dac(zone_name, steps, set_zone_output)
+            for zone_name, steps, max_slew in zone_sequences:
+                mgr.add_dac(zone_name, steps, set_zone_output, max_slew=max_slew)
                 if zone_name == "Zone8":
                     zone8_flag = True
 
             if zone8_flag is False:
                 mgr.add_dac("Zone8", [(0.0, 0)], set_zone_output)
 
-            mgr.set_on_all_complete(lambda: self.controller.serial_all_zones_off())
+            def set_zone_outputs(outputs):
+                self.controller.serial_zones(
+                    self.controller._zone_outputs_from_runner_names(outputs)
+                )
+
+            mgr.set_batch_callback(set_zone_outputs)
+            def on_all_complete():
+                self.controller.serial_all_zones_off()
+                self.controller.release_sequence_manager(mgr)
+
+            mgr.set_on_all_complete(on_all_complete)
             self.shared_data["sequence_manager"] = mgr
 
             def zone_total(steps):
-                return sum(d for (d, _p) in steps)
+                return sum(step[0] for step in steps)
 
-            total_seconds = max(zone_total(steps) for _name, steps in zone_sequences)
+            total_seconds = max(
+                zone_total(steps) for _name, steps, _slew in zone_sequences
+            )
 
             def on_stop_handler():
                 try:
@@ -566,39 +574,34 @@ class SequenceProgramPage(ctk.CTkFrame):
     def on_save(self):
         try:
             self.sync_to_model()
-            save_program_from_sequence_collection(self.programNumber)
+            save_program(self.programNumber, self.draft.commit())
             print(f"Saved program{self.programNumber}.alt")
         except Exception as e:
             print("Save failed:", e)
 
     # ---------- Model Sync ----------
     def sync_from_model(self):
-        sc = SequenceCollection.Instance()
+        program = self.draft.program()
         for i, row in enumerate(self.step_widgets):
-            zone = sc.get_zone_sequence_by_index(i)
-            if not zone:
-                continue
             for j, btn in enumerate(row.dual_buttons):
-                step = zone.steps[j]
-                m, s = _sec_to_mmss(step.duration)
-                btn.set_values(int(step.power), int(m), int(s))
+                power, duration, _ramp = program.step(i, j)
+                m, s = _sec_to_mmss(duration)
+                btn.set_values(int(power), int(m), int(s))
 
     def sync_to_model(self):
-        sc = SequenceCollection.Instance()
         for i, row in enumerate(self.step_widgets):
-            zone = sc.get_zone_sequence_by_index(i)
-            if not zone:
-                continue
             for j, btn in enumerate(row.dual_buttons):
-                step = zone.steps[j]
-                step.power = int(btn.power)
-                step.duration = _mmss_to_sec(int(btn.min), int(btn.sec))
+                self.draft.set_step(
+                    i,
+                    j,
+                    power=int(btn.power),
+                    duration=_mmss_to_sec(int(btn.min), int(btn.sec)),
+                )
 
     def on_show(self, programNumber: int):
         self.programNumber = programNumber
         try:
-            load_program_into_sequence_collection(programNumber)
-            self.sync_from_model()
+            self.draft = ProgramDraft(load_program(programNumber))
         except Exception as e:
             print("Program load failed:", e)
         self.program_label.configure(text=f"Program {programNumber}")
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from SingletonBase import SingletonBase
 import json
 
@@ -27,6 +27,21 @@ ENCODED_PROGRAM_DATA_LENGTH = (
     NUM_OF_ZONES * NUM_OF_STEPS * ENCODED_STEP_WIDTH
 )
 
+# Encoding v2 (variable length, never exactly 128 characters):
+#
+#     "~"                      marker
+#     version                  1 char  (2)
+#     zone bitmap              2 chars (bit z set = zone z+1 present)
+#     per present zone:
+#         step count           1 char  (1-4, trailing empty steps dropped)
+#         runs until count:    1 char repeat + 2 power + 2 duration
+#
+# Zones with no non-empty steps are not sent at all. A v1 data section is
+# always exactly 128 characters, which is how the two are told apart.
+ENCODED_V2_MARKER = "~"
+ENCODED_V2_VERSION = 2
+ENCODED_V2_BITMAP_WIDTH = 2
+
 
 # ----------------------------------------------------------------------
 # Encoded program helpers
@@ -64,6 +79,167 @@ def decode_u94(encoded_value: str) -> int:
     return decoded_value
 
 
+def encode_u94(value: int, width: int) -> str:
+    """Encode an unsigned value as exactly width base-94 characters."""
+    value = int(value)
+    if value < 0 or value >= U94_BASE ** width:
+        raise ValueError(f"Value {value} does not fit in {width} u94 characters")
+
+    characters = []
+    for _ in range(width):
+        value, digit = divmod(value, U94_BASE)
+        characters.append(chr(U94_FIRST_ASCII + digit))
+    return "".join(reversed(characters))
+
+
+def _encode_v1_data(zone_values: List[List[Tuple[int, int]]]) -> str:
+    parts = []
+    for values in zone_values:
+        for power, duration in values:
+            parts.append(encode_u94(power, ENCODED_POWER_WIDTH))
+            parts.append(encode_u94(duration, ENCODED_DURATION_WIDTH))
+    return "".join(parts)
+
+
+def _encode_v2_data(zone_values: List[List[Tuple[int, int]]]) -> str:
+    bitmap = 0
+    zone_parts = []
+    for zone_index, values in enumerate(zone_values):
+        values = list(values)
+        while values and values[-1] == (0, 0):
+            values.pop()
+        if not values:
+            continue
+
+        bitmap |= 1 << zone_index
+        zone_parts.append(encode_u94(len(values), 1))
+        i = 0
+        while i < len(values):
+            j = i
+            while j < len(values) and values[j] == values[i]:
+                j += 1
+            power, duration = values[i]
+            zone_parts.append(encode_u94(j - i, 1))
+            zone_parts.append(encode_u94(power, ENCODED_POWER_WIDTH))
+            zone_parts.append(encode_u94(duration, ENCODED_DURATION_WIDTH))
+            i = j
+
+    return (
+        ENCODED_V2_MARKER
+        + encode_u94(ENCODED_V2_VERSION, 1)
+        + encode_u94(bitmap, ENCODED_V2_BITMAP_WIDTH)
+        + "".join(zone_parts)
+    )
+
+
+def encode_program_to_u94(program: "Program", version: Optional[int] = None) -> str:
+    """
+    Inverse of decode_program_to_dict(): "description,<data>".
+
+    version=1 always sends the fixed 128-character table, version=2 the
+    compact form; by default the shorter of the two is used (v2 whenever
+    it is under 128 characters). Durations are whole seconds on the tag;
+    ramp and slew are not encoded.
+    """
+    if "," in program.description:
+        raise ValueError("Program description cannot contain a comma")
+
+    zone_values = [
+        [(int(power), int(round(duration))) for power, duration, _ramp in zone_steps]
+        for zone_steps in program.zone_steps
+    ]
+
+    if version == 1:
+        data = _encode_v1_data(zone_values)
+    elif version == ENCODED_V2_VERSION:
+        data = _encode_v2_data(zone_values)
+        if len(data) == ENCODED_PROGRAM_DATA_LENGTH:
+            raise ValueError("Program cannot be sent as v2; use v1")
+    elif version is None:
+        data = _encode_v2_data(zone_values)
+        if len(data) >= ENCODED_PROGRAM_DATA_LENGTH:
+            data = _encode_v1_data(zone_values)
+    else:
+        raise ValueError(f"Unsupported program encoding version {version}")
+
+    return program.description + "," + data
+
+
+def _decode_v1_data(encoded_data: str) -> List[List[Tuple[int, int]]]:
+    zone_values: List[List[Tuple[int, int]]] = []
+    position = 0
+
+    for zone_index in range(NUM_OF_ZONES):
+        values: List[Tuple[int, int]] = []
+
+        for step_index in range(NUM_OF_STEPS):
+            encoded_power = encoded_data[
+                position:position + ENCODED_POWER_WIDTH
+            ]
+            position += ENCODED_POWER_WIDTH
+
+            encoded_duration = encoded_data[
+                position:position + ENCODED_DURATION_WIDTH
+            ]
+            position += ENCODED_DURATION_WIDTH
+
+            values.append((decode_u94(encoded_power), decode_u94(encoded_duration)))
+
+        zone_values.append(values)
+
+    return zone_values
+
+
+def _decode_v2_data(encoded_data: str) -> List[List[Tuple[int, int]]]:
+    position = len(ENCODED_V2_MARKER)
+
+    def take(width: int) -> int:
+        nonlocal position
+        chunk = encoded_data[position:position + width]
+        if len(chunk) < width:
+            raise ValueError("Encoded v2 program data is truncated")
+        position += width
+        return decode_u94(chunk)
+
+    version = take(1)
+    if version != ENCODED_V2_VERSION:
+        raise ValueError(f"Unsupported program encoding version {version}")
+
+    bitmap = take(ENCODED_V2_BITMAP_WIDTH)
+    if bitmap >= 1 << NUM_OF_ZONES:
+        raise ValueError(f"Invalid zone bitmap {bitmap}")
+
+    zone_values = [[(0, 0)] * NUM_OF_STEPS for _ in range(NUM_OF_ZONES)]
+    for zone_index in range(NUM_OF_ZONES):
+        if not bitmap >> zone_index & 1:
+            continue
+
+        count = take(1)
+        if count < 1 or count > NUM_OF_STEPS:
+            raise ValueError(
+                f"Zone {zone_index + 1}: step count {count} is outside the "
+                f"valid range 1-{NUM_OF_STEPS}"
+            )
+
+        values: List[Tuple[int, int]] = []
+        while len(values) < count:
+            repeat = take(1)
+            if repeat < 1 or len(values) + repeat > count:
+                raise ValueError(
+                    f"Zone {zone_index + 1}: invalid step repeat count {repeat}"
+                )
+            power = take(ENCODED_POWER_WIDTH)
+            duration = take(ENCODED_DURATION_WIDTH)
+            values.extend([(power, duration)] * repeat)
+
+        zone_values[zone_index][:count] = values
+
+    if position != len(encoded_data):
+        raise ValueError("Encoded v2 program data has trailing characters")
+
+    return zone_values
+
+
 def decode_program_to_dict(encoded_program: str) -> Dict[str, Any]:
     """
     Decode an encoded cooking program into the same dictionary shape used
@@ -71,15 +247,18 @@ def decode_program_to_dict(encoded_program: str) -> Dict[str, Any]:
 
     Expected format:
 
-        description,<128 encoded characters>
+        description,<encoded data>
 
-    The 128-character data section contains:
+    v1: a 128-character data section containing:
 
         8 zones
         4 steps per zone
         2 characters for power
         2 characters for duration
 
+    v2: "~" followed by the compact form described at
+    ENCODED_V2_MARKER. Both decode to the full 8 x 4 table.
+
     Returned dictionary:
 
         {
@@ -123,7 +302,11 @@ def decode_program_to_dict(encoded_program: str) -> Dict[str, Any]:
     if len(description) == 0:
         raise ValueError("Program description cannot be empty")
 
-    if len(encoded_data) != ENCODED_PROGRAM_DATA_LENGTH:
+    if len(encoded_data) == ENCODED_PROGRAM_DATA_LENGTH:
+        zone_values = _decode_v1_data(encoded_data)
+    elif encoded_data.startswith(ENCODED_V2_MARKER):
+        zone_values = _decode_v2_data(encoded_data)
+    else:
         raise ValueError(
             "Encoded program data has the wrong length. "
             f"Expected {ENCODED_PROGRAM_DATA_LENGTH} characters, "
@@ -131,25 +314,11 @@ def decode_program_to_dict(encoded_program: str) -> Dict[str, Any]:
         )
 
     zone_sequences: List[Dict[str, Any]] = []
-    position = 0
 
-    for zone_index in range(NUM_OF_ZONES):
+    for zone_index, values in enumerate(zone_values):
         steps: List[Dict[str, Any]] = []
 
-        for step_index in range(NUM_OF_STEPS):
-            encoded_power = encoded_data[
-                position:position + ENCODED_POWER_WIDTH
-            ]
-            position += ENCODED_POWER_WIDTH
-
-            encoded_duration = encoded_data[
-                position:position + ENCODED_DURATION_WIDTH
-            ]
-            position += ENCODED_DURATION_WIDTH
-
-            power = decode_u94(encoded_power)
-            duration = decode_u94(encoded_duration)
-
+        for step_index, (power, duration) in enumerate(values):
             if power < 0 or power > 100:
                 raise ValueError(
                     f"Zone {zone_index + 1}, step {step_index + 1}: "
@@ -181,23 +350,37 @@ def decode_program_to_dict(encoded_program: str) -> Dict[str, Any]:
 # Sequence data classes
 # ----------------------------------------------------------------------
 class Step:
-    def __init__(self, power: int, duration: float):
+    """
+    One power/duration step. With ramp=True the output is interpolated
+    linearly from the previous step's power to this step's power across
+    the step's duration instead of jumping at the step boundary.
+    """
+
+    def __init__(self, power: int, duration: float, ramp: bool = False):
         self.power = int(power)
         self.duration = float(duration)
+        self.ramp = bool(ramp)
 
     def set_power_duration(self, power: int, duration: float):
         self.power = int(power)
         self.duration = float(duration)
 
     def __repr__(self):
-        return f"Step(power={self.power}, duration={self.duration})"
+        ramp = ", ramp=True" if self.ramp else ""
+        return f"Step(power={self.power}, duration={self.duration}{ramp})"
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data: Dict[str, Any] = {
             "power": self.power,
             "duration": self.duration,
         }
 
+        # Only written when used so existing program files stay unchanged
+        if self.ramp:
+            data["ramp"] = True
+
+        return data
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]):
         if not isinstance(data, dict):
@@ -223,17 +406,23 @@ class Step:
         if duration < 0:
             raise ValueError("Step duration cannot be negative")
 
-        return cls(power, duration)
+        return cls(power, duration, bool(data.get("ramp", False)))
 
 
 class ZoneSequence:
-    def __init__(self, name: str, index: int):
+    def __init__(self, name: str, index: int, max_slew: Optional[float] = None):
         self.name = str(name)
         self.index = int(index)
         self.steps: List[Step] = []
 
-    def add_step(self, power: int, duration: float):
-        self.steps.append(Step(power, duration))
+        # Optional maximum rate of change for this zone in percent/second.
+        # None means power changes are applied as hard steps.
+        self.max_slew: Optional[float] = (
+            float(max_slew) if max_slew else None
+        )
+
+    def add_step(self, power: int, duration: float, ramp: bool = False):
+        self.steps.append(Step(power, duration, ramp))
 
     def __repr__(self):
         return f"{self.name}: " + ", ".join(
@@ -241,12 +430,17 @@ class ZoneSequence:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data: Dict[str, Any] = {
             "name": self.name,
             "index": self.index,
             "steps": [step.to_dict() for step in self.steps],
         }
 
+        if self.max_slew is not None:
+            data["max_slew"] = self.max_slew
+
+        return data
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]):
         if not isinstance(data, dict):
@@ -266,7 +460,20 @@ class ZoneSequence:
         if not isinstance(steps_data, list):
             raise ValueError(f"{name} steps must be a list")
 
-        zone = cls(name, index)
+        max_slew = data.get("max_slew")
+
+        if max_slew is not None:
+            try:
+                max_slew = float(max_slew)
+            except (TypeError, ValueError) as error:
+                raise ValueError(
+                    f"{name} max_slew must be a numeric value"
+                ) from error
+
+            if max_slew < 0:
+                raise ValueError(f"{name} max_slew cannot be negative")
+
+        zone = cls(name, index, max_slew)
         zone.steps = [Step.from_dict(step) for step in steps_data]
 
         return zone
@@ -300,6 +507,12 @@ class SequenceCollection(SingletonBase):
         self.zone_sequences.append(zone_sequence)
 
     def get_zone_sequence(self, name: str) -> Optional[ZoneSequence]:
+        # Zones are stored in order as "Zone1".."Zone8"
+        if name.startswith("Zone") and name[4:].isdigit():
+            zone = self.get_zone_sequence_by_index(int(name[4:]) - 1)
+            if zone is not None and zone.name == name:
+                return zone
+
         for zone in self.zone_sequences:
             if zone.name == name:
                 return zone
@@ -310,6 +523,11 @@ class SequenceCollection(SingletonBase):
         self,
         index: int,
     ) -> Optional[ZoneSequence]:
+        if 0 <= index < len(self.zone_sequences):
+            zone = self.zone_sequences[index]
+            if zone.index == index:
+                return zone
+
         for zone in self.zone_sequences:
             if zone.index == index:
                 return zone
@@ -363,19 +581,11 @@ class SequenceCollection(SingletonBase):
         with open(filename, "w", encoding="utf-8") as file:
             json.dump(self.to_dict(), file, indent=2)
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]):
+    @staticmethod
+    def validate_zone_sequences(data: Dict[str, Any]) -> List[ZoneSequence]:
         """
-        Populate the SequenceCollection singleton from a dictionary.
-
-        This is the common population path used by:
-
-            - load_program_into_sequence_collection()
-            - SequenceCollection.load_from_json()
-            - SequenceCollection.from_encoded_program()
-
-        The singleton is not modified unless the entire incoming structure
-        passes validation.
+        Decode and validate the "zone_sequences" of a program dictionary
+        without touching the singleton. Raises ValueError on bad data.
         """
 
         if not isinstance(data, dict):
@@ -426,6 +636,25 @@ class SequenceCollection(SingletonBase):
 
             new_zone_sequences.append(zone)
 
+        return new_zone_sequences
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """
+        Populate the SequenceCollection singleton from a dictionary.
+
+        This is the common population path used by:
+
+            - load_program_into_sequence_collection()
+            - SequenceCollection.load_from_json()
+            - SequenceCollection.from_encoded_program()
+
+        The singleton is not modified unless the entire incoming structure
+        passes validation.
+        """
+
+        new_zone_sequences = cls.validate_zone_sequences(data)
+
         instance = cls.Instance()
 
         # Replace the active program only after every zone and step has
@@ -473,6 +702,271 @@ class SequenceCollection(SingletonBase):
         return cls.from_dict(data)
 
 
+# ----------------------------------------------------------------------
+# Immutable program value type
+# ----------------------------------------------------------------------
+# (power, duration, ramp)
+StepTuple = Tuple[int, float, bool]
+
+
+class Program:
+    """
+    Immutable 8-zone x 4-step program.
+
+    Steps are stored in flat, row-major tuples (zone * NUM_OF_STEPS + step),
+    so any number of programs can exist side by side, lookups are O(1), and
+    instances can be shared between threads (editor, cache, running cook)
+    without copying. "Modifying" a program returns a new one; unchanged
+    tuples are shared.
+    """
+
+    __slots__ = ("description", "_power", "_duration", "_ramp", "_max_slew")
+
+    def __init__(
+        self,
+        description: str,
+        power: Tuple[int, ...],
+        duration: Tuple[float, ...],
+        ramp: Tuple[bool, ...],
+        max_slew: Tuple[Optional[float], ...],
+    ):
+        size = NUM_OF_ZONES * NUM_OF_STEPS
+        if not (len(power) == len(duration) == len(ramp) == size):
+            raise ValueError(f"Program needs {size} steps")
+        if len(max_slew) != NUM_OF_ZONES:
+            raise ValueError(f"Program needs {NUM_OF_ZONES} zone slew values")
+
+        object.__setattr__(self, "description", str(description))
+        object.__setattr__(self, "_power", tuple(power))
+        object.__setattr__(self, "_duration", tuple(duration))
+        object.__setattr__(self, "_ramp", tuple(ramp))
+        object.__setattr__(self, "_max_slew", tuple(max_slew))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Program is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Program is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, Program):
+            return NotImplemented
+        return (
+            self.description == other.description
+            and self._power == other._power
+            and self._duration == other._duration
+            and self._ramp == other._ramp
+            and self._max_slew == other._max_slew
+        )
+
+    def __hash__(self):
+        return hash(
+            (self.description, self._power, self._duration, self._ramp, self._max_slew)
+        )
+
+    def __repr__(self):
+        return f"Program({self.description!r}, {self.total_seconds:.0f}s)"
+
+    # ---- construction ----
+    @classmethod
+    def empty(cls, description: str = "") -> "Program":
+        size = NUM_OF_ZONES * NUM_OF_STEPS
+        return cls(
+            description,
+            (0,) * size,
+            (0.0,) * size,
+            (False,) * size,
+            (None,) * NUM_OF_ZONES,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], description: Optional[str] = None) -> "Program":
+        """Build from the program file / decoder dictionary. Raises ValueError."""
+        zones = SequenceCollection.validate_zone_sequences(data)
+        steps = [step for zone in zones for step in zone.steps]
+
+        if description is None:
+            description = data.get("description", "")
+
+        return cls(
+            description,
+            tuple(step.power for step in steps),
+            tuple(step.duration for step in steps),
+            tuple(step.ramp for step in steps),
+            tuple(zone.max_slew for zone in zones),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Same "zone_sequences" shape as SequenceCollection.to_dict()."""
+        zone_sequences = []
+        for zone in range(NUM_OF_ZONES):
+            zone_sequence = ZoneSequence(
+                f"Zone{zone + 1}", zone, self._max_slew[zone]
+            )
+            for power, duration, ramp in self.zone_steps_at(zone):
+                zone_sequence.add_step(power, duration, ramp)
+            zone_sequences.append(zone_sequence.to_dict())
+
+        return {"zone_sequences": zone_sequences}
+
+    # ---- O(1) accessors ----
+    @staticmethod
+    def _pos(zone: int, step: int) -> int:
+        if not (0 <= zone < NUM_OF_ZONES and 0 <= step < NUM_OF_STEPS):
+            raise IndexError(f"zone {zone}, step {step} out of range")
+        return zone * NUM_OF_STEPS + step
+
+    def step(self, zone: int, step: int) -> StepTuple:
+        i = self._pos(zone, step)
+        return self._power[i], self._duration[i], self._ramp[i]
+
+    def zone_steps_at(self, zone: int) -> Tuple[StepTuple, ...]:
+        start = self._pos(zone, 0)
+        end = start + NUM_OF_STEPS
+        return tuple(
+            zip(self._power[start:end], self._duration[start:end], self._ramp[start:end])
+        )
+
+    @property
+    def zone_steps(self) -> Tuple[Tuple[StepTuple, ...], ...]:
+        return tuple(self.zone_steps_at(zone) for zone in range(NUM_OF_ZONES))
+
+    def max_slew(self, zone: int) -> Optional[float]:
+        return self._max_slew[zone]
+
+    @property
+    def zone_slews(self) -> Tuple[Optional[float], ...]:
+        return self._max_slew
+
+    def zone_total(self, zone: int) -> float:
+        start = self._pos(zone, 0)
+        return sum(self._duration[start:start + NUM_OF_STEPS])
+
+    @property
+    def total_seconds(self) -> float:
+        return max(self.zone_total(zone) for zone in range(NUM_OF_ZONES))
+
+    # ---- copy-on-write updates ----
+    def with_step(
+        self,
+        zone: int,
+        step: int,
+        power: Optional[int] = None,
+        duration: Optional[float] = None,
+        ramp: Optional[bool] = None,
+    ) -> "Program":
+        return self.with_steps({(zone, step): (power, duration, ramp)})
+
+    def with_steps(
+        self,
+        changes: Dict[Tuple[int, int], Tuple[Optional[int], Optional[float], Optional[bool]]],
+    ) -> "Program":
+        """New program with several (zone, step) -> (power, duration, ramp) changes."""
+        if not changes:
+            return self
+
+        power = list(self._power)
+        duration = list(self._duration)
+        ramp = list(self._ramp)
+
+        for (zone, step), (p, d, r) in changes.items():
+            i = self._pos(zone, step)
+            if p is not None:
+                p = int(p)
+                if p < 0 or p > 100:
+                    raise ValueError(f"Step power {p} is outside the valid range 0-100")
+                power[i] = p
+            if d is not None:
+                d = float(d)
+                if d < 0:
+                    raise ValueError("Step duration cannot be negative")
+                duration[i] = d
+            if r is not None:
+                ramp[i] = bool(r)
+
+        return Program(
+            self.description,
+            tuple(power),
+            tuple(duration),
+            tuple(ramp),
+            self._max_slew,
+        )
+
+    def with_description(self, description: str) -> "Program":
+        return Program(
+            description, self._power, self._duration, self._ramp, self._max_slew
+        )
+
+
+class ProgramDraft:
+    """
+    Copy-on-write working copy for the program editor.
+
+    Edits are recorded as per-step changes on top of an immutable base
+    Program; the base (which may also be cached or running) is never
+    touched, and program() only builds a new Program when something changed.
+    """
+
+    def __init__(self, base: Program):
+        self._base = base
+        self._changes: Dict[Tuple[int, int], Tuple[Optional[int], Optional[float], Optional[bool]]] = {}
+        self._program: Optional[Program] = base
+
+    @property
+    def base(self) -> Program:
+        return self._base
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self._changes)
+
+    def step(self, zone: int, step: int) -> StepTuple:
+        return self.program().step(zone, step)
+
+    def set_step(
+        self,
+        zone: int,
+        step: int,
+        power: Optional[int] = None,
+        duration: Optional[float] = None,
+        ramp: Optional[bool] = None,
+    ) -> None:
+        if (power, duration, ramp) == (None, None, None):
+            return
+
+        base_step = self._base.step(zone, step)
+        prev = self._changes.get((zone, step), (None, None, None))
+        merged = tuple(
+            new if new is not None else old for new, old in zip((power, duration, ramp), prev)
+        )
+        # drop changes that restore the base value
+        effective = tuple(
+            value if value is not None and value != base_step[k] else None
+            for k, value in enumerate(merged)
+        )
+
+        if effective == (None, None, None):
+            self._changes.pop((zone, step), None)
+        else:
+            self._changes[(zone, step)] = effective
+        self._program = None
+
+    def program(self) -> Program:
+        if self._program is None:
+            self._program = self._base.with_steps(self._changes)
+        return self._program
+
+    def commit(self) -> Program:
+        """Make the current edits the new base and return it."""
+        self._base = self.program()
+        self._changes = {}
+        return self._base
+
+    def reset(self) -> None:
+        self._changes = {}
+        self._program = self._base
+
+
 # ----------------------------------------------------------------------
 # Basic local test
 # ----------------------------------------------------------------------
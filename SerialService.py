@@ -96,6 +96,21 @@ class SerialService:
             self._ser.flush()
             self._last_send_time = time.monotonic()
 
+    def send_many(self, cmds: List[str]):
+        """Send several commands back-to-back as one write/flush."""
+        if not cmds:
+            return
+        with self._io_lock:
+            if not self._ser or not self._ser.is_open:
+                raise RuntimeError("Serial port not open")
+
+            data = b"".join(
+                (cmd.rstrip("\r\n") + self.line_ending).encode("ascii") for cmd in cmds
+            )
+            self._ser.write(data)
+            self._ser.flush()
+            self._last_send_time = time.monotonic()
+
     def add_listener(self, fn: Callable[[str], None]):
         if fn not in self._listeners:
             self._listeners.append(fn)
@@ -1,20 +1,77 @@
-import json
+import copy
 import os
+import threading
+from typing import Any, Callable, Dict, List
+from FileStore import FileStore
 from hmi_consts import SETTINGS_DIR
 
 
+def _as_bool(value) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y", "on")
+    return bool(value)
+
+
+def _as_dict(value) -> dict:
+    if not isinstance(value, dict):
+        raise ValueError(f"expected an object, got {value!r}")
+    return dict(value)
+
+
+# name -> (coerce, default); one entry per key this HMI keeps in settings.alt
+SETTINGS_FIELDS: Dict[str, tuple] = {
+    "tset": (float, 60.0),
+    "thys": (float, 5.0),
+    "top_zones_correction_factor": (int, 80),
+    "bottom_zones_correction_factor": (int, 80),
+    "tc": (int, 240),
+    "enable_cook_algorithm": (_as_bool, False),
+    "enable_array_temp_control": (_as_bool, False),
+    "use_rfid": (_as_bool, False),
+    "max_total_power": (int, 800),
+    "max_power_rise": (int, 200),
+    "power_stagger_ms": (int, 100),
+    "zone_rated_watts": (int, 1000),  # heater rating, for energy estimates
+    "alarm_level": (int, 1500),
+    "alarm_hysteresis": (int, 400),
+    "over_temp_power": (float, 0.75),
+    "cookpack_control_strategy": (str, "hysteresis"),  # "hysteresis" | "pid"
+    "cookpack_pid_kp": (float, 0.08),
+    "cookpack_pid_ki": (float, 0.004),
+    "cookpack_pid_kd": (float, 0.0),
+    "cookpack_pid_min_scale": (float, 0.2),
+    "use_sound": (_as_bool, True),
+    "show_hotspots": (_as_bool, False),  # admin: outline hotspots, time taps
+    "oven_testing_power": (int, 80),
+    "fan_delay": (_as_dict, {"minute": 1, "second": 1}),
+    "manual_cook": (_as_dict, {}),  # {"minute":..., "second":..., "power":...}
+}
+
+
 class Settings:
+    """
+    In-memory copy of settings/settings.alt, read once at startup.
+
+    Fields are plain attributes (s.tset, s.use_sound, ...) typed by
+    SETTINGS_FIELDS. Pages read them directly, so showing a page does no
+    file I/O. Changes go through update(**fields) -- or attribute
+    assignment followed by save() -- which notifies listeners with the
+    changed fields and queues a merge-write (keys written by other tools
+    are kept). Rapid saves are coalesced by the FileStore writer.
+
+    Listeners are called as listener(changed: dict) on the thread that made
+    the change. load() re-reads the file (e.g. after an external edit) and
+    notifies about whatever differs.
+    """
+
     _instance = None
 
     def __init__(self):
-        self.tset = 60.0
-        self.thys = 5.0
-        self.top_zones_correction_factor = 80
-        self.bottom_zones_correction_factor = 80
-        self.tc = 240
-        self.enable_cook_algorithm = False
-        self.enable_array_temp_control = False
-        self.use_rfid = False
+        self._lock = threading.RLock()
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        for name, (_, default) in SETTINGS_FIELDS.items():
+            setattr(self, name, copy.deepcopy(default))
+        self._saved = self.snapshot()
         self.load()
 
     @staticmethod
@@ -26,58 +83,92 @@ class Settings:
     def _settings_path(self):
         return os.path.join(SETTINGS_DIR, "settings.alt")
 
-    def load(self):
+    # ---- subscribers ----
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    # ---- access ----
+    def get(self, name: str):
+        with self._lock:
+            return copy.deepcopy(getattr(self, name))
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {name: copy.deepcopy(getattr(self, name)) for name in SETTINGS_FIELDS}
+
+    def update(self, **fields) -> Dict[str, Any]:
+        """Set fields, persist and notify. Returns the fields that changed."""
+        with self._lock:
+            for name, value in fields.items():
+                if name not in SETTINGS_FIELDS:
+                    raise KeyError(f"unknown setting {name!r}")
+                setattr(self, name, self._coerce(name, value))
+        return self.save()
+
+    # ---- persistence ----
+    def load(self) -> Dict[str, Any]:
+        """Re-read settings.alt. Returns (and notifies) the fields that changed."""
         path = self._settings_path()
+        data = FileStore.Instance().read_json(path)
+        if not isinstance(data, dict):
+            if os.path.exists(path):
+                print(f"[Settings] load failed: no settings in {path}")
+            return {}
+
+        with self._lock:
+            for name in SETTINGS_FIELDS:
+                if name in data:
+                    setattr(self, name, self._coerce(name, data[name]))
+            changed = self._diff_locked()
+            self._saved = self.snapshot()
+        self._notify(changed)
+        return changed
+
+    def save(self) -> Dict[str, Any]:
+        """Queue a merge-write of every field. Returns (and notifies) changes."""
+        with self._lock:
+            values = self.snapshot()
+            changed = self._diff_locked()
+            self._saved = values
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
-
-            self.tset = data.get("tset", self.tset)
-            self.thys = data.get("thys", self.thys)
-            self.top_zones_correction_factor = data.get(
-                "top_zones_correction_factor",
-                self.top_zones_correction_factor,
-            )
-            self.bottom_zones_correction_factor = data.get(
-                "bottom_zones_correction_factor",
-                self.bottom_zones_correction_factor,
-            )
-            self.tc = data.get("tc", self.tc)
-            self.enable_cook_algorithm = data.get(
-                "enable_cook_algorithm", self.enable_cook_algorithm
-            )
-            self.enable_array_temp_control = data.get(
-                "enable_array_temp_control", self.enable_array_temp_control
+            FileStore.Instance().update_json(
+                self._settings_path(), lambda data: data.update(values), checksum=True
             )
-            self.use_rfid = data.get("use_rfid", self.use_rfid)
-
         except Exception as e:
-            print(f"[Settings] load failed: {e}")
+            print(f"[Settings] save failed: {e}")
+        self._notify(changed)
+        return changed
 
-    def save(self):
-        path = self._settings_path()
+    # ---- internals ----
+    def _coerce(self, name: str, value):
+        coerce, default = SETTINGS_FIELDS[name]
         try:
-            data = {}
+            return coerce(value)
+        except (TypeError, ValueError) as e:
+            print(f"[Settings] invalid {name}={value!r}: {e}")
+            return copy.deepcopy(getattr(self, name, default))
 
-            if os.path.exists(path):
-                try:
-                    with open(path, "r") as f:
-                        data = json.load(f)
-                except Exception as e:
-                    print(f"[Settings] existing settings read failed: {e}")
-                    data = {}
-
-            data["tset"] = self.tset
-            data["thys"] = self.thys
-            data["top_zones_correction_factor"] = self.top_zones_correction_factor
-            data["bottom_zones_correction_factor"] = self.bottom_zones_correction_factor
-            data["tc"] = self.tc
-            data["enable_cook_algorithm"] = self.enable_cook_algorithm
-            data["enable_array_temp_control"] = self.enable_array_temp_control
-            data["use_rfid"] = self.use_rfid
-
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
+    def _diff_locked(self) -> Dict[str, Any]:
+        return {
+            name: copy.deepcopy(getattr(self, name))
+            for name in SETTINGS_FIELDS
+            if getattr(self, name) != self._saved.get(name)
+        }
 
-        except Exception as e:
-            print(f"[Settings] save failed: {e}")
+    def _notify(self, changed: Dict[str, Any]) -> None:
+        if not changed:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(dict(changed))
+            except Exception as e:
+                print(f"[Settings] listener failed: {e}")
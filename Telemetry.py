@@ -0,0 +1,89 @@
+# Telemetry.py
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from SingletonBase import SingletonBase
+
+
+def parse_temp_value(line: str) -> float | None:
+    """
+    Returns the first numeric value from strings like:
+    T1 = 54.3
+    T1=54.3
+    T1 54.3
+    50.0,0.0
+    T1=50.0,0.0
+    """
+    try:
+        s = line.strip()
+
+        if "=" in s:
+            s = s.split("=", 1)[1].strip()
+        elif s.startswith("T") and len(s) > 2 and s[1].isdigit():
+            s = s[2:].strip()
+
+        first_value = s.split(",", 1)[0].strip()
+        return float(first_value)
+
+    except Exception:
+        return None
+
+
+class TelemetryMirror(SingletonBase):
+    """
+    Thread-safe copy of the latest oven controller telemetry.
+
+    Fed from the oven serial listener (UI thread) and read by the control
+    thread, so control decisions never depend on which page is showing.
+
+    Keys:
+        "R"      -> (r1, r2) array thermistor readings
+        "T1".."T4" -> IR temperatures
+        "V"      -> list of zone supply voltages
+    Each value is stored together with the monotonic time it arrived.
+    """
+
+    def __init_once__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[str, Any] = {}
+        self._stamps: Dict[str, float] = {}
+
+    def update_from_line(self, line: str) -> None:
+        try:
+            if line.startswith("R="):
+                r1_str, r2_str = line[2:].split(",", 1)
+                self._set("R", (int(r1_str), int(r2_str)))
+            elif line[:2] in ("T1", "T2", "T3", "T4"):
+                temp = parse_temp_value(line)
+                if temp is not None:
+                    self._set(line[:2], temp)
+            elif line.startswith("V="):
+                self._set("V", [float(v) for v in line[2:].split(",") if v.strip()])
+        except (ValueError, IndexError):
+            pass
+
+    def get(self, key: str, max_age_s: Optional[float] = None):
+        """Latest value for key, or None if missing or older than max_age_s."""
+        with self._lock:
+            if key not in self._values:
+                return None
+            if max_age_s is not None and (
+                time.monotonic() - self._stamps[key] > max_age_s
+            ):
+                return None
+            return self._values[key]
+
+    def snapshot(self, max_age_s: Optional[float] = None) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                k: v
+                for k, v in self._values.items()
+                if max_age_s is None or now - self._stamps[k] <= max_age_s
+            }
+
+    def _set(self, key: str, value) -> None:
+        with self._lock:
+            self._values[key] = value
+            self._stamps[key] = time.monotonic()
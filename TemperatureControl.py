@@ -0,0 +1,449 @@
+# TemperatureControl.py
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import oven_state
+from PeriodicTimer import PeriodicTimer
+from Telemetry import TelemetryMirror
+
+logger = logging.getLogger(__name__)
+
+CONTROL_INTERVAL_S = 0.5
+TELEMETRY_POLL_INTERVAL_S = 1.0  # R / T1..T4 requests, whatever page is shown
+TELEMETRY_MAX_AGE_S = 5.0
+
+BOTTOM_ZONES = (1, 2, 3, 4)
+TOP_ZONES = (5, 6, 7, 8)
+
+# StatusListener: called on the UI thread with a copy of TemperatureController.status
+StatusListener = Callable[[Dict[str, Any]], None]
+
+
+def _top_bottom(top_scale: float, bottom_scale: float) -> Dict[int, float]:
+    scales = {zone: bottom_scale for zone in BOTTOM_ZONES}
+    scales.update({zone: top_scale for zone in TOP_ZONES})
+    return scales
+
+
+@dataclass
+class ControlAction:
+    """What a strategy wants this tick. None fields mean "leave unchanged"."""
+
+    global_scale: Optional[float] = None
+    zone_scales: Optional[Dict[int, float]] = None
+    finished: bool = False
+
+
+# ----------------------------------------------------------------------
+# Strategies
+# ----------------------------------------------------------------------
+class ControlStrategy:
+    """
+    Base class for closed-loop strategies run by TemperatureController.
+
+    reset() is called at the start of every cook with the Settings
+    instance; step() is called at a fixed rate with the telemetry mirror
+    and must return a ControlAction or None; on_resume() is called when a
+    paused cook continues. Strategies publish what the UI should show
+    through self.status.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.status: Dict[str, Any] = {}
+
+    def reset(self, settings) -> None:
+        self.status = {}
+
+    def step(
+        self, telemetry: TelemetryMirror, now: float
+    ) -> Optional[ControlAction]:
+        return None
+
+    def on_resume(self, now: float) -> None:
+        pass
+
+
+class ArrayOverTempHysteresis(ControlStrategy):
+    """
+    Array over-temperature throttle on the R= thermistor readings.
+
+    The thermistor reading falls as the array heats, so the alarm trips
+    when either reading drops below alarm_level and clears once both are
+    back above alarm_level + alarm_hysteresis. While in alarm the global
+    power scale is reduced to over_temp_power.
+    """
+
+    name = "array_over_temp"
+
+    def reset(self, settings) -> None:
+        self.alarm_level = int(settings.alarm_level)
+        self.alarm_hysteresis = int(settings.alarm_hysteresis)
+        self.over_temp_power = float(settings.over_temp_power)
+        self.in_alarm = False
+        self.status = {"overtemp": False, "global_scale": 1.0}
+
+    def step(self, telemetry, now):
+        r = telemetry.get("R", max_age_s=TELEMETRY_MAX_AGE_S)
+        if r is None:
+            return None
+
+        r1, r2 = r
+        L = self.alarm_level
+        H = self.alarm_hysteresis
+
+        if self.in_alarm:
+            in_alarm = not (r1 > L + H and r2 > L + H)
+        else:
+            in_alarm = (r1 < L) or (r2 < L)
+
+        if in_alarm == self.in_alarm:
+            return None
+
+        self.in_alarm = in_alarm
+        scale = self.over_temp_power if in_alarm else 1.0
+        self.status = {"overtemp": in_alarm, "global_scale": scale}
+        logger.info(f"[ArrayOverTemp] alarm={in_alarm}, R={r1},{r2}, scale={scale}")
+        return ControlAction(global_scale=scale)
+
+
+class CookpackHysteresis(ControlStrategy):
+    """
+    Cookpack control on T0 = average(T1, T2).
+
+    The tC countdown latches the first time T0 exceeds TSET and then runs
+    continuously; the cook finishes when it reaches zero. Above TSET the
+    top/bottom correction factors are applied, below TSET - THYS full power
+    is restored, and in between the output is left unchanged.
+    """
+
+    name = "hysteresis"
+
+    def reset(self, settings) -> None:
+        self.tset = float(settings.tset)
+        self.thys = float(settings.thys)
+        self.top_factor = float(settings.top_zones_correction_factor)
+        self.bottom_factor = float(settings.bottom_zones_correction_factor)
+        self.tc_remaining = float(settings.tc)
+        self.started = False
+        self.finished = False
+        self.control_active = False
+        self._last_tick: Optional[float] = None
+        self.top_pct = 100.0
+        self.bottom_pct = 100.0
+        self._publish()
+
+    def on_resume(self, now):
+        # time spent paused does not count against tC
+        if self.started:
+            self._last_tick = now
+
+    def _get_t0(self, telemetry) -> float | None:
+        t1 = telemetry.get("T1", max_age_s=TELEMETRY_MAX_AGE_S)
+        t2 = telemetry.get("T2", max_age_s=TELEMETRY_MAX_AGE_S)
+        if t1 is None or t2 is None:
+            return None
+        return (t1 + t2) / 2.0
+
+    def _publish(self, t0: float | None = None) -> None:
+        self.status = {
+            "tset": self.tset,
+            "thys": self.thys,
+            "t0": t0,
+            "tc_remaining": self.tc_remaining,
+            "started": self.started,
+            "control_active": self.control_active,
+            "top_pct": self.top_pct,
+            "bottom_pct": self.bottom_pct,
+        }
+
+    def _advance_countdown(self, t0: float, now: float) -> None:
+        # Latch started the first time T0 exceeds TSET.
+        # After this point, tC keeps counting down no matter what T0 does.
+        if (not self.started) and (t0 > self.tset):
+            self.started = True
+            self._last_tick = now
+            logger.info(
+                f"[Cookpack] Started countdown, T0={t0:.2f} crossed TSET={self.tset:.2f}, "
+                f"tC={self.tc_remaining:.1f}s"
+            )
+
+        if self.started:
+            if self._last_tick is not None:
+                self.tc_remaining = max(0.0, self.tc_remaining - (now - self._last_tick))
+            self._last_tick = now
+
+    def _scales(self, t0: float, now: float) -> tuple[float, float] | None:
+        """Return (top_scale, bottom_scale), or None to leave output unchanged."""
+        # Above TSET -> apply Cookpack correction factors.
+        if t0 > self.tset:
+            self.control_active = True
+            return self.top_factor / 100.0, self.bottom_factor / 100.0
+
+        # Below lower hysteresis threshold -> restore full power,
+        # but do NOT stop the countdown once started.
+        if t0 < (self.tset - self.thys):
+            if self.control_active:
+                logger.info(
+                    f"[Cookpack] Left control band, T0={t0:.2f} < (TSET-THYS)={(self.tset - self.thys):.2f}"
+                )
+            self.control_active = False
+            return 1.0, 1.0
+
+        # Between (TSET-THYS) and TSET: leave current output state unchanged.
+        return None
+
+    def step(self, telemetry, now):
+        if self.finished:
+            return None
+
+        t0 = self._get_t0(telemetry)
+        if t0 is None:
+            return None
+
+        self._advance_countdown(t0, now)
+
+        action = ControlAction()
+        scales = self._scales(t0, now)
+        if scales is not None:
+            top_scale, bottom_scale = scales
+            self.top_pct = top_scale * 100.0
+            self.bottom_pct = bottom_scale * 100.0
+            action.zone_scales = _top_bottom(top_scale, bottom_scale)
+
+        if self.started and self.tc_remaining <= 0.0:
+            logger.info("[Cookpack] tC expired, ending cook cycle")
+            self.finished = True
+            self.control_active = False
+            self.top_pct = self.bottom_pct = 100.0
+            action = ControlAction(zone_scales=_top_bottom(1.0, 1.0), finished=True)
+
+        self._publish(t0)
+        return action
+
+
+class CookpackPID(CookpackHysteresis):
+    """
+    Cookpack control with a PID loop on T0 = average(T1, T2).
+
+    Same tC countdown as CookpackHysteresis, but the top and bottom arrays
+    are scaled continuously by the PID output (clamped to
+    [cookpack_pid_min_scale, 1.0]) instead of switching between full power
+    and the correction factors. The integral is frozen while the output is
+    saturated to avoid wind-up.
+    """
+
+    name = "pid"
+
+    def reset(self, settings) -> None:
+        super().reset(settings)
+        self.kp = float(settings.cookpack_pid_kp)
+        self.ki = float(settings.cookpack_pid_ki)
+        self.kd = float(settings.cookpack_pid_kd)
+        self.min_scale = max(0.0, min(1.0, float(settings.cookpack_pid_min_scale)))
+        self._integral = 0.0
+        self._prev_t0: float | None = None
+        self._prev_time: float | None = None
+
+    def on_resume(self, now):
+        super().on_resume(now)
+        self._prev_time = None
+
+    def _scales(self, t0, now):
+        dt = (now - self._prev_time) if self._prev_time is not None else 0.0
+        error = self.tset - t0
+
+        derivative = 0.0
+        if dt > 0 and self._prev_t0 is not None:
+            # derivative on measurement: no kick when TSET changes
+            derivative = -(t0 - self._prev_t0) / dt
+
+        unclamped = (
+            self.kp * error + self.ki * (self._integral + error * dt) + self.kd * derivative
+        )
+        scale = max(self.min_scale, min(1.0, unclamped))
+        if scale == unclamped:
+            self._integral += error * dt
+
+        self._prev_t0 = t0
+        self._prev_time = now
+        self.control_active = scale < 1.0
+        return scale, scale
+
+
+COOKPACK_STRATEGIES = {
+    CookpackHysteresis.name: CookpackHysteresis,
+    CookpackPID.name: CookpackPID,
+}
+
+
+# ----------------------------------------------------------------------
+# Engine
+# ----------------------------------------------------------------------
+class TemperatureController:
+    """
+    Runs the selected control strategies at a fixed rate on a control thread
+    for every cook path, against the TelemetryMirror.
+
+    apply_fn(global_scale, zone_scales) applies the merged scales to the
+    active cook (either argument may be None for "unchanged").
+    poll_fn(), if given, requests fresh telemetry from the oven controller;
+    it is called every poll_interval_s from the same thread, cooking or
+    not, so the mirror is fed on every cook path (and the admin page's
+    communication watchdog keeps getting R= replies).
+    on_finished() is called once when a strategy ends the cook.
+    Status listeners are notified on the UI thread via tk_root.after(...).
+    """
+
+    def __init__(
+        self,
+        apply_fn: Callable[[Optional[float], Optional[Dict[int, float]]], None],
+        tk_root=None,
+        interval_s: float = CONTROL_INTERVAL_S,
+        poll_fn: Optional[Callable[[], None]] = None,
+        poll_interval_s: float = TELEMETRY_POLL_INTERVAL_S,
+    ):
+        self._apply_fn = apply_fn
+        self.tk_root = tk_root
+        self.telemetry = TelemetryMirror.Instance()
+        self._poll_fn = poll_fn
+        self._poll_every = max(1, round(float(poll_interval_s) / float(interval_s)))
+        self._ticks = 0
+
+        self._lock = threading.Lock()
+        self._strategies: List[ControlStrategy] = []
+        self._active = False
+        self._paused = False
+        self._on_finished: Optional[Callable[[], None]] = None
+        self._listeners: List[StatusListener] = []
+        self.status: Dict[str, Any] = {}
+
+        self._timer = PeriodicTimer(interval_s, self._tick)
+        self._timer.start()
+
+    # ---- public API ----
+    def start_cook(self, settings, on_finished: Optional[Callable[[], None]] = None):
+        strategies: List[ControlStrategy] = []
+        if settings.enable_array_temp_control:
+            strategies.append(ArrayOverTempHysteresis())
+        if settings.enable_cook_algorithm:
+            cls = COOKPACK_STRATEGIES.get(
+                settings.cookpack_control_strategy, CookpackHysteresis
+            )
+            strategies.append(cls())
+
+        for strategy in strategies:
+            strategy.reset(settings)
+
+        with self._lock:
+            self._strategies = strategies
+            self._on_finished = on_finished
+            self._active = True
+            self._paused = False
+        self._publish()
+
+    def stop_cook(self):
+        with self._lock:
+            self._active = False
+            self._paused = False
+            self._on_finished = None
+
+    def pause(self):
+        with self._lock:
+            self._paused = True
+
+    def resume(self):
+        now = time.monotonic()
+        with self._lock:
+            if not self._paused:
+                return
+            self._paused = False
+            for strategy in self._strategies:
+                strategy.on_resume(now)
+
+    def is_active(self) -> bool:
+        with self._lock:
+            return self._active
+
+    def add_listener(self, fn: StatusListener):
+        if fn not in self._listeners:
+            self._listeners.append(fn)
+
+    def remove_listener(self, fn: StatusListener):
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    # ---- internals ----
+    def _poll(self) -> None:
+        due = self._ticks % self._poll_every == 0
+        self._ticks += 1
+        if self._poll_fn is None or not due:
+            return
+        try:
+            self._poll_fn()
+        except Exception as e:
+            print(f"[TemperatureController] telemetry poll failed: {e}")
+
+    def _tick(self):
+        self._poll()
+
+        with self._lock:
+            if self._paused or not self._active or not oven_state.get_running():
+                return
+            strategies = list(self._strategies)
+
+        now = time.monotonic()
+        global_scale = None
+        zone_scales: Dict[int, float] = {}
+        finished = False
+
+        for strategy in strategies:
+            try:
+                action = strategy.step(self.telemetry, now)
+            except Exception as e:
+                print(f"[TemperatureController] {strategy.name} step failed: {e}")
+                continue
+            if action is None:
+                continue
+            if action.global_scale is not None:
+                global_scale = action.global_scale
+            if action.zone_scales:
+                zone_scales.update(action.zone_scales)
+            finished = finished or action.finished
+
+        if global_scale is not None or zone_scales:
+            try:
+                self._apply_fn(global_scale, zone_scales or None)
+            except Exception as e:
+                print(f"[TemperatureController] apply failed: {e}")
+
+        self._publish()
+
+        if finished:
+            with self._lock:
+                on_finished, self._on_finished = self._on_finished, None
+                self._active = False
+            if on_finished:
+                try:
+                    on_finished()
+                except Exception as e:
+                    print(f"[TemperatureController] on_finished failed: {e}")
+
+    def _publish(self):
+        status: Dict[str, Any] = {"strategies": []}
+        for strategy in self._strategies:
+            status["strategies"].append(strategy.name)
+            status[strategy.name] = dict(strategy.status)
+        self.status = status
+
+        if not self.tk_root or not hasattr(self.tk_root, "after"):
+            return
+        for fn in list(self._listeners):
+            try:
+                self.tk_root.after(0, fn, dict(status))
+            except Exception:
+                pass
@@ -0,0 +1,91 @@
+"""
+Benchmark: SelectMealPage scroll frames, full compose vs dirty regions.
+
+    python bench_overlay_scroll.py [meal count] [passes]
+
+Scrolls a SelectMealPage with meal count items down to the last row and
+back up, passes times. For each step it times a full compose of the frame
+(what set_page did before) against diffing the overlay items and drawing
+only the dirty regions (what it does now for a same-page update), checks
+that the patched frame is pixel-identical to the full one, and prints the
+mean frame time and the share of the frame that was redrawn.
+
+Without a display the PhotoImage upload can't be timed here; each path
+includes a tobytes() of what it would upload (the full frame vs the
+patches) as a stand-in, since the upload is a copy of those pixels.
+"""
+import os
+import sys
+import time
+
+from OverlayRenderer import compose, dirty_rects, overlay_items, rect_area, render_patches
+from RenderCache import RenderCache
+from hmi_consts import HMISizePos
+from select_meal_page import SelectMealPage
+
+
+def scroll_rows(page: SelectMealPage, passes: int) -> list:
+    down = list(range(page.max_scroll_row + 1))
+    return (down + down[-2:0:-1]) * passes + [0]
+
+
+def main(meal_count: int = 30, passes: int = 5) -> None:
+    labels = [f"Item {i + 1}" for i in range(meal_count)]
+    labels[5] = "Reheat"
+    page = SelectMealPage(meal_labels=labels)
+    HMISizePos.set_resolution("1280x800")  # as the HMI runs
+    base = RenderCache.Instance().base_image(page.image_path)
+    frame_px = base.width * base.height
+
+    # warm fonts and the overlay image cache so neither path pays for them
+    compose(base, overlay_items(page))
+
+    previous_items = overlay_items(page)
+    previous_frame = compose(base, previous_items)
+
+    full_s = patch_s = 0.0
+    redrawn_px = 0
+    rows = scroll_rows(page, passes)[1:]
+    for row in rows:
+        page.scroll_row = row
+        page._rebuild()
+
+        t0 = time.perf_counter()
+        items = overlay_items(page)
+        full = compose(base, items)
+        full.tobytes()
+        t1 = time.perf_counter()
+        items = overlay_items(page)
+        rects = dirty_rects(previous_items, items, base.size)
+        patches = render_patches(base, items, rects)
+        for _rect, patch in patches:
+            patch.tobytes()
+        t2 = time.perf_counter()
+
+        full_s += t1 - t0
+        patch_s += t2 - t1
+        redrawn_px += rect_area(rects)
+
+        patched = previous_frame.copy()
+        for rect, patch in patches:
+            patched.paste(patch, rect[:2])
+        assert patched.tobytes() == full.tobytes(), f"patched frame differs at row {row}"
+
+        previous_items, previous_frame = items, full
+
+    n = len(rows)
+    print(f"scroll steps:          {n} ({meal_count} meals, {page.max_scroll_row + 1} rows)")
+    print(f"full compose:          {full_s / n * 1000:7.2f} ms/frame (100% redrawn)")
+    print(
+        f"dirty regions:         {patch_s / n * 1000:7.2f} ms/frame "
+        f"({redrawn_px / n / frame_px * 100:4.1f}% redrawn, "
+        f"{full_s / patch_s:4.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 30,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+    )
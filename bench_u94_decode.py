@@ -0,0 +1,84 @@
+"""
+Benchmark: per-payload u94 decoding vs. the NumPy batch decoder.
+
+    python bench_u94_decode.py [count]
+
+Generates count random valid payloads (plus a few invalid ones), decodes
+them with decode_program_to_dict() + Program.from_dict() one by one and
+with decode_programs_batch(), checks both agree, and prints the timings.
+"""
+import random
+import sys
+import time
+
+from ProgramBatchDecoder import decode_programs_batch
+from SequenceStructure import (
+    NUM_OF_STEPS,
+    NUM_OF_ZONES,
+    Program,
+    decode_program_to_dict,
+    encode_program_to_u94,
+)
+
+
+def make_payloads(count: int, seed: int = 1) -> list:
+    rng = random.Random(seed)
+    payloads = []
+    for i in range(count):
+        program = Program.empty(f"SKU {i}").with_steps(
+            {
+                (zone, step): (rng.randint(0, 100), rng.randint(0, 3600), None)
+                for zone in range(NUM_OF_ZONES)
+                for step in range(NUM_OF_STEPS)
+            }
+        )
+        payloads.append(encode_program_to_u94(program))
+
+    # a few broken tags: short, bad character, power out of range
+    if count >= 3:
+        payloads[0] = payloads[0][:-1]
+        payloads[1] = payloads[1][:-1] + " "
+        payloads[2] = payloads[2].split(",", 1)[0] + ",#!" + payloads[2][-126:]
+    return payloads
+
+
+def decode_one_by_one(payloads: list) -> dict:
+    programs = {}
+    for i, payload in enumerate(payloads):
+        try:
+            programs[i] = Program.from_dict(decode_program_to_dict(payload))
+        except ValueError:
+            pass
+    return programs
+
+
+def main(count: int = 5000) -> None:
+    payloads = make_payloads(count)
+
+    t0 = time.perf_counter()
+    scalar = decode_one_by_one(payloads)
+    t1 = time.perf_counter()
+    result = decode_programs_batch(payloads)
+    t2 = time.perf_counter()
+    batch = result.programs()
+    t3 = time.perf_counter()
+
+    assert scalar == batch, "batch decoder disagrees with decode_program_to_dict"
+
+    scalar_s = t1 - t0
+    validate_s = t2 - t1
+    total_s = t3 - t1
+    print(f"payloads:               {count} ({result.valid_count} valid)")
+    print(f"per-payload decode:     {scalar_s * 1000:8.1f} ms")
+    print(
+        f"batch validate/decode:  {validate_s * 1000:8.1f} ms "
+        f"({scalar_s / validate_s:5.1f}x)"
+    )
+    print(
+        f"batch incl. Programs:   {total_s * 1000:8.1f} ms "
+        f"({scalar_s / total_s:5.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
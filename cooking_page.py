@@ -1,11 +1,10 @@
-import json
 import os
 import time
 from typing import List, Optional
 
 
 from hotspots import Hotspot
-from hmi_consts import PROGRAMS_DIR
+from ProgramRepository import ProgramRepository
 
 
 class CookingPage:
@@ -49,6 +48,7 @@ class CookingPage:
         print("[CookingPage] Back clicked")
         # Treat "Back" as a full stop for the progress ring and cook cycle
         self._stop_progress()
+        self._discard_resume()
         try:
             self.controller.stop_current_cook()
         except Exception as e:
@@ -129,9 +129,11 @@ class CookingPage:
                 )
                 return
 
+            # The controller returns the time left; a resumed cook keeps the
+            # ring scaled to the whole cook, as prepared in on_show()
             print(f"[CookingPage] Starting circular countdown for {total:.1f}s")
             self._paused = False
-            self._start_progress(total)
+            self._start_progress(max(self._total_time, total), total)
             return
 
         # --- PAUSE case (currently running) ---
@@ -148,11 +150,11 @@ class CookingPage:
                 # Reheat does not use CookingSequenceManager.
                 # Explicitly remove power from every zone.
                 try:
-                    self.controller.serial_all_zones_off()
+                    self.controller.pause_reheat_cycle()
                 except Exception as e:
                     print(
                         "[CookingPage] "
-                        f"reheat pause serial_all_zones_off failed: {e}"
+                        f"reheat pause_reheat_cycle failed: {e}"
                     )
             else:
                 # Normal meal programs use CookingSequenceManager.
@@ -274,15 +276,15 @@ class CookingPage:
             # Reheat mode: we ran all zones at 80% for a fixed time,
             # so when the timer ends we must explicitly turn them off.
             try:
-                if hasattr(self.controller, "serial_all_zones_off"):
-                    self.controller.serial_all_zones_off()
+                if hasattr(self.controller, "finish_reheat_cycle"):
+                    self.controller.finish_reheat_cycle()
                 else:
                     print(
-                        "[CookingPage] controller has no serial_all_zones_off; "
+                        "[CookingPage] controller has no finish_reheat_cycle; "
                         "cannot power down zones for reheat"
                     )
             except Exception as e:
-                print(f"[CookingPage] serial_all_zones_off at reheat end failed: {e}")
+                print(f"[CookingPage] finish_reheat_cycle at reheat end failed: {e}")
 
             # Optionally: show "Cooking Finished" page if available
             if hasattr(self.controller, "show_CookingFinishedPage"):
@@ -302,9 +304,12 @@ class CookingPage:
         #         except Exception as e:
         #             print(f"[CookingPage] stop_current_cook at end failed: {e}")
 
-    def _start_progress(self, total_seconds: float):
+    def _start_progress(
+        self, total_seconds: float, remaining_seconds: Optional[float] = None
+    ):
         """
-        Start / restart the circular countdown for the given total time.
+        Start / restart the circular countdown for the given total time,
+        from remaining_seconds (default: the full time) for a resumed cook.
         """
         try:
             total_seconds = float(total_seconds or 0.0)
@@ -328,11 +333,14 @@ class CookingPage:
 
         self._total_time = max(0.0, total_seconds)
         self._remaining_time = self._total_time
-        self._start_epoch = time.time()
+        if remaining_seconds is not None:
+            self._remaining_time = max(0.0, min(self._total_time, remaining_seconds))
+        # remaining = total - (now - _start_epoch), as in _resume_progress()
+        self._start_epoch = time.time() - (self._total_time - self._remaining_time)
         self._running = True
         self._paused = False
 
-        # Initialize ring at full time
+        # Initialize ring at the time left
         cp.update_progress(self._remaining_time, self._total_time)
         self._schedule_tick()
 
@@ -448,17 +456,12 @@ class CookingPage:
 
         else:
             program_number = 9999 if meal_index == 9999 else meal_index + 31
-            path = str(PROGRAMS_DIR / f"program{program_number}.alt")
+            program = ProgramRepository.Instance().get(program_number)
 
-            try:
-                with open(path, "r") as f:
-                    data = json.load(f)
-
-                total_time_str = data.get("total_time") or "0:00"
-                total_timef = CookingPage.mmss_to_seconds(total_time_str)
-
-            except Exception as e:
-                print(f"[CookingPage] Failed to read {path}: {e}")
+            if program is not None:
+                total_timef = program.total_seconds
+            else:
+                print(f"[CookingPage] Failed to read program{program_number}")
                 total_timef = 0.0
 
         # Store base time; on_stop_clicked will start the actual program
@@ -468,11 +471,24 @@ class CookingPage:
         self._running = False
         self._paused = False
 
-        # Prepare the circular ring to show the full time initially
+        # Resuming a cook interrupted by a restart: show the time left of
+        # the whole cook (reheat_seconds already holds only the time left)
+        resume = None
+        if self.controller and hasattr(self.controller, "pending_cook_resume"):
+            resume = self.controller.pending_cook_resume(meal_index)
+        if resume and resume["total"] > 0:
+            self._total_time = resume["total"]
+            self._remaining_time = max(0.0, resume["total"] - resume["elapsed"])
+            print(
+                "[CookingPage] "
+                f"Resuming with {self._remaining_time:.1f}s of {self._total_time:.1f}s"
+            )
+
+        # Prepare the circular ring to show the time left initially
         cp = self._ensure_progress_widget()
         if cp is not None:
             if self._total_time > 0:
-                cp.update_progress(self._total_time, self._total_time)
+                cp.update_progress(self._remaining_time, self._total_time)
             else:
                 cp.update_progress(0.0, 1.0)
 
@@ -508,6 +524,7 @@ class CookingPage:
         """
         # Stop and hide the progress widget
         self._stop_progress()
+        self._discard_resume()
 
         # Reset all timing state
         self._total_time = 0.0
@@ -516,6 +533,10 @@ class CookingPage:
         self._running = False
         self._paused = False
 
+    def _discard_resume(self):
+        if self.controller and hasattr(self.controller, "discard_cook_resume"):
+            self.controller.discard_cook_resume()
+
     @staticmethod
     def mmss_to_seconds(mmss: str) -> float:
         minutes, seconds = map(int, mmss.split(":"))
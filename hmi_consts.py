@@ -19,8 +19,11 @@ ROOT_DIR = app_root()
 ASSETS_DIR = ROOT_DIR / "assets"
 SETTINGS_DIR = ROOT_DIR / "settings"
 PROGRAMS_DIR = ROOT_DIR / "programs"
+ASSET_CACHE_DIR = ROOT_DIR / "cache" / "assets"
 
 SETTINGS_FILE = SETTINGS_DIR / "settings.alt"
+COOK_JOURNAL_FILE = SETTINGS_DIR / "cook_journal.log"
+PROGRAM_CATALOG_FILE = PROGRAMS_DIR / "catalog.json"
 
 
 class LightOnly:
@@ -113,6 +116,16 @@ class HMISizePos:
         cls.TEXT_SIZE = max(8, int(cls.TEXT_SIZE_BASE * cls.SCALE))
         cls.ICON_SIZE = max(12, int(cls.ICON_SIZE_BASE * cls.SCALE))
 
+    @classmethod
+    def profiles(cls) -> dict:
+        """{"800x480": (800, 480), ...} for every supported resolution."""
+        return {res: (p["w"], p["h"]) for res, p in cls._PROFILES.items()}
+
+    @classmethod
+    def profile_size(cls, res: str) -> tuple:
+        p = cls._PROFILES[res]
+        return p["w"], p["h"]
+
     # --- scaling helpers your pages call ---
     @classmethod
     def s(cls, v: int | float) -> int:
@@ -3,7 +3,7 @@ import os
 import time
 from typing import List, Optional
 import customtkinter as ctk
-from SerialService import SerialService
+from RfidService import RfidRead, RfidService
 from hotspots import Hotspot
 from SelectProgramPage import save_encoded_program
 
@@ -39,8 +39,8 @@ class HomePage:
         # Track recent logo click timestamps (seconds since epoch)
         self._logo_click_times: list[float] = []
 
-        self.rfid_serial: Optional[SerialService] = getattr(
-            self.controller, "rfid_serial", None
+        self.rfid_service: Optional[RfidService] = getattr(
+            self.controller, "rfid_service", None
         )
 
     # ------------------------------------------------------------------
@@ -97,48 +97,35 @@ class HomePage:
         print("In on_show homepage")
         if self.controller:
             self.controller.rfid_tag = ""
-        if self.rfid_serial:
-            try:
-                self.rfid_serial.add_listener(self._on_rfid_serial_line)
-            except Exception as e:
-                print("Error in call to self.rfid_serial.add_listener(self._on_rfid_serial_line)")
-
-    def _on_rfid_serial_line(self, line: str) -> None:
-        if "N=1" in line and self.rfid_serial and self.controller:
-            self.controller.after(
-                20,
-                self.rfid_serial.send,
-                "D\r"
-            )
-        print(f"RFID: {line}")
-
-         # RFID data received
-        if line.startswith("D="):
-            print(f"RFID Data: {line}")
-            # remove the leading "D="
-            line = line[2:]
-            encoded_program  = line
-            if self.controller:
-                # Optionally store the tag for the next page
-                self.controller.rfid_tag = line
-
-                decoded_program = save_encoded_program(encoded_program=encoded_program, program_number=9999,)
-
-                # Switch to the Prepare For Cooking page
-                self.controller.after(
-                    0,
-                    self.controller.show_PrepareForCookingPage1,
-                    False,     # from_info=False
-                    9999,      # RFID program number / meal index
-                )
-       
+        if self.rfid_service:
+            self.rfid_service.add_listener(self._on_rfid_read)
+
+    def _on_rfid_read(self, read: RfidRead) -> None:
+        print(f"RFID Data: {read.payload}")
+        if not self.controller:
+            return
+        # Optionally store the tag for the next page
+        self.controller.rfid_tag = read.payload
+
+        try:
+            save_encoded_program(encoded_program=read.payload, program_number=9999)
+        except Exception as e:
+            print(f"[HomePage] saving RFID program failed: {e}")
+            return
+
+        # Already on the UI thread: switch to the Prepare For Cooking page now
+        self.controller.show_PrepareForCookingPage1(
+            False,     # from_info=False
+            9999,      # RFID program number / meal index
+        )
+        self.rfid_service.record_navigation(read)
+
     def on_hide(self):
         print("[HomePage] on_hide")
-        try:
-            if self.rfid_serial:
-                self.rfid_serial.remove_listener(self._on_rfid_serial_line)
-        except Exception:
-            pass
+        if self.rfid_service:
+            self.rfid_service.remove_listener(self._on_rfid_read)
+
+
 # ----------------------------------------------------------------------
 # Self-test / harness for HomePage + ImageHotspotView
 # ----------------------------------------------------------------------
@@ -1,10 +1,14 @@
 # hotspots.py
+import functools
 from dataclasses import dataclass
-from typing import Callable, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple
 
 Rect = Tuple[int, int, int, int]
 HotspotHandler = Callable[[], None]
 
+# Side of one HotspotIndex grid cell, in screen pixels
+HOTSPOT_CELL = 64
+
 
 # @dataclass is a Python decorator (from the dataclasses module) that
 # automatically generates boilerplate code for classes that primarily store data.
@@ -19,3 +23,65 @@ class Hotspot:
     name: str
     rect: Rect  # (x1, y1, x2, y2)
     handler: HotspotHandler
+    priority: int = 0  # where hotspots overlap, the highest priority wins
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_grid(
+    layout: Tuple[Tuple[Rect, int], ...], cell: int, cols: int, rows: int
+) -> Tuple[Tuple[int, ...], ...]:
+    """
+    For each grid cell (row-major), the indices into layout of the rects
+    touching it, highest priority first, then in list order.
+    """
+    buckets: List[List[int]] = [[] for _ in range(cols * rows)]
+    order = sorted(range(len(layout)), key=lambda i: (-layout[i][1], i))
+    for i in order:
+        x1, y1, x2, y2 = layout[i][0]
+        if x2 < 0 or y2 < 0 or x1 > cols * cell or y1 > rows * cell:
+            continue
+        for row in range(max(0, y1 // cell), min(rows - 1, y2 // cell) + 1):
+            for col in range(max(0, x1 // cell), min(cols - 1, x2 // cell) + 1):
+                buckets[row * cols + col].append(i)
+    return tuple(tuple(bucket) for bucket in buckets)
+
+
+class HotspotIndex:
+    """
+    Grid-bucketed lookup of a page's hotspots, so a tap tests only the few
+    hotspots in its cell instead of every hotspot on the page.
+
+    Compiling is cached on the hotspot geometry (rects and priorities), not
+    on the handlers, so a page that rebuilds an identical hotspot list --
+    or returns to a layout it had before -- reuses the compiled grid.
+
+    Rects are inclusive on all edges, as before. Where hotspots overlap,
+    hit() returns the one with the highest priority, then the first listed.
+    """
+
+    def __init__(
+        self,
+        hotspots: Sequence[Hotspot],
+        width: int,
+        height: int,
+        cell: int = HOTSPOT_CELL,
+    ):
+        self.hotspots = list(hotspots)
+        self.cell = max(1, int(cell))
+        self.cols = max(1, -(-int(width) // self.cell))
+        self.rows = max(1, -(-int(height) // self.cell))
+        layout = tuple(
+            (tuple(int(v) for v in hs.rect), int(hs.priority)) for hs in self.hotspots
+        )
+        self._buckets = _compile_grid(layout, self.cell, self.cols, self.rows)
+
+    def hit(self, x: int, y: int) -> Optional[Hotspot]:
+        col, row = int(x) // self.cell, int(y) // self.cell
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return None
+        for i in self._buckets[row * self.cols + col]:
+            hs = self.hotspots[i]
+            x1, y1, x2, y2 = hs.rect
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return hs
+        return None
@@ -1,14 +1,29 @@
 import os
+import time
 import tkinter as tk
-from typing import Optional, Callable
+from typing import Any, Dict, List, Optional, Callable
 
 import customtkinter as ctk
-from PIL import Image, ImageTk, ImageDraw, ImageFont
+from PIL import ImageTk
 from hmi_consts import ASSETS_DIR
+from AssetPreloader import BANNER_ICON_SIZE
+from RenderCache import RenderCache
+from OverlayRenderer import compose, dirty_rects, overlay_items, rect_area, render_patches
 
 from CircularProgress import CircularProgress
 from time_adjust_control import TimeAdjustControl
 from DoorSafety import DoorSafety
+from Settings import Settings
+from hotspots import HotspotIndex
+
+
+def _rounded_rect_points(x1, y1, x2, y2, r):
+    """Polygon points that draw a rounded rectangle with smooth=True."""
+    return [
+        x1 + r, y1, x2 - r, y1, x2, y1, x2, y1 + r,
+        x2, y2 - r, x2, y2, x2 - r, y2, x1 + r, y2,
+        x1, y2, x1, y2 - r, x1, y1 + r, x1, y1,
+    ]
 
 
 class ImageHotspotView(ctk.CTkFrame):
@@ -24,8 +39,30 @@ class ImageHotspotView(ctk.CTkFrame):
     Optional page_obj overlay support:
       - overlay_shapes: list[dict]
       - overlay_text: list[dict]
+
+    Composed frames are kept in the RenderCache, keyed by page class, image
+    and overlay state, so showing a page that looks the same as before
+    skips decoding, drawing and PhotoImage conversion.
+
+    When the new page has the same class and image as the one on screen
+    (e.g. SelectMealPage scrolled by a row), only the areas whose overlay
+    items changed are redrawn and copied into a copy of the current
+    PhotoImage; see OverlayRenderer. Give overlay items a stable "id" so
+    unchanged layers are recognised.
+
+    The meal overlay, the status banners (drawer open, lost communication,
+    door lock error) and the reheat attention border are canvas items,
+    grouped by tag and shown or hidden with itemconfigure(state=...).
+    CircularProgress and TimeAdjustControl stay widgets.
+
+    Taps are resolved through a HotspotIndex compiled in set_page. With the
+    admin setting show_hotspots on, every hotspot is outlined and each tap
+    shows which hotspot it hit and how long the hit test took.
     """
 
+    # Above this share of the frame, a full compose is cheaper than patches
+    INCREMENTAL_MAX_AREA = 0.5
+
     _instance: Optional["ImageHotspotView"] = None
 
     IMG_WIDTH = 1280
@@ -39,8 +76,13 @@ class ImageHotspotView(ctk.CTkFrame):
         self._initialized = True
 
         self._current_page = None
+        self._overlay_ms: Dict[str, List[float]] = {}
+        # (page class, image path, overlay items) of the frame on screen
+        self._shown_overlay: Optional[tuple] = None
         self._tk_img: Optional[ImageTk.PhotoImage] = None
-        self._canvas_image_id: Optional[int] = None
+        self._hotspot_index: Optional[HotspotIndex] = None
+        self._indexed_hotspots: Optional[list] = None
+        self._hit_test_us: List[float] = []
 
         self.canvas = tk.Canvas(
             self,
@@ -53,39 +95,26 @@ class ImageHotspotView(ctk.CTkFrame):
         self.canvas.pack()
         self.canvas.bind("<Button-1>", self._on_click)
 
-        self._overlay_ctk_image = None
-        self.overlay_label = ctk.CTkLabel(
-            self, text="", fg_color="black", width=200, height=200
-        )
-        self.overlay_label.place(x=505, y=225)
-        self.overlay_label.lower()
+        # Created first so every overlay item below stacks above the page
+        self._canvas_image_id = self.canvas.create_image(0, 0, anchor="nw")
 
-        self.label = ctk.CTkLabel(
-            self,
-            text="",
-            fg_color="black",
-            bg_color="black",
-            width=300,
-            height=57,
-            font=ctk.CTkFont(family="Poppins", size=32, weight="bold"),
+        # Meal overlay (photo, name, cook time): canvas items, shown and
+        # hidden with itemconfigure(state=...) instead of stacked widgets
+        self._overlay_photo: Optional[ImageTk.PhotoImage] = None
+        self._overlay_image_id = self.canvas.create_image(
+            505, 225, anchor="nw", state="hidden", tags=("meal",)
         )
-        self.label.place(x=490, y=435)
-        self.label.lower()
-
-        self.cook_time_label = ctk.CTkLabel(
-            self,
-            text="00:00",
-            fg_color="black",
-            bg_color="black",
-            width=75,
-            height=28,
-            font=ctk.CTkFont(family="Poppins", size=28, weight="normal"),
+        self._overlay_name_id = self._create_text_box(
+            (490, 435, 790, 492), "", ("Poppins", -32, "bold"), "meal"
+        )
+        self._overlay_time_id = self._create_text_box(
+            (674, 559, 749, 587), "00:00", ("Poppins", -28, "normal"), "meal"
         )
-        self.cook_time_label.place(x=674, y=559)
-        self.cook_time_label.lower()
 
         self.circular_progress: Optional[CircularProgress] = None
         self.reheat_time_control: Optional[TimeAdjustControl] = None
+        self._center_overlay_photo: Optional[ImageTk.PhotoImage] = None
+        self._center_overlay_id: Optional[int] = None
 
         self._reheat_attention_after_id: Optional[str] = None
         self._reheat_attention_active: bool = False
@@ -93,91 +122,39 @@ class ImageHotspotView(ctk.CTkFrame):
         self._last_reheat_seconds: int = 0
         self._external_reheat_on_change: Optional[Callable[[int], None]] = None
 
-        self.reheat_attention_frame = ctk.CTkFrame(
-            self,
-            width=590,
-            height=104,
-            corner_radius=28,
-            fg_color="transparent",
-            bg_color="transparent",
-            border_width=3,
-            border_color="#D19A1A",
-        )
-        self.reheat_attention_frame.place(x=343, y=332)
-        self.reheat_attention_frame.lower()
-        self.reheat_attention_frame.place_forget()
-
-        drawer_img = Image.open(f"{ASSETS_DIR}/drawer.png").convert("RGBA")
-        drawer_img = drawer_img.resize((48, 48))
-
-        self._drawer_ctk_image = ctk.CTkImage(
-            light_image=drawer_img,
-            dark_image=drawer_img,
-            size=(48, 48),
-        )
-
-        comm_img = Image.open(f"{ASSETS_DIR}/lost_comm.png").convert("RGBA")
-        comm_img = comm_img.resize((48, 48))
-
-        self._comm_ctk_image = ctk.CTkImage(
-            light_image=comm_img,
-            dark_image=comm_img,
-            size=(48, 48),
-        )
-
-        self.door_overlay = ctk.CTkLabel(
-            self,
-            text=" Drawer Open",
-            image=self._drawer_ctk_image,
-            compound="left",
-            fg_color="#000000",
-            bg_color="#000000",
-            text_color="white",
-            font=ctk.CTkFont(family="Poppins", size=28, weight="bold"),
-            width=200,
-            height=45,
+        # Border around the reheat time control; the control itself is a
+        # widget and always sits above canvas items
+        self._reheat_attention_id = self.canvas.create_polygon(
+            _rounded_rect_points(346, 335, 930, 433, 25),
+            smooth=True,
+            fill="",
+            outline="#D19A1A",
+            width=3,
+            state="hidden",
+            tags=("reheat_attention",),
         )
-        self.door_overlay.place(relx=0.73, rely=0.96, anchor="s")
-        self.door_overlay.lower()
 
-        self.comm_error_overlay = ctk.CTkLabel(
-            self,
-            text=" Lost Communication!",
-            image=self._comm_ctk_image,
-            compound="left",
-            fg_color="#000000",
-            bg_color="#000000",
-            text_color="white",
-            font=ctk.CTkFont(family="Poppins", size=28, weight="bold"),
-            width=200,
-            height=45,
+        self._banner_icons: Dict[str, ImageTk.PhotoImage] = {}
+        self._create_banner("door_banner", "drawer.png", " Drawer Open", 0.73)
+        self._create_banner(
+            "comm_banner", "lost_comm.png", " Lost Communication!", 0.25
         )
-        self.comm_error_overlay.place(relx=0.25, rely=0.96, anchor="s")
-        self.comm_error_overlay.lower()
-
-        lock_img = Image.open(f"{ASSETS_DIR}/broken_lock.png").convert("RGBA")
-        lock_img = lock_img.resize((48, 48))
-
-        self._door_lock_ctk_image = ctk.CTkImage(
-            light_image=lock_img,
-            dark_image=lock_img,
-            size=(48, 48),
+        self._create_banner(
+            "door_lock_banner", "broken_lock.png", " Door Lock Error!", 0.51
         )
 
-        self.door_lock_error_overlay = ctk.CTkLabel(
-            self,
-            text=" Door Lock Error!",
-            image=self._door_lock_ctk_image,
-            compound="left",
-            fg_color="#000000",
-            bg_color="#000000",
-            text_color="white",
-            font=ctk.CTkFont(family="Poppins", size=28, weight="bold"),
-            width=200,
-            height=45,
+        # Hotspot debug overlay (admin setting), always the topmost items
+        self._show_hotspots = bool(Settings.Instance().show_hotspots)
+        self._hit_debug_id = self.canvas.create_text(
+            0,
+            0,
+            anchor="sw",
+            fill="#00FF66",
+            font=("Arial", 16, "bold"),
+            state="hidden",
+            tags=("hotspot_debug",),
         )
-        self.door_lock_error_overlay.place(relx=0.51, rely=0.96, anchor="s")
-        self.door_lock_error_overlay.lower()
+        Settings.Instance().add_listener(self._on_settings_changed)
 
         DoorSafety.Instance().add_listener(self._on_door_change)
         DoorSafety.Instance().add_wdt_listener(self._on_lost_communication)
@@ -191,150 +168,58 @@ class ImageHotspotView(ctk.CTkFrame):
             cls._instance = cls(master, **kwargs)
         return cls._instance
 
-    def _get_font(self, font_size: int, font_weight: str = "normal"):
-        candidates = []
-        if font_weight == "bold":
-            candidates.extend(
-                [
-                    "arialbd.ttf",
-                    "Arial Bold.ttf",
-                    "DejaVuSans-Bold.ttf",
-                ]
-            )
-        candidates.extend(
-            [
-                "arial.ttf",
-                "Arial.ttf",
-                "DejaVuSans.ttf",
-            ]
+    # ---- canvas overlay items ----
+    def _create_text_box(self, box, text, font, tag) -> int:
+        """Text centred on a black box, like the labels it replaces."""
+        x1, y1, x2, y2 = box
+        self.canvas.create_rectangle(
+            x1, y1, x2, y2, fill="black", outline="", state="hidden", tags=(tag,)
+        )
+        return self.canvas.create_text(
+            (x1 + x2) // 2,
+            (y1 + y2) // 2,
+            text=text,
+            fill="white",
+            font=font,
+            state="hidden",
+            tags=(tag,),
         )
 
-        for name in candidates:
-            try:
-                return ImageFont.truetype(name, font_size)
-            except Exception:
-                pass
-
-        return ImageFont.load_default()
-
-    def _draw_triangle_up(self, draw, bbox, outline, fill, size=16):
-        x1, y1, x2, y2 = bbox
-
-        cx = (x1 + x2) // 2
-        cy = (y1 + y2) // 2
-
-        s = size
-
-        pts = [
-            (cx, cy - s),
-            (cx - s, cy + s),
-            (cx + s, cy + s),
-        ]
-
-        draw.polygon(pts, outline=outline, fill=fill)
-
-    def _draw_triangle_down(self, draw, bbox, outline, fill, size=16):
-        x1, y1, x2, y2 = bbox
-
-        cx = (x1 + x2) // 2
-        cy = (y1 + y2) // 2
-
-        s = size
-
-        pts = [
-            (cx - s, cy - s),
-            (cx + s, cy - s),
-            (cx, cy + s),
-        ]
-
-        draw.polygon(pts, outline=outline, fill=fill)
-
-    def _apply_overlay(self, pil_img, page_obj):
-        draw = ImageDraw.Draw(pil_img)
-
-        for shape in getattr(page_obj, "overlay_shapes", []):
-            kind = shape.get("kind")
-            bbox = shape.get("bbox")
-            outline = shape.get("outline", "white")
-            fill = shape.get("fill", None)
-            width = shape.get("width", 1)
-            radius = shape.get("radius", 0)
-
-            if not bbox:
-                continue
-
-            if kind == "rounded_rect":
-                draw.rounded_rectangle(
-                    bbox,
-                    radius=radius,
-                    outline=outline,
-                    fill=fill,
-                    width=width,
-                )
-            elif kind == "rect":
-                draw.rectangle(
-                    bbox,
-                    outline=outline,
-                    fill=fill,
-                    width=width,
-                )
-            elif kind == "ellipse":
-                draw.ellipse(
-                    bbox,
-                    outline=outline,
-                    fill=fill,
-                    width=width,
-                )
-            elif kind == "triangle_up":
-                self._draw_triangle_up(
-                    draw,
-                    bbox,
-                    outline,
-                    fill,
-                    shape.get("size", 16),
-                )
-            elif kind == "triangle_down":
-                self._draw_triangle_down(
-                    draw,
-                    bbox,
-                    outline,
-                    fill,
-                    shape.get("size", 16),
-                )
-            elif kind == "image":
-                image_path = shape.get("image_path")
-                if image_path and os.path.exists(image_path):
-                    try:
-                        overlay = Image.open(image_path).convert("RGBA")
-                        x1, y1, x2, y2 = bbox
-
-                        target_w = x2 - x1
-                        target_h = y2 - y1
-
-                        overlay.thumbnail((target_w, target_h), Image.LANCZOS)
-
-                        ox = x1 + (target_w - overlay.width) // 2
-                        oy = y1 + (target_h - overlay.height) // 2
-
-                        pil_img.paste(overlay, (ox, oy), overlay)
-                    except Exception as e:
-                        print(f"Failed to draw overlay image: {e}")
-
-        for item in getattr(page_obj, "overlay_text", []):
-            xy = item.get("xy")
-            text = item.get("text", "")
-            fill = item.get("fill", "white")
-            anchor = item.get("anchor", "la")
-            font_size = item.get("font_size", 24)
-            font_weight = item.get("font_weight", "normal")
+    def _create_banner(self, tag: str, icon_name: str, text: str, relx: float) -> None:
+        """Icon + text on black, bottom-centred at relx near the bottom edge."""
+        icon = RenderCache.Instance().base_image(
+            f"{ASSETS_DIR}/{icon_name}", size=BANNER_ICON_SIZE
+        )
+        self._banner_icons[tag] = ImageTk.PhotoImage(icon)
 
-            if not xy:
-                continue
+        bottom = round(self.IMG_HEIGHT * 0.96)
+        cy = bottom - 24
+        bg_id = self.canvas.create_rectangle(
+            0, 0, 0, 0, fill="#000000", outline="", tags=(tag,)
+        )
+        icon_id = self.canvas.create_image(
+            0, cy, anchor="w", image=self._banner_icons[tag], tags=(tag,)
+        )
+        text_id = self.canvas.create_text(
+            48,
+            cy,
+            anchor="w",
+            text=text,
+            fill="white",
+            font=("Poppins", -28, "bold"),
+            tags=(tag,),
+        )
 
-            font = self._get_font(font_size, font_weight)
-            draw.text(xy, text, fill=fill, font=font, anchor=anchor)
+        tx1, _ty1, tx2, _ty2 = self.canvas.bbox(text_id)
+        width = max(200, 48 + tx2 - tx1)
+        left = round(self.IMG_WIDTH * relx) - width // 2
+        self.canvas.move(icon_id, left, 0)
+        self.canvas.move(text_id, left, 0)
+        self.canvas.coords(bg_id, left, bottom - 48, left + width, bottom)
+        self._set_visible(tag, False)
 
-        return pil_img
+    def _set_visible(self, tag, visible: bool) -> None:
+        self.canvas.itemconfigure(tag, state="normal" if visible else "hidden")
 
     def set_page(self, page_obj) -> None:
         if not hasattr(page_obj, "image_path"):
@@ -346,70 +231,191 @@ class ImageHotspotView(ctk.CTkFrame):
         if not os.path.exists(img_path):
             raise FileNotFoundError(f"Image not found: {img_path}")
 
-        pil_img = Image.open(img_path).convert("RGBA")
-        if pil_img.size != (self.IMG_WIDTH, self.IMG_HEIGHT):
-            raise ValueError(
-                f"Image must be {self.IMG_WIDTH}x{self.IMG_HEIGHT}, got {pil_img.size}"
-            )
+        cache = RenderCache.Instance()
+        key = cache.frame_key(page_obj)
+        tk_img = cache.get_frame(key)
+        items = overlay_items(page_obj)
+        if tk_img is None:
+            base = cache.base_image(img_path)
+            if base.size != (self.IMG_WIDTH, self.IMG_HEIGHT):
+                raise ValueError(
+                    f"Image must be {self.IMG_WIDTH}x{self.IMG_HEIGHT}, got {base.size}"
+                )
 
-        pil_img = self._apply_overlay(pil_img, page_obj)
+            t0 = time.perf_counter()
+            tk_img = self._patched_frame(page_obj, base, items)
+            if tk_img is None:
+                # the cached base image is shared; compose() draws on a copy
+                tk_img = ImageTk.PhotoImage(compose(base, items))
+            self._record_overlay_time(page_obj, (time.perf_counter() - t0) * 1000.0)
+            cache.put_frame(key, tk_img, *base.size)
 
-        self._tk_img = ImageTk.PhotoImage(pil_img)
+        self._shown_overlay = (type(page_obj), img_path, items)
+        self._tk_img = tk_img
         self._current_page = page_obj
 
-        if self._canvas_image_id is None:
-            self._canvas_image_id = self.canvas.create_image(
-                0, 0, anchor="nw", image=self._tk_img
+        self.canvas.itemconfig(self._canvas_image_id, image=self._tk_img)
+        self._index_hotspots(page_obj)
+
+    def _patched_frame(self, page_obj, base, items) -> Optional[ImageTk.PhotoImage]:
+        """
+        The frame on screen with only the changed overlay areas redrawn, or
+        None when a full compose is needed (other page, or most of it changed).
+        The shown PhotoImage may be a cached frame, so the patches go into a
+        copy of it.
+        """
+        shown = self._shown_overlay
+        if shown is None or self._tk_img is None:
+            return None
+        shown_cls, shown_path, shown_items = shown
+        if shown_cls is not type(page_obj) or shown_path != page_obj.image_path:
+            return None
+
+        rects = dirty_rects(shown_items, items, base.size)
+        if rect_area(rects) > self.INCREMENTAL_MAX_AREA * base.width * base.height:
+            return None
+        if not rects:
+            return self._tk_img
+
+        frame = ImageTk.PhotoImage("RGBA", base.size)
+        self.tk.call(str(frame), "copy", str(self._tk_img), "-compositingrule", "set")
+        for (x1, y1, _x2, _y2), patch in render_patches(base, items, rects):
+            patch_img = ImageTk.PhotoImage(patch)
+            self.tk.call(
+                str(frame), "copy", str(patch_img),
+                "-to", x1, y1, "-compositingrule", "set",
             )
-        else:
-            self.canvas.itemconfig(self._canvas_image_id, image=self._tk_img)
+        return frame
+
+    def _record_overlay_time(self, page_obj, ms: float) -> None:
+        name = type(page_obj).__name__
+        samples = self._overlay_ms.setdefault(name, [])
+        samples.append(ms)
+        del samples[:-50]
+        print(f"[ImageHotspotView] {name}: overlay composed in {ms:.1f} ms")
+
+    def overlay_timing(self) -> Dict[str, Dict[str, float]]:
+        """Per page class: overlay composition time (ms) of recent renders."""
+        return {
+            name: {
+                "count": len(samples),
+                "last": samples[-1],
+                "avg": sum(samples) / len(samples),
+                "max": max(samples),
+            }
+            for name, samples in self._overlay_ms.items()
+            if samples
+        }
+
+    # ---- hotspots ----
+    def _index_hotspots(self, page_obj) -> None:
+        self._indexed_hotspots = page_obj.hotspots
+        self._hotspot_index = HotspotIndex(
+            page_obj.hotspots, self.IMG_WIDTH, self.IMG_HEIGHT
+        )
+        self._draw_hotspot_debug()
 
     def _on_click(self, event):
         if self._current_page is None:
             return
+        if self._current_page.hotspots is not self._indexed_hotspots:
+            # the page replaced its list without going through set_page
+            self._index_hotspots(self._current_page)
 
         x, y = event.x, event.y
-        print(f"Click: {x},{y}")
+        t0 = time.perf_counter()
+        hs = self._hotspot_index.hit(x, y)
+        us = (time.perf_counter() - t0) * 1e6
+        self._hit_test_us.append(us)
+        del self._hit_test_us[:-200]
+
+        if self._show_hotspots:
+            name = hs.name if hs is not None else "-"
+            print(f"[ImageHotspotView] tap {x},{y} -> {name} ({us:.1f} us)")
+            self.canvas.coords(self._hit_debug_id, x + 8, y - 8)
+            self.canvas.itemconfigure(
+                self._hit_debug_id, text=f"{name}  {us:.1f} us", state="normal"
+            )
+            self.canvas.tag_raise(self._hit_debug_id)
+
+        if hs is not None and hs.handler:
+            hs.handler()
+
+    def hit_test_timing(self) -> Dict[str, float]:
+        """Hotspot hit-test time (microseconds) of recent taps."""
+        samples = self._hit_test_us
+        if not samples:
+            return {"count": 0}
+        return {
+            "count": len(samples),
+            "last": samples[-1],
+            "avg": sum(samples) / len(samples),
+            "max": max(samples),
+        }
+
+    def _draw_hotspot_debug(self) -> None:
+        self.canvas.delete("hotspot_outline")
+        if not self._show_hotspots or self._hotspot_index is None:
+            self.canvas.itemconfigure(self._hit_debug_id, state="hidden")
+            return
 
-        for hs in self._current_page.hotspots:
+        for hs in self._hotspot_index.hotspots:
             x1, y1, x2, y2 = hs.rect
-            if x1 <= x <= x2 and y1 <= y <= y2:
-                print(f"Hotspot triggered: {hs.name}")
-                if hs.handler:
-                    hs.handler()
-                break
+            label = hs.name if not hs.priority else f"{hs.name} (p{hs.priority})"
+            self.canvas.create_rectangle(
+                x1,
+                y1,
+                x2,
+                y2,
+                outline="#00FF66",
+                width=2,
+                dash=(6, 4),
+                tags=("hotspot_debug", "hotspot_outline"),
+            )
+            self.canvas.create_text(
+                x1 + 4,
+                y1 + 2,
+                anchor="nw",
+                text=label,
+                fill="#00FF66",
+                font=("Arial", 12),
+                tags=("hotspot_debug", "hotspot_outline"),
+            )
+        self.canvas.tag_raise("hotspot_debug")
+
+    def _on_settings_changed(self, changed: Dict[str, Any]) -> None:
+        if "show_hotspots" in changed:
+            self._show_hotspots = bool(changed["show_hotspots"])
+            self._draw_hotspot_debug()
 
     def set_overlay_image(
         self,
         image_path: str | None,
-        name: str | None,
-        cook_time: str | None,
+        name: str | None = None,
+        cook_time: str | None = None,
         size=(300, 300),
     ):
         if not image_path:
-            self.overlay_label.configure(image=None)
-            self._overlay_ctk_image = None
-            self.overlay_label.lower()
-            self.cook_time_label.lower()
-            self.label.lower()
+            self._set_visible("meal", False)
+            self.canvas.itemconfigure(self._overlay_image_id, image="")
+            self._overlay_photo = None
             return
 
         if not os.path.exists(image_path):
             print(f"Overlay image not found: {image_path}")
             return
 
-        pil_img = Image.open(image_path).convert("RGBA")
-        pil_img = pil_img.resize(size)
+        pil_img = RenderCache.Instance().base_image(image_path, size=size)
+        self._overlay_photo = ImageTk.PhotoImage(pil_img)
 
-        self._overlay_ctk_image = ctk.CTkImage(dark_image=pil_img, size=size)
-        self.overlay_label.configure(image=self._overlay_ctk_image)
-        self.overlay_label.lift()
-
-        self.label.configure(text=name)
-        self.label.lift()
-
-        self.cook_time_label.configure(text=cook_time)
-        self.cook_time_label.lift()
+        # centred in the 200x200 area the overlay was laid out for
+        x = 505 + max(0, 200 - size[0]) // 2
+        y = 225 + max(0, 200 - size[1]) // 2
+        self.canvas.coords(self._overlay_image_id, x, y)
+        self.canvas.itemconfigure(self._overlay_image_id, image=self._overlay_photo)
+        self.canvas.itemconfigure(self._overlay_name_id, text=name or "")
+        self.canvas.itemconfigure(self._overlay_time_id, text=cook_time or "")
+        self._set_visible("meal", True)
 
     def show_circular_progress(self):
         if self.circular_progress is None:
@@ -436,27 +442,27 @@ class ImageHotspotView(ctk.CTkFrame):
             print("CircularProgress not created yet")
             return
 
-        pil_img = Image.open(image_path).convert("RGBA")
-        pil_img = pil_img.resize(size)
-
-        self._center_overlay_ctk_image = ctk.CTkImage(dark_image=pil_img, size=size)
-
-        if not hasattr(self, "center_overlay_label"):
-            self.center_overlay_label = ctk.CTkLabel(
-                self, text="", fg_color="transparent"
+        pil_img = RenderCache.Instance().base_image(image_path, size=size)
+        self._center_overlay_photo = ImageTk.PhotoImage(pil_img)
+
+        # Drawn on the progress ring's canvas, which covers this spot of the
+        # view: view (0.50, 0.65), ring centred at (0.5, 0.51)
+        progress = self.circular_progress
+        x = progress.size // 2
+        y = progress.size // 2 + round((0.65 - 0.51) * self.IMG_HEIGHT)
+        if self._center_overlay_id is None:
+            self._center_overlay_id = progress.create_image(
+                x, y, image=self._center_overlay_photo
             )
-
-        self.center_overlay_label.configure(image=self._center_overlay_ctk_image)
-        self.center_overlay_label.place(
-            relx=0.50,
-            rely=0.65,
-            anchor="center",
-        )
-        self.center_overlay_label.lift()
+        else:
+            progress.itemconfigure(
+                self._center_overlay_id, image=self._center_overlay_photo, state="normal"
+            )
+        progress.tag_raise(self._center_overlay_id)
 
     def hide_center_overlay(self):
-        if hasattr(self, "center_overlay_label"):
-            self.center_overlay_label.place_forget()
+        if self._center_overlay_id is not None and self.circular_progress is not None:
+            self.circular_progress.itemconfigure(self._center_overlay_id, state="hidden")
 
     def _wrapped_reheat_on_change(self, secs: int) -> None:
         previous = self._last_reheat_seconds
@@ -500,13 +506,6 @@ class ImageHotspotView(ctk.CTkFrame):
         self.reheat_time_control.place(relx=0.5, rely=0.48, anchor="center")
         self.reheat_time_control.lift()
 
-        if self._reheat_attention_active:
-            self.reheat_attention_frame.lift()
-            self.reheat_attention_frame.tkraise()
-            if self.reheat_time_control is not None:
-                self.reheat_time_control.lift()
-                self.reheat_time_control.tkraise()
-
     def hide_reheat_time_control(self) -> None:
         if self.reheat_time_control is not None:
             self.reheat_time_control.place_forget()
@@ -521,21 +520,11 @@ class ImageHotspotView(ctk.CTkFrame):
             self._reheat_attention_active
             and self._reheat_attention_after_id is not None
         ):
-            self.reheat_attention_frame.lift()
-            self.reheat_attention_frame.tkraise()
-            self.reheat_time_control.lift()
-            self.reheat_time_control.tkraise()
             return
 
         self._reheat_attention_active = True
         self._reheat_attention_pulse_on = False
-
-        self.reheat_attention_frame.place(x=343, y=332)
-        self.reheat_attention_frame.lift()
-        self.reheat_attention_frame.tkraise()
-
-        self.reheat_time_control.lift()
-        self.reheat_time_control.tkraise()
+        self._set_visible("reheat_attention", True)
 
         self._pulse_reheat_time_attention()
 
@@ -549,7 +538,7 @@ class ImageHotspotView(ctk.CTkFrame):
                 pass
             self._reheat_attention_after_id = None
 
-        self.reheat_attention_frame.place_forget()
+        self._set_visible("reheat_attention", False)
 
     def _pulse_reheat_time_attention(self) -> None:
         if not self._reheat_attention_active:
@@ -564,18 +553,10 @@ class ImageHotspotView(ctk.CTkFrame):
             border_color = "#8A2E00"  # ember orange
             border_width = 3
 
-        self.reheat_attention_frame.configure(
-            border_color=border_color,
-            border_width=border_width,
+        self.canvas.itemconfigure(
+            self._reheat_attention_id, outline=border_color, width=border_width
         )
 
-        self.reheat_attention_frame.lift()
-        self.reheat_attention_frame.tkraise()
-
-        if self.reheat_time_control is not None:
-            self.reheat_time_control.lift()
-            self.reheat_time_control.tkraise()
-
         self._reheat_attention_after_id = self.after(
             750, self._pulse_reheat_time_attention
         )
@@ -586,22 +567,10 @@ class ImageHotspotView(ctk.CTkFrame):
         return self.reheat_time_control.get_seconds()
 
     def _on_door_change(self, is_open: bool):
-        if is_open:
-            self.door_overlay.lift()
-            self.door_overlay.tkraise()
-        else:
-            self.door_overlay.lower()
+        self._set_visible("door_banner", is_open)
 
     def _on_lost_communication(self, lostCommunication: bool):
-        if lostCommunication:
-            self.comm_error_overlay.lift()
-            self.comm_error_overlay.tkraise()
-        else:
-            self.comm_error_overlay.lower()
+        self._set_visible("comm_banner", lostCommunication)
 
     def _on_door_lock_error(self, is_error: bool):
-        if is_error:
-            self.door_lock_error_overlay.lift()
-            self.door_lock_error_overlay.tkraise()
-        else:
-            self.door_lock_error_overlay.lower()
+        self._set_visible("door_lock_banner", is_error)
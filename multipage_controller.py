@@ -1,7 +1,6 @@
 # multipage_controller.py
 
 import customtkinter as ctk
-from PIL import Image
 import threading
 import logging
 import inspect
@@ -10,6 +9,14 @@ import time
 from typing import Optional, Dict, Any, Callable
 
 from image_hotspot_view import ImageHotspotView
+from AssetPreloader import (
+    PRELOAD_ASSETS,
+    ZONE_ICON_SIZE,
+    AssetPreloader,
+    asset_path,
+    preload_item,
+)
+from RenderCache import RenderCache
 from homepage import HomePage
 from select_meal_page import SelectMealPage
 from prepare_for_cooking1 import PrepareForCookingPage1
@@ -22,9 +29,9 @@ from reheat_page import ReheatPage
 from update_method_dialog import UpdateMethodDialog
 
 from SerialService import SerialService
+from RfidService import RfidService
 from DoorSafety import DoorSafety
 from hmi_consts import (
-    ASSETS_DIR,
     HMISizePos,
     HMIColors,
     __version__,
@@ -34,9 +41,17 @@ from hmi_logger import setup_logging
 import oven_state
 
 # program / sequence helpers
-from SelectProgramPage import load_program_into_sequence_collection
-from SequenceStructure import SequenceCollection
+from ProgramRepository import ProgramRepository
 from CookingSequenceRunner import CookingSequenceManager
+from PowerBudgetScheduler import PowerBudgetScheduler
+from Settings import Settings
+from CookJournal import CookJournal
+from FileStore import FileStore
+from FileWatcher import FileWatcher
+from Telemetry import TelemetryMirror
+from TemperatureControl import TemperatureController
+from StopWatch import Stopwatch
+from MessageBoxPage import askyesno
 
 # ----------------------------
 # ADMIN PAGES (ProjectA)
@@ -138,6 +153,26 @@ class MultiPageController:
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
 
+        # Decode page images off the UI thread: home page first, then the
+        # pages of a cook in the order they are shown, then photos/icons
+        AssetPreloader.Instance().start(
+            [
+                asset_path(page_cls.IMAGE_NAME)
+                for page_cls in (
+                    HomePage,
+                    SelectMealPage,
+                    PrepareForCookingPage1,
+                    PrepareForCookingPage2,
+                    StartCookingConfirmation,
+                    CookingPage,
+                    CookingPausedPage,
+                    CookingFinishedPage,
+                    ReheatPage,
+                )
+            ]
+            + [preload_item(entry) for entry in PRELOAD_ASSETS]
+        )
+
         # ----------------------------
         # ProjectB base UI: hotspot view
         # ----------------------------
@@ -155,14 +190,69 @@ class MultiPageController:
         except Exception as e:
             print("Serial start failed:", e)
 
+        # A cook left unfinished by a crash/power loss: make outputs safe
+        # right away, then offer resume/abort once the UI is up.
+        self.cook_journal = CookJournal.Instance()
+        self._cook_clock = Stopwatch()
+        self._cook_offset_s = 0.0
+        # accepted resume offer, applied only when that meal is started
+        self._pending_resume: Optional[dict] = None
+        interrupted_cook = self.cook_journal.find_interrupted_cook()
+        if interrupted_cook is not None:
+            print(f"[MultiPageController] Interrupted cook found: {interrupted_cook}")
+            try:
+                self.oven_ctrl_serial.send("Z00=000")
+            except Exception as e:
+                print(f"[MultiPageController] interrupted cook all-off failed: {e}")
+
+        # Warm the program cache for the meal buttons (programs 31..42) and RFID
+        self.program_repository = ProgramRepository.Instance()
+        threading.Thread(
+            target=self.program_repository.preload,
+            args=([*range(31, 43), 9999],),
+            daemon=True,
+            name="ProgramPreload",
+        ).start()
+
+        # Latest R/T/V readings for the control thread, whatever page is shown
+        self.telemetry = TelemetryMirror.Instance()
+        self.oven_ctrl_serial.add_listener(self.telemetry.update_from_line)
+
         # RFID reader serial
         self.rfid_serial = SerialService(tk_root=root, port_hint="1240")
         try:
             self.rfid_serial.start()
         except Exception as e:
             print("RFID serial start failed:", e)
+        # Tag reads (debounce, retry, decode) run whatever page is shown
+        self.rfid_service = RfidService(self.rfid_serial, root)
+
+        # Every zone power command goes through the power budget
+        s = Settings.Instance()
+        self.power_budget = PowerBudgetScheduler(
+            self._send_zone_outputs,
+            max_total_power=s.max_total_power,
+            max_rise=s.max_power_rise,
+            stagger_ms=s.power_stagger_ms,
+        )
+        s.add_listener(self._on_settings_changed)
+
+        # Pick up program/settings files changed outside the HMI
+        self.file_watcher = FileWatcher.Instance()
+        self.file_watcher.add_listener(self._on_files_changed)
+        self.file_watcher.start(tk_root=root)
+
+        # Closed-loop temperature control for every cook path
+        self._control_base_power: Optional[int] = None
+        self._control_scales: dict = {"global": 1.0, "zones": {}}
+        self._control_last_outputs: Optional[Dict[int, int]] = None
+        self.temperature_control = TemperatureController(
+            self._apply_control_scales,
+            tk_root=root,
+            poll_fn=self.serial_poll_telemetry,
+        )
+        self.temperature_control.add_listener(self._on_control_status)
 
-       
         # ----------------------------
         # Admin mode flag + logo click tracking
         # ----------------------------
@@ -191,16 +281,17 @@ class MultiPageController:
 
         self._fan_off_timer: Optional[threading.Timer] = None
 
-        # active CookingSequenceManager
-        self.sequence_manager: Optional[CookingSequenceManager] = None
-        self.shared_data["sequence_manager"] = None
+        # active CookingSequenceManager (see the sequence_manager property)
+        self.sequence_manager = None
 
         # Cache icons (still used elsewhere)
         self.zone_icons = []
         for i in range(8):
-            icon = Image.open(f"{ASSETS_DIR}/Zone{i+1}.png").resize((24, 24))
+            icon = RenderCache.Instance().base_image(
+                asset_path(f"Zone{i+1}.png"), size=ZONE_ICON_SIZE
+            )
             self.zone_icons.append(
-                ctk.CTkImage(light_image=icon, dark_image=icon, size=(24, 24))
+                ctk.CTkImage(light_image=icon, dark_image=icon, size=ZONE_ICON_SIZE)
             )
 
         # ----------------------------
@@ -221,6 +312,10 @@ class MultiPageController:
         # after serial starts, give COM time to be ready
         self.after(2000, self.serial_get_door_switch)
 
+        if interrupted_cook is not None:
+            # after the door state has been read
+            self.after(2500, self._offer_cook_resume, interrupted_cook)
+
         setup_logging("hmi")
         logger.info(f"HMI Started {[__version__]}")
 
@@ -593,12 +688,7 @@ class MultiPageController:
     def show_SelectMealPage(
         self, from_info=False, scroll_row=0, meal_labels=None
     ) -> None:
-        self.select_meal_page = SelectMealPage(
-            controller=self,
-            from_info=from_info,
-            scroll_row=scroll_row,
-            meal_labels=meal_labels,
-        )
+        self.select_meal_page.on_show(from_info, scroll_row, meal_labels)
         self.show_page(self.select_meal_page)
 
     # Pass the selected meal explicitly through the normal cooking workflow.
@@ -608,11 +698,7 @@ class MultiPageController:
         from_info: bool = False,
         meal_index: int | None = None,
     ) -> None:
-        self.prepare_for_cooking_page1 = PrepareForCookingPage1(
-            controller=self,
-            from_info=from_info,
-            meal_index=meal_index,
-        )
+        self.prepare_for_cooking_page1.on_show(from_info, meal_index)
         self.show_page(self.prepare_for_cooking_page1)
 
     def show_PrepareForCookingPage2(
@@ -620,11 +706,7 @@ class MultiPageController:
         from_info: bool = False,
         meal_index: int | None = None,
     ) -> None:
-        self.prepare_for_cooking_page2 = PrepareForCookingPage2(
-            controller=self,
-            from_info=from_info,
-            meal_index=meal_index,
-        )
+        self.prepare_for_cooking_page2.on_show(from_info, meal_index)
         self.show_page(self.prepare_for_cooking_page2)
 
     def show_StartCookingConfirmation(self, meal_index: int | None) -> None:
@@ -740,6 +822,11 @@ class MultiPageController:
         except Exception as e:
             print(f"[MultiPageController] CircularProgressPage_admin.start failed: {e}")
 
+        self.discard_cook_resume()
+        self.start_temperature_control(
+            base_power=(powerLevel or 0) if isManualCookMode else None
+        )
+
     def show_FoodReadyPage(self, auto_return_to=None, after_ms=3000) -> None:
         if not self.is_admin:
             self.show_CookingFinishedPage()
@@ -841,28 +928,55 @@ class MultiPageController:
         self._fan_off_timer = threading.Timer(delay_seconds, delayed_fan_off)
         self._fan_off_timer.start()
 
-    def serial_zone(self, zone: int, power: int):
-        oven_state.set_running(True)
+    def _send_zone_outputs(self, outputs: Dict[int, int]):
+        """Serial write for outputs already admitted by the power budget."""
         try:
-            if power > 0:
-                self._cancel_fan_off_timer()
-
-            cmd = f"Z{zone:02d}={power:03d}"
-            self.oven_ctrl_serial.send(cmd)
-        except Exception:
-            raise
+            cmds = [
+                f"Z{zone:02d}={power:03d}" for zone, power in sorted(outputs.items())
+            ]
+            if len(cmds) == 1:
+                self.oven_ctrl_serial.send(cmds[0])
+            else:
+                self.oven_ctrl_serial.send_many(cmds)
         finally:
-            logger.info(f"Zone{zone} Power = {power}")
+            logger.info(
+                "Zone Power = "
+                + ", ".join(f"Zone{z}={p}" for z, p in sorted(outputs.items()))
+            )
 
-    def serial_all_zones(self, power: int):
-        if power > 0:
+    def serial_zone(self, zone: int, power: int):
+        self.serial_zones({zone: power})
+
+    def serial_zones(self, outputs: Dict[int, int]):
+        """
+        Request a set of zone outputs {zone: power}. The power budget sends
+        drops immediately and staggers/queues rises.
+        """
+        if not outputs:
+            return
+        oven_state.set_running(True)
+        if any(power > 0 for power in outputs.values()):
             self._cancel_fan_off_timer()
 
-        for zone in range(1, 9):
+        self.power_budget.request(outputs)
+
+    @staticmethod
+    def _zone_outputs_from_runner_names(outputs: Dict[str, int]) -> Dict[int, int]:
+        zone_outputs: Dict[int, int] = {}
+        for zone_name, value in outputs.items():
             try:
-                self.serial_zone(zone, power)
-            except Exception as e:
-                print(f"Error in serial_all_zones {zone}: {e}")
+                zone_outputs[int(zone_name.replace("Zone", ""))] = int(value)
+            except Exception:
+                print(f"[HW] Bad zone name: {zone_name}")
+        return zone_outputs
+
+    def serial_all_zones(self, power: int):
+        # The power budget staggers the rise so all arrays don't switch on
+        # in the same instant.
+        try:
+            self.serial_zones({zone: power for zone in range(1, 9)})
+        except Exception as e:
+            print(f"Error in serial_all_zones: {e}")
 
     def serial_all_zones_off(self):
         if oven_state.get_running():
@@ -870,6 +984,7 @@ class MultiPageController:
             logger.info("Cook Cycle Ended")
         try:
             print("In serial_all_zones_off()")
+            self.power_budget.all_off()
             self.oven_ctrl_serial.send("Z00=000")
             self._schedule_fan_off_after_delay()
         except Exception:
@@ -884,6 +999,12 @@ class MultiPageController:
     def serial_get_IR_temp(self, sensor: int):
         self.oven_ctrl_serial.send(f"T{sensor}")
 
+    def serial_poll_telemetry(self):
+        # control thread; replies feed the TelemetryMirror
+        self.serial_get_thermistor()
+        for sensor in range(1, 5):
+            self.serial_get_IR_temp(sensor)
+
     def serial_get_door_switch(self):
         self.oven_ctrl_serial.send("D")
 
@@ -905,15 +1026,274 @@ class MultiPageController:
         self.oven_ctrl_serial.send("V")  # Get power supply zone voltages
         self.oven_ctrl_serial.send("P")  # Get Fan current
 
+    # ------------------------------------------------------------------
+    # Active sequence manager
+    # ------------------------------------------------------------------
+    @property
+    def sequence_manager(self) -> Optional[CookingSequenceManager]:
+        """
+        The manager of the cook that is running, customer or admin. It lives
+        in shared_data["sequence_manager"] only, which is also where
+        SequenceProgramPage puts admin program runs, so control scaling and
+        cookpack finish always act on the current cook.
+        """
+        return self.shared_data.get("sequence_manager")
+
+    @sequence_manager.setter
+    def sequence_manager(self, mgr: Optional[CookingSequenceManager]) -> None:
+        self.shared_data["sequence_manager"] = mgr
+
+    def release_sequence_manager(self, mgr: Optional[CookingSequenceManager]) -> None:
+        """Forget mgr once its cook has ended, unless another cook replaced it."""
+        if mgr is not None and self.sequence_manager is mgr:
+            self.sequence_manager = None
+
+    # ------------------------------------------------------------------
+    # Cook journal (crash-safe resume)
+    # ------------------------------------------------------------------
+    def _cook_elapsed_s(self) -> float:
+        return self._cook_offset_s + self._cook_clock.elapsed_ms() / 1000.0
+
+    def _current_scales(self) -> Optional[dict]:
+        mgr = self.sequence_manager
+        if mgr and hasattr(mgr, "get_scales"):
+            return mgr.get_scales()
+        return None
+
+    def _journal_begin(
+        self,
+        kind: str,
+        meal_index: int,
+        program: int | None,
+        total_s: float,
+        offset_s: float = 0.0,
+    ) -> None:
+        self._cook_offset_s = offset_s
+        self._cook_clock.reset()
+        self._cook_clock.start()
+        self.cook_journal.begin(
+            kind=kind,
+            meal_index=meal_index,
+            program=program,
+            total=float(total_s),
+            elapsed=self._cook_offset_s,
+            scales=self._current_scales(),
+        )
+
+    def _journal_event(self, event: str) -> None:
+        self.cook_journal.record(
+            event, elapsed=self._cook_elapsed_s(), scales=self._current_scales()
+        )
+
+    def _journal_end(self, reason: str) -> None:
+        self._cook_clock.stop()
+        self.cook_journal.end(reason)
+
+    def _offer_cook_resume(self, cook: dict) -> None:
+        kind = cook.get("kind")
+        meal_index = cook.get("meal_index")
+        try:
+            remaining = float(cook.get("total", 0)) - float(cook.get("elapsed", 0))
+        except (TypeError, ValueError):
+            remaining = 0.0
+
+        resumable = (
+            kind in ("program", "reheat") and meal_index is not None and remaining > 1.0
+        )
+        logger.info(f"Interrupted cook detected: {cook}")
+
+        if not resumable or self.is_admin:
+            self._journal_abort_interrupted(cook)
+            return
+
+        if DoorSafety.Instance().is_open():
+            resume = False
+        else:
+            resume = askyesno(
+                self.root,
+                "Cooking Interrupted",
+                f"A cook was interrupted with {int(remaining)} s remaining.\n"
+                "Resume cooking?",
+            )
+
+        if not resume:
+            self._journal_abort_interrupted(cook)
+            return
+
+        logger.info(f"Resuming interrupted cook at {cook.get('elapsed')} s")
+        if kind == "reheat":
+            self.shared_data["reheat_seconds"] = remaining
+        self._pending_resume = {
+            "kind": kind,
+            "meal_index": meal_index,
+            "program": cook.get("program"),
+            "total": float(cook.get("total", 0)),
+            "elapsed": float(cook.get("elapsed", 0)),
+            "scales": cook.get("scales"),
+        }
+        self.show_CookingPage(meal_index)
+
+    def pending_cook_resume(self, meal_index: int | None) -> Optional[dict]:
+        """The accepted resume offer if it is for meal_index, else None."""
+        resume = self._pending_resume
+        if resume is None or resume["meal_index"] != meal_index:
+            return None
+        return dict(resume)
+
+    def discard_cook_resume(self) -> None:
+        """Drop an accepted resume offer (operator backed out or cancelled)."""
+        if self._pending_resume is not None:
+            logger.info("Pending cook resume discarded")
+        self._pending_resume = None
+
+    def _take_cook_resume(
+        self, kind: str, meal_index: int, program: int | None
+    ) -> Optional[dict]:
+        """
+        One-shot: the pending resume if it belongs to this cook. Any start
+        clears it, so a resume never carries over to a different cook.
+        """
+        resume, self._pending_resume = self._pending_resume, None
+        if resume is None:
+            return None
+        if (resume["kind"], resume["meal_index"], resume["program"]) != (
+            kind,
+            meal_index,
+            program,
+        ):
+            logger.info(f"Pending resume {resume} does not match; starting fresh")
+            return None
+        return resume
+
+    def _journal_abort_interrupted(self, cook: dict) -> None:
+        self.cook_journal.begin(**{k: v for k, v in cook.items() if k not in ("event", "t")})
+        self.cook_journal.end("aborted after restart")
+
+    # ------------------------------------------------------------------
+    # Temperature control (array over-temp + cookpack strategies)
+    # ------------------------------------------------------------------
+    def _on_settings_changed(self, changed: Dict[str, Any]) -> None:
+        if {"max_total_power", "max_power_rise", "power_stagger_ms"} & changed.keys():
+            s = Settings.Instance()
+            self.power_budget.configure(
+                s.max_total_power, s.max_power_rise, s.power_stagger_ms
+            )
+
+    def _on_files_changed(self, change) -> None:
+        # UI thread; caches were already updated by the watcher
+        if change.kind == "program" and hasattr(
+            self._admin_current, "on_programs_changed"
+        ):
+            self._admin_current.on_programs_changed()
+
+    def start_temperature_control(self, base_power: int | None = None) -> None:
+        """
+        Start the control strategies for a new cook.
+
+        base_power None: program cook, scales go to the sequence manager.
+        base_power N:    fixed-power cook (manual / reheat), zones are driven
+                         at N% times the control scales.
+        """
+        self._control_base_power = None if base_power is None else int(base_power)
+        self._control_scales = {"global": 1.0, "zones": {}}
+        self._control_last_outputs = None
+
+        s = Settings.Instance()
+        self.temperature_control.start_cook(s, on_finished=self._on_control_finished)
+
+    def stop_temperature_control(self) -> None:
+        self.temperature_control.stop_cook()
+
+    def _apply_control_scales(
+        self, global_scale: float | None, zone_scales: Dict[int, float] | None
+    ) -> None:
+        # runs on the control thread
+        if self._control_base_power is None:
+            mgr = self.sequence_manager
+            if mgr and hasattr(mgr, "set_scales"):
+                mgr.set_scales(global_scale=global_scale, zone_scales=zone_scales)
+            return
+
+        if global_scale is not None:
+            self._control_scales["global"] = global_scale
+        if zone_scales:
+            self._control_scales["zones"].update(zone_scales)
+
+        g = self._control_scales["global"]
+        zones = self._control_scales["zones"]
+        outputs = {
+            zone: int(self._control_base_power * g * zones.get(zone, 1.0))
+            for zone in range(1, 9)
+        }
+        if outputs == self._control_last_outputs:
+            return
+
+        with oven_state.lock:
+            if not oven_state.is_running:
+                return
+            self._control_last_outputs = outputs
+            self.serial_zones(outputs)
+
+    def _on_control_status(self, status: dict) -> None:
+        for name in status.get("strategies", []):
+            cookpack = status.get(name, {})
+            if "tc_remaining" in cookpack:
+                self.cook_journal.update(
+                    cookpack={
+                        "started": cookpack.get("started"),
+                        "tc_remaining": cookpack.get("tc_remaining"),
+                        "control_active": cookpack.get("control_active"),
+                    }
+                )
+
+    def _on_control_finished(self) -> None:
+        # control thread -> UI thread
+        self.after(0, self._finish_cook_by_control)
+
+    def _finish_cook_by_control(self) -> None:
+        logger.info("Cook ended by cookpack temperature control")
+
+        if self.is_admin:
+            page = self.admin_pages.get(CircularProgressPage_admin)
+            if page is not None and hasattr(page, "finish_cook"):
+                page.finish_cook()
+                return
+
+        mgr = self.sequence_manager
+        if mgr and hasattr(mgr, "stop_all"):
+            try:
+                mgr.stop_all()
+            except Exception as e:
+                print(f"[MultiPageController] sequence_manager.stop_all failed: {e}")
+        self.release_sequence_manager(mgr)
+
+        try:
+            self.serial_all_zones_off()
+        except Exception as e:
+            print(f"[MultiPageController] serial_all_zones_off failed: {e}")
+
+        self._journal_end("complete")
+
+        try:
+            self.cooking_page.reset_after_hard_stop()
+        except Exception as e:
+            print(f"[MultiPageController] cooking_page reset failed: {e}")
+
+        self.show_CookingFinishedPage()
+
     # ------------------------------------------------------------------
     # Cooking sequence lifecycle (unchanged from ProjectB)
     # ------------------------------------------------------------------
-    def _on_all_zones_complete(self):
+    def _on_all_zones_complete(self, mgr=None):
+        self.release_sequence_manager(mgr)
         try:
             self.serial_all_zones_off()
         except Exception as e:
             print(f"[MultiPageController] serial_all_zones_off failed: {e}")
 
+        self._journal_end("complete")
+        self.stop_temperature_control()
+
         try:
             oven_state.set_running(False)
         except Exception as e:
@@ -941,36 +1321,28 @@ class MultiPageController:
             f"Starting meal_index={meal_index}, program={program_number}"
         )
 
-        try:
-            load_program_into_sequence_collection(program_number)
-        except Exception as e:
-            print(
-                f"[MultiPageController] load_program_into_sequence_collection({program_number}) failed: {e}"
-            )
-            return 0.0
+        # One-shot resume after an interrupted cook of this same program
+        resume = self._take_cook_resume("program", meal_index, program_number)
 
-        sc = SequenceCollection.Instance()
-        zone_sequences: list[tuple[str, list[tuple[float, float]]]] = []
+        program = self.program_repository.get(program_number)
+        if program is None:
+            print(f"[MultiPageController] program{program_number} missing or invalid")
+            return 0.0
 
-        for zone_idx in range(8):
-            zone = sc.get_zone_sequence_by_index(zone_idx)
-            if not zone:
-                continue
+        zone_sequences: list[tuple[str, list[tuple[float, float, bool]]]] = []
+        zone_slews: dict[str, float | None] = {}
 
-            steps: list[tuple[float, float]] = []
-            for step in zone.steps:
-                try:
-                    d = float(step.duration)
-                    p = float(step.power)
-                except Exception:
-                    continue
-                if d <= 0:
-                    continue
-                steps.append((d, p))
+        for zone_idx, zone_steps in enumerate(program.zone_steps):
+            steps: list[tuple[float, float, bool]] = [
+                (duration, float(power), ramp)
+                for power, duration, ramp in zone_steps
+                if duration > 0
+            ]
 
             if steps:
                 zone_name = f"Zone{zone_idx+1}"
                 zone_sequences.append((zone_name, steps))
+                zone_slews[zone_name] = program.zone_slews[zone_idx]
 
         if not zone_sequences:
             print("[MultiPageController] No non-empty zone sequences; aborting")
@@ -991,39 +1363,66 @@ class MultiPageController:
 
         zone8_flag = False
         for zone_name, steps in zone_sequences:
-            mgr.add_dac(zone_name, steps, set_zone_output)
+            mgr.add_dac(
+                zone_name, steps, set_zone_output, max_slew=zone_slews.get(zone_name)
+            )
             if zone_name == "Zone8":
                 zone8_flag = True
 
         if not zone8_flag:
             mgr.add_dac("Zone8", [(0.0, 0)], set_zone_output)
 
-        mgr.set_on_all_complete(self._on_all_zones_complete)
+        def set_zone_outputs(outputs):
+            try:
+                self.serial_zones(self._zone_outputs_from_runner_names(outputs))
+            except Exception as e:
+                print(f"[HW] serial_zones({outputs}) failed: {e}")
+
+        mgr.set_batch_callback(set_zone_outputs)
+        mgr.set_on_all_complete(lambda: self._on_all_zones_complete(mgr))
+        mgr.set_on_step(lambda _name, _step_index: self._journal_event("step"))
 
         self.sequence_manager = mgr
-        self.shared_data["sequence_manager"] = mgr
 
         def zone_total(steps):
-            return sum(d for (d, _p) in steps)
+            return sum(step[0] for step in steps)
 
         total_seconds = max(zone_total(steps) for _name, steps in zone_sequences)
         print(f"[MultiPageController] Meal program total time = {total_seconds:.1f}s")
 
+        offset_s = min(resume["elapsed"], total_seconds) if resume else 0.0
+        resume_scales = resume["scales"] if resume else None
+
         try:
             oven_state.set_running(True)
         except Exception as e:
             print(f"[MultiPageController] oven_state.set_running(True) failed: {e}")
 
+        if resume_scales:
+            mgr.set_scales(
+                global_scale=resume_scales.get("global"),
+                zone_scales=resume_scales.get("zones"),
+            )
+
+        self._journal_begin(
+            "program", meal_index, program_number, total_seconds, offset_s
+        )
+        self.start_temperature_control()
+
         try:
-            mgr.start_all()
+            mgr.start_all(offset_s)
         except Exception as e:
             print(f"[MultiPageController] sequence_manager.start_all() failed: {e}")
+            self.stop_temperature_control()
+            self._journal_end("start failed")
             return 0.0
 
-        return float(total_seconds)
+        return float(total_seconds - offset_s)
 
     def stop_current_cook(self) -> None:
-        mgr = self.sequence_manager or self.shared_data.get("sequence_manager")
+        self.stop_temperature_control()
+        self._journal_end("stopped")
+        mgr = self.sequence_manager
         if mgr:
             try:
                 if hasattr(mgr, "stop_all"):
@@ -1031,6 +1430,7 @@ class MultiPageController:
                     mgr.stop_all()
             except Exception as e:
                 print(f"[MultiPageController] sequence_manager.stop_all failed: {e}")
+            self.release_sequence_manager(mgr)
 
         try:
             self.serial_all_zones_off()
@@ -1043,23 +1443,31 @@ class MultiPageController:
             print(f"[MultiPageController] oven_state.set_running(False) failed: {e}")
 
     def pause_current_cook(self, cut_output: bool = True) -> None:
-        mgr = self.sequence_manager or self.shared_data.get("sequence_manager")
+        mgr = self.sequence_manager
         if mgr and hasattr(mgr, "pause_all"):
             try:
                 mgr.pause_all(cut_output)
             except Exception as e:
                 print(f"[MultiPageController] pause_current_cook failed: {e}")
+            self.temperature_control.pause()
+            self._cook_clock.stop()
+            self._journal_event("pause")
 
     def resume_current_cook(self) -> None:
-        mgr = self.sequence_manager or self.shared_data.get("sequence_manager")
+        mgr = self.sequence_manager
         if mgr and hasattr(mgr, "resume_all"):
             try:
                 mgr.resume_all()
             except Exception as e:
                 print(f"[MultiPageController] resume_current_cook failed: {e}")
+            self.temperature_control.resume()
+            self._cook_clock.start()
+            self._journal_event("resume")
 
     def start_reheat_cycle(self) -> float:
         self._suppress_finished_page = False
+        # a reheat resume already set reheat_seconds to the remaining time
+        self._take_cook_resume("reheat", 5, None)
         try:
             secs = float(self.shared_data.get("reheat_seconds", 0) or 0)
         except (TypeError, ValueError):
@@ -1082,8 +1490,30 @@ class MultiPageController:
         except Exception as e:
             print(f"[MultiPageController] serial_all_zones({power}) failed: {e}")
 
+        self.sequence_manager = None
+        self._journal_begin("reheat", 5, None, secs)
+        self.start_temperature_control(base_power=power)
+
         return secs
-    
+
+    def pause_reheat_cycle(self) -> None:
+        """Remove power from every zone while a reheat is paused."""
+        try:
+            self.serial_all_zones_off()
+        except Exception as e:
+            print(f"[MultiPageController] pause_reheat_cycle failed: {e}")
+
+        self.temperature_control.pause()
+        self._cook_clock.stop()
+        self._journal_event("pause")
+
+    def finish_reheat_cycle(self) -> None:
+        self.stop_temperature_control()
+        try:
+            self.serial_all_zones_off()
+        finally:
+            self._journal_end("complete")
+
     def resume_reheat_cycle(self) -> None:
         """
         Restore the reheat hardware outputs after a pause.
@@ -1106,14 +1536,23 @@ class MultiPageController:
                 f"oven_state.set_running(True) failed: {e}"
             )
 
+        # Re-send the reheat outputs with the current control scales applied
+        self.temperature_control.resume()
+        self._control_last_outputs = None
         try:
-            self.serial_all_zones(power)
+            if self._control_base_power is None:
+                self.serial_all_zones(power)
+            else:
+                self._apply_control_scales(None, None)
         except Exception as e:
             print(
                 "[MultiPageController] "
                 f"resume_reheat_cycle serial output failed: {e}"
             )
 
+        self._cook_clock.start()
+        self._journal_event("resume")
+
     def get(self, key, default=None):
         """Compatibility shim for ProjectA admin pages that treat controller like a dict."""
         try:
@@ -1130,20 +1569,17 @@ class MultiPageController:
         # self.select_meal_page.load_from_rfid(tag_id)
 
     def exit_app(self) -> None:
+        AssetPreloader.Instance().stop()
+        # queued program/settings writes must reach storage before we go
+        self.file_watcher.stop()
+        FileStore.Instance().flush()
         self.root.destroy()
 
     def suspend_rfid(self):
-        try:
-            self.rfid_serial.remove_listener(self.home_page._on_rfid_serial_line)
-        except Exception:
-            pass
-        
+        self.rfid_service.suspend()
 
     def resume_rfid(self):
-        try:
-            self.rfid_serial.add_listener(self.home_page._on_rfid_serial_line)
-        except Exception:
-            pass
+        self.rfid_service.resume()
         
 
 
@@ -1163,3 +1599,4 @@ if __name__ == "__main__":
     controller.show_HomePage()
 
     root.mainloop()
+    FileStore.Instance().flush()
@@ -37,6 +37,11 @@ class PrepareForCookingPage2:
             ),
         ]
 
+    def on_show(self, from_info: bool, meal_index: int | None) -> None:
+        """Reset the pooled page for a visit; hotspots read this state on click."""
+        self.from_info = from_info
+        self.meal_index = meal_index
+
     # ------------------------------------------------------------------
     # Callbacks
     # ------------------------------------------------------------------
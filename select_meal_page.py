@@ -1,5 +1,5 @@
 import os
-from typing import List, Sequence, Dict, Any
+from typing import List, Sequence, Dict, Any, Tuple
 
 from hotspots import Hotspot
 
@@ -15,6 +15,15 @@ class SelectMealPage:
       - overlay_text
 
     ImageHotspotView must render overlay_shapes and overlay_text.
+
+    Overlay items carry ids by screen slot ("slot<row>.<col>.label",
+    "scroll.thumb", ...), so on a scroll the view redraws only the items
+    that actually changed.
+
+    The controller keeps one instance and resets it with on_show() on each
+    visit. The derived layout (hotspots and overlay lists) is memoized per
+    (scroll row, meal labels), so revisiting a state allocates nothing and
+    hands the view the same lists as last time.
     """
 
     IMAGE_NAME = "01SelectMealPage.png"
@@ -36,6 +45,24 @@ class SelectMealPage:
     SCROLL_UP_RECT = (1170, 165, 1250, 240)
     SCROLL_DOWN_RECT = (1170, 566, 1250, 641)
 
+    DEFAULT_MEAL_LABELS = (
+        "Item 1",
+        "Item 2",
+        "Item 3",
+        "Item 4",
+        "Item 5",
+        "Reheat",
+        "Item 7",
+        "Item 8",
+        "Item 9",
+        "Item 10",
+        "Item 11",
+        "Item 12",
+    )
+
+    # Memoized layouts kept per page (oldest dropped first)
+    LAYOUT_CACHE_SIZE = 32
+
     def __init__(
         self,
         controller=None,
@@ -44,28 +71,6 @@ class SelectMealPage:
         meal_labels: Sequence[str] | None = None,
     ):
         self.controller = controller
-        self.from_info = from_info
-        self.meal_index: int = -1
-        self.scroll_row = max(0, int(scroll_row))
-
-        self.meal_labels: List[str] = list(
-            meal_labels
-            if meal_labels is not None
-            else [
-                "Item 1",
-                "Item 2",
-                "Item 3",
-                "Item 4",
-                "Item 5",
-                "Reheat",
-                "Item 7",
-                "Item 8",
-                "Item 9",
-                "Item 10",
-                "Item 11",
-                "Item 12",
-            ]
-        )
 
         here = os.path.dirname(__file__) if "__file__" in globals() else os.getcwd()
         assets_dir = os.path.join(here, "assets")
@@ -76,7 +81,23 @@ class SelectMealPage:
         self.hotspots: List[Hotspot] = []
         self.overlay_shapes: List[Dict[str, Any]] = []
         self.overlay_text: List[Dict[str, Any]] = []
+        self._layouts: Dict[Tuple, Tuple[list, list, list]] = {}
 
+        self.on_show(from_info, scroll_row, meal_labels)
+
+    def on_show(
+        self,
+        from_info: bool,
+        scroll_row: int,
+        meal_labels: Sequence[str] | None,
+    ) -> None:
+        """Reset the page for a visit; meal_labels=None shows the defaults."""
+        self.from_info = from_info
+        self.meal_index: int = -1
+        self.scroll_row = max(0, int(scroll_row))
+        self.meal_labels: List[str] = list(
+            meal_labels if meal_labels is not None else self.DEFAULT_MEAL_LABELS
+        )
         self._rebuild()
 
     @property
@@ -96,6 +117,20 @@ class SelectMealPage:
 
     def _rebuild(self) -> None:
         self._clamp_scroll_row()
+        key = (
+            self.scroll_row,
+            tuple(self.meal_labels),
+            os.path.exists(self.reheat_image_path),
+        )
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout = self._build_layout()
+            self._layouts[key] = layout
+            while len(self._layouts) > self.LAYOUT_CACHE_SIZE:
+                del self._layouts[next(iter(self._layouts))]
+        self.hotspots, self.overlay_shapes, self.overlay_text = layout
+
+    def _build_layout(self) -> Tuple[list, list, list]:
         self.hotspots = []
         self.overlay_shapes = []
         self.overlay_text = []
@@ -111,6 +146,7 @@ class SelectMealPage:
                 continue
 
             visible_row = row - self.scroll_row
+            slot = f"slot{visible_row}.{col}"
 
             x1 = self.TOP_LEFT_X + col * (self.BTN_WIDTH + self.BTN_PADDING_X)
             y1 = self.TOP_LEFT_Y + visible_row * (self.BTN_HEIGHT + self.BTN_PADDING_Y)
@@ -129,6 +165,7 @@ class SelectMealPage:
             # Visible rounded card border
             self.overlay_shapes.append(
                 {
+                    "id": f"{slot}.card",
                     "kind": "rounded_rect",
                     "bbox": (x1, y1, x2, y2),
                     "outline": "#9C6615",
@@ -144,6 +181,7 @@ class SelectMealPage:
             if meal_index != 5:
                 self.overlay_shapes.append(
                     {
+                        "id": f"{slot}.icon",
                         "kind": "ellipse",
                         "bbox": (cx - r, cy - r, cx + r, cy + r),
                         "outline": "#F2F2F2",
@@ -156,6 +194,7 @@ class SelectMealPage:
                 sz = 108
                 self.overlay_shapes.append(
                     {
+                        "id": f"{slot}.icon",
                         "kind": "image",
                         "bbox": (cx - sz, cy - sz, cx + sz, cy + sz),
                         "image_path": self.reheat_image_path,
@@ -164,6 +203,7 @@ class SelectMealPage:
             else:
                 self.overlay_text.append(
                     {
+                        "id": f"{slot}.placeholder",
                         "xy": (cx, cy),
                         "text": "Food Image Here",
                         "fill": "#888888",
@@ -176,6 +216,7 @@ class SelectMealPage:
             # Meal label
             self.overlay_text.append(
                 {
+                    "id": f"{slot}.label",
                     "xy": (x1 + self.BTN_WIDTH // 2, y2 - 24),
                     "text": self.meal_labels[meal_index],
                     "fill": "#F2F2F2",
@@ -197,6 +238,7 @@ class SelectMealPage:
 
             self.overlay_shapes.append(
                 {
+                    "id": "scroll.track",
                     "kind": "rounded_rect",
                     "bbox": self.SCROLL_TRACK_RECT,
                     "outline": "#8A5A12",
@@ -217,6 +259,7 @@ class SelectMealPage:
 
             self.overlay_shapes.append(
                 {
+                    "id": "scroll.thumb",
                     "kind": "rounded_rect",
                     "bbox": (tx1 + 4, thumb_y, tx2 - 4, thumb_y + thumb_h),
                     "outline": "#444444",
@@ -229,6 +272,7 @@ class SelectMealPage:
             # SMALL GOLD CHEVRON UP
             self.overlay_shapes.append(
                 {
+                    "id": "scroll.up",
                     "kind": "triangle_up",
                     "bbox": self.SCROLL_UP_RECT,
                     "outline": "#8A5A12",
@@ -241,6 +285,7 @@ class SelectMealPage:
             # SMALL GOLD CHEVRON DOWN
             self.overlay_shapes.append(
                 {
+                    "id": "scroll.down",
                     "kind": "triangle_down",
                     "bbox": self.SCROLL_DOWN_RECT,
                     "outline": "#8A5A12",
@@ -264,6 +309,8 @@ class SelectMealPage:
                     )
                 )
 
+        return self.hotspots, self.overlay_shapes, self.overlay_text
+
     def _show_self_again(self) -> None:
         if self.controller:
             self.controller.show_SelectMealPage(
@@ -1,12 +1,11 @@
-import json
 import os
 from typing import List
 from DoorSafety import DoorSafety
 from hotspots import Hotspot
-from hmi_consts import ASSETS_DIR, PROGRAMS_DIR
-from SelectProgramPage import (
-    load_program_into_sequence_collection,
-)
+from hmi_consts import ASSETS_DIR
+from ProgramRepository import ProgramRepository
+from ProgramCatalog import format_total_time
+from AssetPreloader import MEAL_PHOTO_SIZE
 
 
 class StartCookingConfirmation:
@@ -168,22 +167,10 @@ class StartCookingConfirmation:
                 meal_index_offset = 0
 
             program_number = self.meal_index + meal_index_offset
-            path = str(PROGRAMS_DIR / f"program{program_number}.alt")
-
-            try:
-                with open(path, "r") as f:
-                    data = json.load(f)
-                total_time = data.get("total_time", "0:00") or "0:00"
-            except Exception as e:
-                print(f"[StartCookingConfirmation] Failed to read {path}: {e}")
-                total_time = "0:00"
-
-            # Convert "MM:SS" → total seconds
-            try:
-                minutes, seconds = map(int, str(total_time).split(":"))
-                total_seconds = minutes * 60 + seconds
-            except Exception:
-                total_seconds = 0
+            program = ProgramRepository.Instance().get(program_number)
+            if program is None:
+                print(f"[StartCookingConfirmation] Failed to read program{program_number}")
+            total_seconds = int(program.total_seconds) if program else 0
 
             if total_seconds == 0:
                 print(
@@ -229,15 +216,11 @@ class StartCookingConfirmation:
             f"meal_index={meal_index}, program_number={program_number}"
         )
 
-        load_program_into_sequence_collection(program_number)
-
-        path = str(PROGRAMS_DIR / f"program{program_number}.alt")
-        with open(path, "r") as f:
-            data = json.load(f)
-        total_time = data.get("total_time", "0:00")
+        program = ProgramRepository.Instance().get(program_number)
+        total_time = format_total_time(program.total_seconds) if program else "0:00"
 
         self.controller.view.set_overlay_image(
-            image_path, name, total_time, size=(270, 200)
+            image_path, name, total_time, size=MEAL_PHOTO_SIZE
         )
 
         if meal_index == 5:
@@ -0,0 +1,65 @@
+import pytest
+
+pytest.importorskip("customtkinter")
+
+from multipage_controller import MultiPageController  # noqa: E402
+
+
+class FakeManager:
+    def __init__(self):
+        self.scales = []
+        self.stopped = False
+
+    def set_scales(self, global_scale=None, zone_scales=None):
+        self.scales.append((global_scale, zone_scales))
+
+    def stop_all(self):
+        self.stopped = True
+
+
+def make_controller():
+    # Only the state the sequence-manager paths touch; no Tk, no serial
+    ctrl = MultiPageController.__new__(MultiPageController)
+    ctrl.shared_data = {"sequence_manager": None}
+    ctrl._control_base_power = None
+    return ctrl
+
+
+def test_admin_cook_after_customer_cook_gets_control_scales():
+    ctrl = make_controller()
+
+    customer = FakeManager()
+    ctrl.sequence_manager = customer  # start_meal_program
+    ctrl.release_sequence_manager(customer)  # _on_all_zones_complete
+
+    admin = FakeManager()
+    ctrl.shared_data["sequence_manager"] = admin  # SequenceProgramPage run
+
+    ctrl._apply_control_scales(0.5, {3: 0.8})
+
+    assert admin.scales == [(0.5, {3: 0.8})]
+    assert customer.scales == []
+    assert ctrl.sequence_manager is admin
+
+
+def test_admin_cook_after_customer_cook_without_completion():
+    # even if the customer cook never reported completion, the admin run
+    # replaces it in the one slot both paths use
+    ctrl = make_controller()
+    customer = FakeManager()
+    ctrl.sequence_manager = customer
+
+    admin = FakeManager()
+    ctrl.shared_data["sequence_manager"] = admin
+    ctrl._apply_control_scales(0.7, None)
+
+    assert admin.scales == [(0.7, None)]
+    assert customer.scales == []
+
+
+def test_release_keeps_a_newer_manager():
+    ctrl = make_controller()
+    old, new = FakeManager(), FakeManager()
+    ctrl.sequence_manager = new
+    ctrl.release_sequence_manager(old)
+    assert ctrl.sequence_manager is new
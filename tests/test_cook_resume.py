@@ -0,0 +1,129 @@
+import pytest
+
+from cooking_page import CookingPage
+
+
+class FakeRing:
+    def __init__(self):
+        self.updates = []
+
+    def update_progress(self, remaining, total):
+        self.updates.append((remaining, total))
+
+
+class FakeView:
+    def __init__(self):
+        self.circular_progress = FakeRing()
+
+    def show_circular_progress(self):
+        pass
+
+    def hide_circular_progress(self):
+        pass
+
+    def after(self, _ms, _fn):
+        return "after#1"
+
+    def after_cancel(self, _after_id):
+        pass
+
+    def after_idle(self, _fn):
+        pass  # no auto-start in the test
+
+
+class FakeController:
+    def __init__(self, resume=None, start_remaining=0.0):
+        self.view = FakeView()
+        self.shared_data = {"reheat_seconds": 0}
+        self.resume = resume
+        self.start_remaining = start_remaining
+        self.discarded = 0
+
+    def pending_cook_resume(self, meal_index):
+        if self.resume and self.resume["meal_index"] == meal_index:
+            return dict(self.resume)
+        return None
+
+    def discard_cook_resume(self):
+        self.discarded += 1
+        self.resume = None
+
+    def start_meal_program(self, meal_index):
+        return self.start_remaining
+
+    def stop_current_cook(self):
+        pass
+
+    def show_PrepareForCookingPage2(self, **_kwargs):
+        pass
+
+
+def resume_for(meal_index, total=600.0, elapsed=200.0):
+    return {
+        "kind": "program",
+        "meal_index": meal_index,
+        "program": meal_index + 31,
+        "total": total,
+        "elapsed": elapsed,
+        "scales": None,
+    }
+
+
+def test_ring_shows_time_left_of_resumed_cook():
+    ctrl = FakeController(resume_for(2), start_remaining=400.0)
+    page = CookingPage(ctrl)
+
+    page.on_show(2)
+    assert ctrl.view.circular_progress.updates[-1] == (400.0, 600.0)
+
+    page.on_stop_clicked()  # start
+    remaining, total = ctrl.view.circular_progress.updates[-1]
+    assert total == 600.0
+    assert remaining == pytest.approx(400.0, abs=0.5)
+
+
+def test_back_discards_pending_resume():
+    ctrl = FakeController(resume_for(2))
+    page = CookingPage(ctrl)
+    page.on_show(2)
+
+    page.on_back_clicked()
+
+    assert ctrl.discarded == 1
+    assert ctrl.pending_cook_resume(2) is None
+
+
+def test_resume_for_other_meal_is_not_shown():
+    ctrl = FakeController(resume_for(2))
+    page = CookingPage(ctrl)
+    page.on_show(3)
+    assert page._remaining_time == page._total_time
+
+
+# ---- controller side: the resume is one-shot and tied to its program ----
+def make_controller(resume):
+    mpc = pytest.importorskip("multipage_controller")
+    ctrl = mpc.MultiPageController.__new__(mpc.MultiPageController)
+    ctrl._pending_resume = resume
+    return ctrl
+
+
+def test_resume_applies_only_to_its_own_program():
+    ctrl = make_controller(resume_for(2))
+    assert ctrl._take_cook_resume("program", 4, 35) is None
+    # any start consumes it: the right meal later starts from the beginning
+    assert ctrl._take_cook_resume("program", 2, 33) is None
+
+
+def test_resume_is_taken_once_by_its_program():
+    ctrl = make_controller(resume_for(2))
+    assert ctrl.pending_cook_resume(3) is None
+    assert ctrl.pending_cook_resume(2)["elapsed"] == 200.0
+    assert ctrl._take_cook_resume("program", 2, 33)["elapsed"] == 200.0
+    assert ctrl._take_cook_resume("program", 2, 33) is None
+
+
+def test_reheat_start_clears_program_resume():
+    ctrl = make_controller(resume_for(2))
+    assert ctrl._take_cook_resume("reheat", 5, None) is None
+    assert ctrl.pending_cook_resume(2) is None
@@ -0,0 +1,38 @@
+import json
+
+from FileStore import CHECKSUM_KEY, atomic_write_json, read_json
+
+
+def _rewrite(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def test_external_edit_with_stale_checksum_is_used(tmp_path):
+    path = str(tmp_path / "settings.alt")
+    atomic_write_json(path, {"tset": 200}, checksum=True)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["tset"] = 230
+    _rewrite(path, data)
+
+    assert read_json(path) == {"tset": 230}
+
+
+def test_external_edit_without_checksum_is_used(tmp_path):
+    path = str(tmp_path / "settings.alt")
+    atomic_write_json(path, {"tset": 200}, checksum=True)
+    _rewrite(path, {"tset": 240})
+
+    assert read_json(path) == {"tset": 240}
+
+
+def test_unparseable_file_falls_back_to_bak(tmp_path):
+    path = str(tmp_path / "settings.alt")
+    atomic_write_json(path, {"tset": 200}, checksum=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"tset": 2')
+
+    data = read_json(path)
+    assert data == {"tset": 200}
+    assert CHECKSUM_KEY not in data
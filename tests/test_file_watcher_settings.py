@@ -0,0 +1,133 @@
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+import pytest
+
+import FileWatcher as file_watcher
+import Settings as settings_module
+from FileStore import FileStore
+from FileWatcher import FileChange, FileWatcher
+from Settings import Settings
+from SingletonBase import SingletonBase
+
+
+@pytest.fixture
+def settings_dir(tmp_path, monkeypatch):
+    programs = tmp_path / "programs"
+    settings = tmp_path / "settings"
+    programs.mkdir()
+    settings.mkdir()
+    monkeypatch.setattr(settings_module, "SETTINGS_DIR", str(settings))
+    monkeypatch.setattr(file_watcher, "SETTINGS_DIR", str(settings))
+    monkeypatch.setattr(file_watcher, "PROGRAMS_DIR", str(programs))
+    monkeypatch.setattr(Settings, "_instance", None)
+    monkeypatch.delitem(SingletonBase._instances, FileWatcher, raising=False)
+    yield settings
+    FileWatcher.Instance().stop()
+    SingletonBase._instances.pop(FileWatcher, None)
+
+
+class FakeTkRoot:
+    """after(0, ...) queues work for the main thread, like Tk does."""
+
+    def __init__(self):
+        self.calls = queue.Queue()
+
+    def after(self, _ms, fn, *args):
+        self.calls.put((fn, args))
+
+    def pump(self, until, timeout=2.0):
+        end = time.monotonic() + timeout
+        while not until() and time.monotonic() < end:
+            try:
+                fn, args = self.calls.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            fn(*args)
+        return until()
+
+
+def _saved_by_hmi(settings_dir, tset):
+    s = Settings.Instance()
+    s.update(tset=tset)
+    assert FileStore.Instance().flush()
+    return settings_dir / "settings.alt"
+
+
+def _edit_externally(path, **fields):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)  # keeps the HMI's now stale "_checksum"
+    data.update(fields)
+    tmp = str(path) + ".usb"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    # copy tools usually write next to the file and rename over it
+    os.replace(tmp, path)
+
+
+def test_apply_settings_change_loads_external_edit(settings_dir):
+    path = _saved_by_hmi(settings_dir, 200.0)
+    seen = []
+    Settings.Instance().add_listener(seen.append)
+
+    _edit_externally(path, tset=230, use_sound=False)
+    FileWatcher.Instance()._apply(FileChange("settings", str(path)))
+
+    s = Settings.Instance()
+    assert s.tset == 230.0
+    assert s.use_sound is False
+    assert seen == [{"tset": 230.0, "use_sound": False}]
+
+
+def test_apply_reloads_settings_on_the_ui_thread(settings_dir):
+    path = _saved_by_hmi(settings_dir, 200.0)
+    root = FakeTkRoot()
+    watcher = FileWatcher.Instance()
+    watcher.tk_root = root
+    threads = []
+    Settings.Instance().add_listener(
+        lambda fields: threads.append(threading.current_thread())
+    )
+
+    _edit_externally(path, tset=230)
+    worker = threading.Thread(
+        target=watcher._apply, args=(FileChange("settings", str(path)),)
+    )
+    worker.start()
+    worker.join()
+
+    assert Settings.Instance().tset == 200.0  # nothing applied off the UI thread
+    assert root.pump(lambda: threads)
+    assert threads == [threading.main_thread()]
+    assert Settings.Instance().tset == 230.0
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+def test_watcher_picks_up_external_settings_rewrite(settings_dir):
+    path = _saved_by_hmi(settings_dir, 200.0)
+    root = FakeTkRoot()
+    settings_threads, change_threads = [], []
+    Settings.Instance().add_listener(
+        lambda fields: settings_threads.append(
+            (fields.get("tset"), threading.current_thread())
+        )
+    )
+    watcher = FileWatcher.Instance()
+    watcher.add_listener(
+        lambda change: change_threads.append(
+            (Settings.Instance().tset, threading.current_thread())
+        )
+    )
+    assert watcher.start(tk_root=root)
+
+    _edit_externally(path, tset=245)
+
+    assert root.pump(lambda: change_threads)
+    main = threading.main_thread()
+    assert settings_threads == [(245.0, main)]
+    # FileChange listeners run after the reload, also on the UI thread
+    assert change_threads == [(245.0, main)]
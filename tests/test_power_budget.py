@@ -0,0 +1,130 @@
+import threading
+import time
+
+from PowerBudgetScheduler import PowerBudgetScheduler
+
+STAGGER_MS = 20
+
+
+class FakeLine:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sent = []
+        self.fail_next = 0
+
+    def send(self, outputs):
+        with self.lock:
+            if self.fail_next:
+                self.fail_next -= 1
+                raise OSError("write failed")
+            self.sent.append(dict(outputs))
+
+    def last(self):
+        with self.lock:
+            merged = {}
+            for outputs in self.sent:
+                merged.update(outputs)
+            return merged
+
+
+def _scheduler(line, max_total_power=800, max_rise=800):
+    return PowerBudgetScheduler(
+        line.send,
+        max_total_power=max_total_power,
+        max_rise=max_rise,
+        stagger_ms=STAGGER_MS,
+    )
+
+
+def _wait_for(predicate, timeout=1.0):
+    end = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < end:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_total_power_cap_queues_rises_until_others_drop():
+    line = FakeLine()
+    pb = _scheduler(line, max_total_power=250)
+
+    pb.request({1: 100, 2: 100, 3: 100})
+    assert line.sent == [{1: 100, 2: 100, 3: 50}]
+    assert pb.total_power() == 250
+    assert pb.pending_zones() == [3]
+
+    # the freed power goes to zone 3 in the same write
+    pb.request({1: 0})
+    assert line.sent[-1] == {1: 0, 3: 100}
+    assert pb.total_power() == 200
+    assert pb.pending_zones() == []
+
+
+def test_rise_is_spread_over_stagger_windows():
+    line = FakeLine()
+    pb = _scheduler(line, max_rise=100)
+
+    pb.request({1: 100, 2: 100, 3: 50})
+    assert line.sent == [{1: 100}]
+
+    assert _wait_for(lambda: line.last() == {1: 100, 2: 100, 3: 50})
+    assert line.sent[1:] == [{2: 100}, {3: 50}]
+    assert all(sum(outputs.values()) <= 100 for outputs in line.sent)
+
+
+def test_drop_cancels_queued_rise():
+    line = FakeLine()
+    pb = _scheduler(line, max_rise=100)
+
+    pb.request({1: 100, 2: 80})
+    assert pb.pending_zones() == [2]
+    pb.request({2: 0})
+    assert pb.pending_zones() == []
+
+    time.sleep(5 * STAGGER_MS / 1000.0)
+    assert line.last() == {1: 100, 2: 0}
+    assert all(outputs.get(2, 0) == 0 for outputs in line.sent)
+
+
+def test_all_off_forgets_outputs_and_queued_rises():
+    line = FakeLine()
+    pb = _scheduler(line, max_rise=100)
+    pb.request({1: 100, 2: 100})
+
+    pb.all_off()
+    assert pb.total_power() == 0
+    assert pb.pending_zones() == []
+
+    time.sleep(3 * STAGGER_MS / 1000.0)
+    assert line.sent == [{1: 100}]
+    # not mistaken for a repeat of the old level
+    pb.request({1: 100})
+    assert line.sent[-1] == {1: 100}
+
+
+def test_failed_rise_is_not_counted_and_is_retried():
+    line = FakeLine()
+    pb = _scheduler(line)
+
+    line.fail_next = 1
+    pb.request({1: 60})
+    assert line.sent == []
+    assert pb.total_power() == 0
+
+    assert _wait_for(lambda: line.sent == [{1: 60}])
+    assert pb.total_power() == 60
+    assert pb.pending_zones() == []
+
+
+def test_failed_drop_is_resent_by_the_next_request():
+    line = FakeLine()
+    pb = _scheduler(line, max_total_power=100)
+    pb.request({1: 100})
+
+    line.fail_next = 1
+    pb.request({1: 0, 2: 100})
+    assert pb.total_power() == 100  # zone 1 may still be on
+    assert pb.pending_zones() == [2]
+
+    pb.request({1: 0})
+    assert line.sent[-1] == {1: 0, 2: 100}
+    assert pb.total_power() == 100
@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from ProgramBatchDecoder import decode_programs_batch
+from SequenceStructure import ENCODED_PROGRAM_DATA_LENGTH, decode_program_to_dict
+
+
+def _payload(bad_index, bad_character):
+    data = list("!" * ENCODED_PROGRAM_DATA_LENGTH)
+    data[bad_index] = bad_character
+    return "Bread," + "".join(data)
+
+
+@pytest.mark.parametrize("bad_character", [" ", "\x7f", "é"])
+def test_bad_character_message_matches_single_decoder(bad_character):
+    payload = _payload(7, bad_character)
+    with pytest.raises(ValueError) as single:
+        decode_program_to_dict(payload)
+
+    result = decode_programs_batch(["Ok," + "!" * ENCODED_PROGRAM_DATA_LENGTH, payload])
+
+    assert list(result.valid) == [True, False]
+    assert result.errors[1] == str(single.value)
+    assert repr(bad_character) in result.errors[1]
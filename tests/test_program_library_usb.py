@@ -0,0 +1,18 @@
+import pytest
+
+
+def test_usb_library_path(tmp_path, monkeypatch):
+    page = pytest.importorskip("SelectProgramPage")
+    empty, stick = tmp_path / "empty", tmp_path / "stick"
+    empty.mkdir()
+    stick.mkdir()
+    monkeypatch.setattr(page, "list_usb_drives", lambda: [str(empty), str(stick)])
+
+    # export goes to the first drive; import finds the drive with a library
+    assert page._usb_library_path(existing=False) == str(empty / "programs.altb")
+    assert page._usb_library_path(existing=True) is None
+    (stick / "programs.json").write_text("{}")
+    assert page._usb_library_path(existing=True) == str(stick / "programs.json")
+
+    monkeypatch.setattr(page, "list_usb_drives", lambda: [])
+    assert page._usb_library_path(existing=False) is None
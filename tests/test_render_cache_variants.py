@@ -0,0 +1,64 @@
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from AssetDiskCache import AssetDiskCache  # noqa: E402
+from FileStore import FileStore  # noqa: E402
+from RenderCache import RenderCache  # noqa: E402
+from SingletonBase import SingletonBase  # noqa: E402
+from hmi_consts import HMISizePos  # noqa: E402
+
+
+@pytest.fixture
+def caches(tmp_path, monkeypatch):
+    def fresh():
+        # a new boot: empty memory caches, same disk cache
+        SingletonBase._instances.pop(RenderCache, None)
+        SingletonBase._instances.pop(AssetDiskCache, None)
+        AssetDiskCache.Instance(root=str(tmp_path / "cache"))
+        return RenderCache.Instance()
+
+    monkeypatch.setattr(HMISizePos, "SCREEN_RES", "800x480")
+    yield fresh
+    SingletonBase._instances.pop(RenderCache, None)
+    SingletonBase._instances.pop(AssetDiskCache, None)
+
+
+@pytest.fixture
+def asset(tmp_path):
+    path = str(tmp_path / "icon.png")
+    Image.new("RGBA", (128, 80), (200, 30, 30, 255)).save(path)
+    return path
+
+
+def _forbid_resize(monkeypatch):
+    def resize(*_args, **_kwargs):
+        raise AssertionError("resized at runtime")
+
+    monkeypatch.setattr(Image.Image, "resize", resize)
+
+
+def test_active_profile_variant_is_built_once_then_mapped(
+    caches, asset, monkeypatch, capsys
+):
+    img = caches().base_image(asset)
+    assert img.size == (80, 48)  # 1280x800 design -> 800x480
+    assert "resizing" in capsys.readouterr().out  # cache miss is logged
+    assert FileStore.Instance().flush()
+
+    _forbid_resize(monkeypatch)
+    again = caches().base_image(asset)
+    assert again.size == (80, 48)
+    assert again.tobytes() == img.tobytes()
+
+
+def test_fixed_size_variant_comes_from_the_disk_cache(caches, asset, monkeypatch):
+    first = caches().base_image(asset, size=(48, 48))
+    assert first.size == (30, 29)  # 48x48 design px at 800x480
+    assert FileStore.Instance().flush()
+
+    _forbid_resize(monkeypatch)
+    cache = caches()
+    assert cache.base_image(asset, size=(48, 48)).size == (30, 29)
+    assert cache.has_base_image(asset, size=(48, 48))
+    assert not cache.has_base_image(asset)
@@ -0,0 +1,102 @@
+import RfidService as rfid_module
+from RfidService import RfidService
+
+
+class _Serial:
+    def __init__(self):
+        self.sent = []
+        self.listener = None
+
+    def add_listener(self, fn):
+        self.listener = fn
+
+    def send(self, text):
+        self.sent.append(text)
+
+    def line(self, text):
+        self.listener(text)
+
+
+class _Root:
+    """tk after() stand-in; timers only fire when the test says so."""
+
+    def __init__(self):
+        self._timers = {}
+        self._next = 0
+
+    def after(self, delay_ms, fn, *args):
+        self._next += 1
+        self._timers[self._next] = (fn, args)
+        return self._next
+
+    def after_cancel(self, timer_id):
+        self._timers.pop(timer_id, None)
+
+    def fire(self):
+        timers, self._timers = self._timers, {}
+        for fn, args in timers.values():
+            fn(*args)
+
+
+class _Cache:
+    @classmethod
+    def Instance(cls):
+        return cls()
+
+    def get(self, payload):
+        return f"program:{payload}"
+
+
+def _service(monkeypatch):
+    monkeypatch.setattr(rfid_module, "RfidProgramCache", _Cache)
+    serial, root = _Serial(), _Root()
+    service = RfidService(serial, root)
+    reads = []
+    service.add_listener(reads.append)
+    return service, serial, root, reads
+
+
+def test_late_reply_from_previous_tag_is_dropped_during_new_read(monkeypatch):
+    service, serial, root, reads = _service(monkeypatch)
+
+    serial.line("N=1")  # tag A
+    root.fire()  # "D" for read #1 goes out
+    serial.line("N=0")  # A removed before it answered
+    serial.line("N=1")  # tag B
+
+    serial.line("D=AAAA")  # late answer to #1, before #2 sent its "D"
+    assert reads == []
+
+    root.fire()  # "D" for read #2
+    serial.line("D=BBBB")
+    assert [r.payload for r in reads] == ["BBBB"]
+    assert reads[0].read_id == 2
+    assert service.stale_rejected == 1
+    assert serial.sent == ["D\r", "D\r"]
+
+
+def test_late_reply_after_new_command_is_matched_to_its_read(monkeypatch):
+    service, serial, root, reads = _service(monkeypatch)
+
+    serial.line("N=1")
+    root.fire()  # read #1 "D"
+    serial.line("N=0")
+    serial.line("N=1")
+    root.fire()  # read #2 "D", while #1's answer is still on the way
+
+    serial.line("D=AAAA")  # answers #1's command
+    assert reads == []
+    serial.line("D=BBBB")
+    assert [(r.read_id, r.payload) for r in reads] == [(2, "BBBB")]
+
+
+def test_reply_without_outstanding_command_is_stale(monkeypatch):
+    service, serial, root, reads = _service(monkeypatch)
+
+    serial.line("N=1")  # read in flight, "D" not sent yet
+    serial.line("D=AAAA")
+    assert reads == [] and service.stale_rejected == 1
+
+    root.fire()
+    serial.line("D=BBBB")
+    assert [r.payload for r in reads] == ["BBBB"]
@@ -0,0 +1,64 @@
+import threading
+import time
+
+import CookingSequenceRunner as runner_module
+from CookingSequenceRunner import CookingSequenceManager
+
+
+class _Line:
+    """Fake serial line: records sends and notices overlapping ones."""
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        self.busy = False
+        self.overlaps = 0
+        self.last = {}
+
+    def _send(self, outputs):
+        with self._guard:
+            if self.busy:
+                self.overlaps += 1
+            self.busy = True
+        time.sleep(0.0005)  # a Zxx= write takes a while on the wire
+        with self._guard:
+            self.last.update(outputs)
+            self.busy = False
+
+    def zone(self, name, value, duration):
+        self._send({name: value})
+
+    def zones(self, outputs):
+        self._send(outputs)
+
+
+def test_runner_ticks_do_not_interleave_with_scale_batches(monkeypatch):
+    monkeypatch.setattr(runner_module, "TICK_S", 0.002)
+    line = _Line()
+    mgr = CookingSequenceManager()
+    # ramps change the output on every tick, so ticks keep sending
+    for name in ("Zone1", "Zone2", "Zone3"):
+        mgr.add_dac(name, [(1.5, 0), (3.0, 100, True)], line.zone)
+    mgr.set_batch_callback(line.zones)
+    mgr.start_all(offset_s=1.5)
+
+    deadline = time.time() + 0.6
+    i = 0
+    while time.time() < deadline:
+        i += 1
+        mgr.set_scales(
+            global_scale=0.5 + 0.5 * (i % 2),
+            zone_scales={1: (i % 10) / 10.0, "Zone2": 1.0 - (i % 7) / 10.0},
+        )
+        time.sleep(0.001)
+
+    with mgr._lock:
+        for name, r in mgr.runners.items():
+            assert line.last[name] == r._last_sent_scaled
+
+    mgr.stop_all()
+    for r in mgr.runners.values():
+        r.join(timeout=1.0)
+
+    assert line.overlaps == 0
+    # the reset to 0 is the last thing each zone receives
+    assert line.last == {"Zone1": 0, "Zone2": 0, "Zone3": 0}
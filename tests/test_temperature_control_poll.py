@@ -0,0 +1,105 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import oven_state
+from SingletonBase import SingletonBase
+from Telemetry import TelemetryMirror
+from TemperatureControl import TemperatureController
+
+# what the oven controller answers to each poll request
+REPLIES = {"R": "R=1000,1000", "T1": "T1=250.0", "T2": "T2=250.0"}
+
+
+class FakeOvenSerial:
+    """Answers R / Tn requests the way the oven controller does."""
+
+    def __init__(self):
+        self.sent = []
+        self.listeners = []
+
+    def add_listener(self, fn):
+        self.listeners.append(fn)
+
+    def send(self, cmd):
+        self.sent.append(cmd)
+        reply = REPLIES.get(cmd)
+        if reply is not None:
+            for fn in self.listeners:
+                fn(reply)
+
+
+def _settings():
+    return SimpleNamespace(
+        enable_array_temp_control=True,
+        enable_cook_algorithm=True,
+        cookpack_control_strategy="hysteresis",
+        alarm_level=1500,
+        alarm_hysteresis=400,
+        over_temp_power=0.75,
+        tset=200.0,
+        thys=5.0,
+        top_zones_correction_factor=60,
+        bottom_zones_correction_factor=40,
+        tc=240,
+    )
+
+
+@pytest.fixture
+def serial(monkeypatch):
+    monkeypatch.delitem(SingletonBase._instances, TelemetryMirror, raising=False)
+    serial = FakeOvenSerial()
+    serial.add_listener(TelemetryMirror.Instance().update_from_line)
+    oven_state.set_running(True)
+    yield serial
+    oven_state.set_running(False)
+    SingletonBase._instances.pop(TelemetryMirror, None)
+
+
+def _run_cook(poll_fn, wait_s):
+    applied = []
+    done = threading.Event()
+
+    def apply(global_scale, zone_scales):
+        applied.append((global_scale, zone_scales))
+        done.set()
+
+    ctl = TemperatureController(
+        apply, interval_s=0.02, poll_fn=poll_fn, poll_interval_s=0.02
+    )
+    try:
+        ctl.start_cook(_settings())
+        done.wait(wait_s)
+    finally:
+        ctl._timer.stop()
+    return applied
+
+
+def test_controller_polls_telemetry_and_applies_scales(serial):
+    def poll():
+        serial.send("R")
+        for sensor in range(1, 5):
+            serial.send(f"T{sensor}")
+
+    applied = _run_cook(poll, wait_s=2.0)
+
+    assert "R" in serial.sent and "T1" in serial.sent
+    global_scale, zone_scales = applied[0]
+    assert global_scale == 0.75  # R below alarm_level
+    assert zone_scales[1] == 0.4 and zone_scales[5] == 0.6  # T0 above TSET
+
+
+def test_without_a_poll_the_strategies_see_no_data(serial):
+    assert _run_cook(None, wait_s=0.2) == []
+    assert serial.sent == []
+
+
+def test_controller_poll_requests_thermistors_and_ir_temps():
+    mpc = pytest.importorskip("multipage_controller")
+    ctrl = mpc.MultiPageController.__new__(mpc.MultiPageController)
+    ctrl.oven_ctrl_serial = FakeOvenSerial()
+
+    ctrl.serial_poll_telemetry()
+
+    assert ctrl.oven_ctrl_serial.sent == ["R", "T1", "T2", "T3", "T4"]
@@ -11,7 +11,7 @@ import psutil
 import os
 import re
 from hmi_logger import setup_logging, get_log_file
-from hmi_consts import SETTINGS_DIR
+from Settings import Settings
 
 logger = logging.getLogger("utilities")
 
@@ -304,21 +304,11 @@ def save_log_file() -> tuple[bool, str]:
 
 
 def load_use_sound_from_settings(default: bool = True) -> bool:
-    path = os.path.join(SETTINGS_DIR, "settings.alt")
+    """use_sound from the in-memory Settings (no file I/O)."""
     try:
-        if os.path.exists(path):
-            with open(path, "r") as f:
-                data = json.load(f)
-            v = data.get("use_sound", default)
-            if isinstance(v, bool):
-                return v
-            if isinstance(v, (int, float)):
-                return bool(v)
-            if isinstance(v, str):
-                return v.strip().lower() in ("1", "true", "yes", "y", "on")
+        return bool(Settings.Instance().use_sound)
     except Exception:
-        pass
-    return default
+        return default
 
 
 if __name__ == "__main__":